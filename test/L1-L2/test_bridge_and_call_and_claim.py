@@ -13,15 +13,15 @@ import sys
 import os
 import time
 import json
+import shlex
 import subprocess
 
 # Add the lib directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 
 from bridge_lib import BRIDGE_CONFIG, BridgeLogger, BridgeEnvironment, BridgeUtils
-from aggsandbox_api import AggsandboxAPI, BridgeClaimArgs
+from aggsandbox_api import AggsandboxAPI, BridgeClaimArgs, json_loads, find_tx_hash
 from bridge_and_call import BridgeAndCall
-from claim_bridge_and_call import ClaimBridgeAndCall
 
 def deploy_asset_and_call_receiver_contract() -> str:
     """Deploy SimpleBridgeAndCallReceiver contract on L2 or use existing one"""
@@ -44,7 +44,8 @@ def deploy_asset_and_call_receiver_contract() -> str:
             "--broadcast"
         ]
         
-        BridgeLogger.debug(f"Executing: {' '.join(cmd)}")
+        if BridgeLogger.debug_enabled:
+            BridgeLogger.debug("Executing: %s", shlex.join(cmd))
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         
         # Extract contract address from output
@@ -62,7 +63,7 @@ def deploy_asset_and_call_receiver_contract() -> str:
             return contract_address
         else:
             BridgeLogger.error("Could not extract contract address from deployment output")
-            BridgeLogger.debug(f"Full output: {output}")
+            BridgeLogger.debug("Full output: %s", output)
             return None
             
     except subprocess.CalledProcessError as e:
@@ -76,7 +77,7 @@ def encode_call_data(function_signature: str, *args) -> str:
         cmd = ["cast", "calldata", function_signature] + list(str(arg) for arg in args)
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         call_data = result.stdout.strip()
-        BridgeLogger.debug(f"Encoded call data: {call_data}")
+        BridgeLogger.debug("Encoded call data: %s", call_data)
         return call_data
     except subprocess.CalledProcessError as e:
         BridgeLogger.error(f"Failed to encode call data: {e}")
@@ -180,22 +181,12 @@ def run_l1_to_l2_bridge_and_call_test(bridge_amount: int = 10):
             return False
         
         # Extract bridge transaction hash from output
-        bridge_tx_hash = None
-        lines = output.split('\n')
-        for line in lines:
-            if ('bridge and call transaction submitted' in line.lower() or 
-                'bridge transaction submitted' in line.lower()) and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        bridge_tx_hash = word
-                        break
-                if bridge_tx_hash:
-                    break
+        bridge_tx_hash = (find_tx_hash(output, 'bridge and call transaction submitted')
+                          or find_tx_hash(output, 'bridge transaction submitted'))
         
         if not bridge_tx_hash:
             BridgeLogger.error("Could not extract bridge transaction hash from output")
-            BridgeLogger.debug(f"Bridge output: {output}")
+            BridgeLogger.debug("Bridge output: %s", output)
             return False
         
         BridgeLogger.success(f"✅ Bridge-and-call transaction submitted: {bridge_tx_hash}")
@@ -213,7 +204,7 @@ def run_l1_to_l2_bridge_and_call_test(bridge_amount: int = 10):
         message_bridge = None
         
         for attempt in range(6):
-            BridgeLogger.debug(f"Attempt {attempt + 1}/6 to find bridges...")
+            BridgeLogger.debug("Attempt %s/6 to find bridges...", attempt + 1)
             time.sleep(3)
             
             success, output = AggsandboxAPI.show_bridges(
@@ -223,7 +214,7 @@ def run_l1_to_l2_bridge_and_call_test(bridge_amount: int = 10):
             
             if success:
                 try:
-                    bridge_data = json.loads(output)
+                    bridge_data = json_loads(output)
                     bridges = bridge_data.get('bridges', [])
                     
                     # Look for our bridge transactions (both asset and message)
@@ -240,7 +231,7 @@ def run_l1_to_l2_bridge_and_call_test(bridge_amount: int = 10):
                                 message_bridge = bridge
                                 BridgeLogger.success(f"✅ Found message bridge (deposit_count = {bridge['deposit_count']}, has calldata)")
                             else:
-                                BridgeLogger.debug(f"Found bridge but couldn't classify: leaf_type={bridge.get('leaf_type')}, amount={bridge.get('amount')}")
+                                BridgeLogger.debug("Found bridge but couldn't classify: leaf_type=%s, amount=%s", bridge.get('leaf_type'), bridge.get('amount'))
                     
                     if asset_bridge and message_bridge:
                         break
@@ -299,17 +290,7 @@ def run_l1_to_l2_bridge_and_call_test(bridge_amount: int = 10):
             BridgeLogger.error(f"❌ Asset claim operation failed: {output}")
             return False
         
-        asset_claim_tx_hash = None
-        lines = output.split('\n')
-        for line in lines:
-            if '✅ claim transaction submitted:' in line.lower() and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        asset_claim_tx_hash = word
-                        break
-                if asset_claim_tx_hash:
-                    break
+        asset_claim_tx_hash = find_tx_hash(output, '✅ claim transaction submitted:')
         
         if asset_claim_tx_hash:
             BridgeLogger.success(f"✅ Asset claim transaction submitted: {asset_claim_tx_hash}")
@@ -344,17 +325,7 @@ def run_l1_to_l2_bridge_and_call_test(bridge_amount: int = 10):
             BridgeLogger.error(f"❌ Message claim operation failed: {output}")
             return False
         
-        message_claim_tx_hash = None
-        lines = output.split('\n')
-        for line in lines:
-            if '✅ claim transaction submitted:' in line.lower() and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        message_claim_tx_hash = word
-                        break
-                if message_claim_tx_hash:
-                    break
+        message_claim_tx_hash = find_tx_hash(output, '✅ claim transaction submitted:')
         
         if message_claim_tx_hash:
             BridgeLogger.success(f"✅ Message claim transaction submitted: {message_claim_tx_hash}")
@@ -398,7 +369,7 @@ def run_l1_to_l2_bridge_and_call_test(bridge_amount: int = 10):
         
         if success:
             try:
-                claims_data = json.loads(output)
+                claims_data = json_loads(output)
                 claims = claims_data.get('claims', [])
                 total_claims = len(claims)
                 
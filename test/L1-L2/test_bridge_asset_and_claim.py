@@ -14,7 +14,7 @@ import json
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 
 from bridge_lib import BRIDGE_CONFIG, BridgeLogger, BridgeEnvironment, BridgeUtils
-from aggsandbox_api import AggsandboxAPI, BridgeAssetArgs, BridgeClaimArgs
+from aggsandbox_api import AggsandboxAPI, BridgeAssetArgs, BridgeClaimArgs, json_loads, find_tx_hash
 
 def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
     """
@@ -73,21 +73,11 @@ def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
             return False
         
         # Extract bridge transaction hash from output
-        bridge_tx_hash = None
-        lines = output.split('\n')
-        for line in lines:
-            if 'bridge transaction submitted' in line.lower() and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        bridge_tx_hash = word
-                        break
-                if bridge_tx_hash:
-                    break
+        bridge_tx_hash = find_tx_hash(output, 'bridge transaction submitted')
         
         if not bridge_tx_hash:
             BridgeLogger.error("Could not extract bridge transaction hash from output")
-            BridgeLogger.debug(f"Bridge output: {output}")
+            BridgeLogger.debug("Bridge output: %s", output)
             return False
         
         BridgeLogger.success(f"✅ Bridge transaction submitted: {bridge_tx_hash}")
@@ -99,7 +89,7 @@ def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
         
         our_bridge = None
         for attempt in range(6):
-            BridgeLogger.debug(f"Attempt {attempt + 1}/6 to find bridge...")
+            BridgeLogger.debug("Attempt %s/6 to find bridge...", attempt + 1)
             time.sleep(3)
             
             success, output = AggsandboxAPI.show_bridges(
@@ -109,7 +99,7 @@ def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
             
             if success:
                 try:
-                    bridge_data = json.loads(output)
+                    bridge_data = json_loads(output)
                     bridges = bridge_data.get('bridges', [])
                     
                     # Look for our specific bridge transaction
@@ -151,13 +141,13 @@ def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
         wrapped_token_addr = None
         if success:
             try:
-                data = json.loads(output)
+                data = json_loads(output)
                 wrapped_token_addr = data.get('precalculated_address') or data.get('wrapped_token_address')
                 if wrapped_token_addr:
                     BridgeLogger.success(f"✅ Wrapped token address: {wrapped_token_addr}")
                 else:
                     BridgeLogger.warning("No precalculated_address or wrapped_token_address in response")
-                    BridgeLogger.debug(f"Response keys: {list(data.keys())}")
+                    BridgeLogger.debug("Response keys: %s", list(data.keys()))
             except json.JSONDecodeError as e:
                 BridgeLogger.warning(f"Could not parse wrapped token response: {e}")
         else:
@@ -171,15 +161,9 @@ def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
         # Check L2 balance before claim
         BridgeLogger.step("Checking L2 balance before claim")
         try:
-            import subprocess
-            result = subprocess.run([
-                "cast", "call", wrapped_token_addr,
-                "balanceOf(address)(uint256)",
-                BRIDGE_CONFIG.account_address_2,
-                "--rpc-url", BRIDGE_CONFIG.rpc_2
-            ], capture_output=True, text=True, check=True)
-            
-            l2_balance_before = int(result.stdout.strip())
+            l2_balance_before = BridgeUtils.get_token_balance(
+                wrapped_token_addr, BRIDGE_CONFIG.account_address_2, BRIDGE_CONFIG.network_id_agglayer_1, BRIDGE_CONFIG
+            )
             BridgeLogger.info(f"L2 balance before claim: {l2_balance_before} tokens")
             
         except Exception as e:
@@ -222,16 +206,7 @@ def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
                 continue
             
             # Extract claim transaction hash
-            lines = output.split('\n')
-            for line in lines:
-                if 'claim transaction submitted' in line.lower() and '0x' in line:
-                    words = line.split()
-                    for word in words:
-                        if word.startswith('0x') and len(word) == 66:
-                            claim_tx_hash = word
-                            break
-                    if claim_tx_hash:
-                        break
+            claim_tx_hash = find_tx_hash(output, 'claim transaction submitted')
             
             if claim_tx_hash:
                 BridgeLogger.success(f"✅ Claim transaction submitted: {claim_tx_hash}")
@@ -239,20 +214,16 @@ def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
                 # Verify transaction actually succeeded
                 BridgeLogger.info("Verifying claim transaction status...")
                 try:
-                    import subprocess
-                    result = subprocess.run([
-                        "cast", "receipt", claim_tx_hash, "--rpc-url", BRIDGE_CONFIG.rpc_2
-                    ], capture_output=True, text=True, check=True)
+                    receipt = BridgeUtils.get_transaction_receipt(
+                        claim_tx_hash, BRIDGE_CONFIG.network_id_agglayer_1, BRIDGE_CONFIG
+                    ) or {}
                     
-                    receipt = result.stdout.strip()
-                    if "status               0 (failed)" in receipt:
+                    status = receipt.get('status')
+                    if status == '0x0':
                         BridgeLogger.error(f"❌ Claim transaction failed on-chain: {claim_tx_hash}")
                         # Look for revert reason
-                        if "revertReason" in receipt:
-                            lines_recv = receipt.split('\n')
-                            for line_recv in lines_recv:
-                                if "revertReason" in line_recv:
-                                    BridgeLogger.error(f"Revert reason: {line_recv.strip()}")
+                        if receipt.get('revertReason'):
+                            BridgeLogger.error(f"Revert reason: {receipt['revertReason']}")
                         # Don't return False, continue to retry
                         if attempt == 2:  # Last attempt
                             BridgeLogger.error("❌ All claim attempts resulted in failed transactions")
@@ -260,7 +231,7 @@ def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
                         else:
                             BridgeLogger.info("Will retry claim after longer delay...")
                             continue
-                    elif "status               1 (success)" in receipt:
+                    elif status == '0x1':
                         BridgeLogger.success("✅ Claim transaction succeeded on-chain")
                         claim_success = True
                         break
@@ -291,7 +262,7 @@ def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
         claim_completed = False
         for attempt in range(12):  # Try for up to 60 seconds (12 * 5 seconds)
             time.sleep(5)
-            BridgeLogger.debug(f"Checking claim status (attempt {attempt + 1}/12)...")
+            BridgeLogger.debug("Checking claim status (attempt %s/12)...", attempt + 1)
             
             success, output = AggsandboxAPI.show_claims(
                 network_id=BRIDGE_CONFIG.network_id_agglayer_1,
@@ -300,7 +271,7 @@ def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
             
             if success:
                 try:
-                    claims_data = json.loads(output)
+                    claims_data = json_loads(output)
                     claims = claims_data.get('claims', [])
                     
                     # Look for our claim by matching bridge details (not tx_hash since it changes)
@@ -313,7 +284,7 @@ def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
                             claim.get('destination_network') == BRIDGE_CONFIG.network_id_agglayer_1):
                             
                             claim_status = claim.get('status', 'unknown')
-                            BridgeLogger.debug(f"Found matching claim: status={claim_status}, tx_hash={claim.get('claim_tx_hash')}")
+                            BridgeLogger.debug("Found matching claim: status=%s, tx_hash=%s", claim_status, claim.get('claim_tx_hash'))
                             
                             if claim_status == "completed":
                                 BridgeLogger.success(f"✅ Claim completed after {(attempt + 1) * 5} seconds!")
@@ -339,14 +310,9 @@ def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
         # Check L2 balance after claim
         BridgeLogger.step("Checking L2 balance after claim")
         try:
-            result = subprocess.run([
-                "cast", "call", wrapped_token_addr,
-                "balanceOf(address)(uint256)",
-                BRIDGE_CONFIG.account_address_2,
-                "--rpc-url", BRIDGE_CONFIG.rpc_2
-            ], capture_output=True, text=True, check=True)
-            
-            l2_balance_after = int(result.stdout.strip())
+            l2_balance_after = BridgeUtils.get_token_balance(
+                wrapped_token_addr, BRIDGE_CONFIG.account_address_2, BRIDGE_CONFIG.network_id_agglayer_1, BRIDGE_CONFIG
+            )
             BridgeLogger.info(f"L2 balance after claim: {l2_balance_after} tokens")
             
             # Calculate balance difference
@@ -383,7 +349,7 @@ def run_l1_to_l2_asset_bridge_test(bridge_amount: int = 50):
         
         if success:
             try:
-                claims_data = json.loads(output)
+                claims_data = json_loads(output)
                 claims = claims_data.get('claims', [])
                 total_claims = len(claims)
                 
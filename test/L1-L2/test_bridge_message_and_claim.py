@@ -9,13 +9,14 @@ import sys
 import os
 import time
 import json
+import shlex
 import subprocess
 
 # Add the lib directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 
 from bridge_lib import BRIDGE_CONFIG, BridgeLogger, BridgeEnvironment, BridgeUtils
-from aggsandbox_api import AggsandboxAPI, BridgeClaimArgs
+from aggsandbox_api import AggsandboxAPI, BridgeClaimArgs, json_loads, find_tx_hash
 
 def deploy_message_receiver_contract() -> str:
     """Deploy SimpleBridgeMessageReceiver contract on L2"""
@@ -31,7 +32,8 @@ def deploy_message_receiver_contract() -> str:
             "--broadcast"
         ]
         
-        BridgeLogger.debug(f"Executing: {' '.join(cmd)}")
+        if BridgeLogger.debug_enabled:
+            BridgeLogger.debug("Executing: %s", shlex.join(cmd))
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         
         # Extract contract address from output
@@ -49,7 +51,7 @@ def deploy_message_receiver_contract() -> str:
             return contract_address
         else:
             BridgeLogger.error("Could not extract contract address from deployment output")
-            BridgeLogger.debug(f"Full output: {output}")
+            BridgeLogger.debug("Full output: %s", output)
             return None
             
     except subprocess.CalledProcessError as e:
@@ -142,21 +144,11 @@ def run_l1_to_l2_message_bridge_test(message: str = "Hello World"):
             return False
         
         # Extract bridge transaction hash from output
-        bridge_tx_hash = None
-        lines = output.split('\n')
-        for line in lines:
-            if 'bridge message transaction submitted' in line.lower() and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        bridge_tx_hash = word
-                        break
-                if bridge_tx_hash:
-                    break
+        bridge_tx_hash = find_tx_hash(output, 'bridge message transaction submitted')
         
         if not bridge_tx_hash:
             BridgeLogger.error("Could not extract bridge transaction hash from output")
-            BridgeLogger.debug(f"Bridge output: {output}")
+            BridgeLogger.debug("Bridge output: %s", output)
             return False
         
         BridgeLogger.success(f"✅ Message bridge transaction submitted: {bridge_tx_hash}")
@@ -168,7 +160,7 @@ def run_l1_to_l2_message_bridge_test(message: str = "Hello World"):
         
         our_bridge = None
         for attempt in range(6):
-            BridgeLogger.debug(f"Attempt {attempt + 1}/6 to find bridge...")
+            BridgeLogger.debug("Attempt %s/6 to find bridge...", attempt + 1)
             time.sleep(3)
             
             success, output = AggsandboxAPI.show_bridges(
@@ -178,7 +170,7 @@ def run_l1_to_l2_message_bridge_test(message: str = "Hello World"):
             
             if success:
                 try:
-                    bridge_data = json.loads(output)
+                    bridge_data = json_loads(output)
                     bridges = bridge_data.get('bridges', [])
                     
                     # Look for our specific bridge transaction
@@ -239,16 +231,7 @@ def run_l1_to_l2_message_bridge_test(message: str = "Hello World"):
             
             if success:
                 # Extract claim transaction hash
-                lines = output.split('\n')
-                for line in lines:
-                    if '✅ claim transaction submitted:' in line.lower() and '0x' in line:
-                        words = line.split()
-                        for word in words:
-                            if word.startswith('0x') and len(word) == 66:
-                                claim_tx_hash = word
-                                break
-                        if claim_tx_hash:
-                            break
+                claim_tx_hash = find_tx_hash(output, '✅ claim transaction submitted:')
                 
                 if claim_tx_hash:
                     BridgeLogger.success(f"✅ Claim transaction submitted: {claim_tx_hash}")
@@ -256,19 +239,16 @@ def run_l1_to_l2_message_bridge_test(message: str = "Hello World"):
                     # Verify transaction actually succeeded
                     BridgeLogger.info("Verifying claim transaction status...")
                     try:
-                        result = subprocess.run([
-                            "cast", "receipt", claim_tx_hash, "--rpc-url", BRIDGE_CONFIG.rpc_2
-                        ], capture_output=True, text=True, check=True)
+                        receipt = BridgeUtils.get_transaction_receipt(
+                            claim_tx_hash, BRIDGE_CONFIG.network_id_agglayer_1, BRIDGE_CONFIG
+                        ) or {}
                         
-                        receipt = result.stdout.strip()
-                        if "status               0 (failed)" in receipt:
+                        status = receipt.get('status')
+                        if status == '0x0':
                             BridgeLogger.error(f"❌ Claim transaction failed on-chain: {claim_tx_hash}")
                             # Look for revert reason
-                            if "revertReason" in receipt:
-                                lines = receipt.split('\n')
-                                for line in lines:
-                                    if "revertReason" in line:
-                                        BridgeLogger.error(f"Revert reason: {line.strip()}")
+                            if receipt.get('revertReason'):
+                                BridgeLogger.error(f"Revert reason: {receipt['revertReason']}")
                             # Don't break, continue to retry
                             if attempt == 2:  # Last attempt
                                 BridgeLogger.error("❌ All claim attempts resulted in failed transactions")
@@ -277,7 +257,7 @@ def run_l1_to_l2_message_bridge_test(message: str = "Hello World"):
                                 BridgeLogger.info("Will retry claim after longer delay...")
                                 time.sleep(10)
                                 continue
-                        elif "status               1 (success)" in receipt:
+                        elif status == '0x1':
                             BridgeLogger.success("✅ Claim transaction succeeded on-chain")
                             claim_success = True
                             break
@@ -313,7 +293,7 @@ def run_l1_to_l2_message_bridge_test(message: str = "Hello World"):
         claim_completed = False
         for attempt in range(12):  # Try for up to 60 seconds (12 * 5 seconds)
             time.sleep(5)
-            BridgeLogger.debug(f"Checking claim status (attempt {attempt + 1}/12)...")
+            BridgeLogger.debug("Checking claim status (attempt %s/12)...", attempt + 1)
             
             success, output = AggsandboxAPI.show_claims(
                 network_id=BRIDGE_CONFIG.network_id_agglayer_1,
@@ -322,7 +302,7 @@ def run_l1_to_l2_message_bridge_test(message: str = "Hello World"):
             
             if success:
                 try:
-                    claims_data = json.loads(output)
+                    claims_data = json_loads(output)
                     claims = claims_data.get('claims', [])
                     
                     # Look for our claim by matching bridge transaction hash (most reliable)
@@ -333,7 +313,7 @@ def run_l1_to_l2_message_bridge_test(message: str = "Hello World"):
                             claim.get('type') == 'message'):
                             
                             claim_status = claim.get('status', 'unknown')
-                            BridgeLogger.debug(f"Found matching claim: status={claim_status}, tx_hash={claim.get('claim_tx_hash')}")
+                            BridgeLogger.debug("Found matching claim: status=%s, tx_hash=%s", claim_status, claim.get('claim_tx_hash'))
                             
                             if claim_status == "completed":
                                 BridgeLogger.success(f"✅ Claim completed after {(attempt + 1) * 5} seconds!")
@@ -364,7 +344,7 @@ def run_l1_to_l2_message_bridge_test(message: str = "Hello World"):
             )
             if success:
                 try:
-                    claims_data = json.loads(output)
+                    claims_data = json_loads(output)
                     claims = claims_data.get('claims', [])
                     for claim in claims:
                         if (claim.get('bridge_tx_hash') == bridge_tx_hash and
@@ -429,7 +409,7 @@ def run_l1_to_l2_message_bridge_test(message: str = "Hello World"):
         
         if success:
             try:
-                claims_data = json.loads(output)
+                claims_data = json_loads(output)
                 claims = claims_data.get('claims', [])
                 total_claims = len(claims)
                 
@@ -15,7 +15,7 @@ import subprocess
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 
 from bridge_lib import BRIDGE_CONFIG, BridgeLogger, BridgeEnvironment, BridgeUtils
-from aggsandbox_api import AggsandboxAPI, BridgeClaimArgs
+from aggsandbox_api import AggsandboxAPI, BridgeClaimArgs, json_loads
 from bridge_and_call import BridgeAndCall
 
 def encode_call_data(function_signature: str, *args) -> str:
@@ -24,7 +24,7 @@ def encode_call_data(function_signature: str, *args) -> str:
         cmd = ["cast", "calldata", function_signature] + list(str(arg) for arg in args)
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         call_data = result.stdout.strip()
-        BridgeLogger.debug(f"Encoded call data: {call_data}")
+        BridgeLogger.debug("Encoded call data: %s", call_data)
         return call_data
     except subprocess.CalledProcessError as e:
         BridgeLogger.error(f"Failed to encode call data: {e}")
@@ -102,7 +102,7 @@ def run_l2_to_l1_bridge_and_call_test(bridge_amount: int = 8):
         l1_wrapped_token_addr = None
         if success:
             try:
-                data = json.loads(output)
+                data = json_loads(output)
                 l1_wrapped_token_addr = data.get('precalculated_address')
                 BridgeLogger.success(f"✅ L1 wrapped token will be: {l1_wrapped_token_addr}")
             except json.JSONDecodeError as e:
@@ -150,7 +150,7 @@ def run_l2_to_l1_bridge_and_call_test(bridge_amount: int = 8):
         
         if not bridge_tx_hash:
             BridgeLogger.error("Could not extract bridge transaction hash from output")
-            BridgeLogger.debug(f"Bridge output: {output}")
+            BridgeLogger.debug("Bridge output: %s", output)
             return False
         
         BridgeLogger.success(f"✅ Bridge-and-call transaction submitted: {bridge_tx_hash}")
@@ -168,7 +168,7 @@ def run_l2_to_l1_bridge_and_call_test(bridge_amount: int = 8):
         message_bridge = None
         
         for attempt in range(6):
-            BridgeLogger.debug(f"Attempt {attempt + 1}/6 to find bridges...")
+            BridgeLogger.debug("Attempt %s/6 to find bridges...", attempt + 1)
             time.sleep(3)
             
             success, output = AggsandboxAPI.show_bridges(
@@ -178,7 +178,7 @@ def run_l2_to_l1_bridge_and_call_test(bridge_amount: int = 8):
             
             if success:
                 try:
-                    bridge_data = json.loads(output)
+                    bridge_data = json_loads(output)
                     bridges = bridge_data.get('bridges', [])
                     
                     # Look for our bridge transactions (both asset and message) using BridgeUtils
@@ -195,7 +195,7 @@ def run_l2_to_l1_bridge_and_call_test(bridge_amount: int = 8):
                                 message_bridge = bridge
                                 BridgeLogger.success(f"✅ Found message bridge (deposit_count = {bridge['deposit_count']}, has calldata)")
                             else:
-                                BridgeLogger.debug(f"Found bridge but couldn't classify: leaf_type={bridge.get('leaf_type')}, amount={bridge.get('amount')}")
+                                BridgeLogger.debug("Found bridge but couldn't classify: leaf_type=%s, amount=%s", bridge.get('leaf_type'), bridge.get('amount'))
                     
                     if asset_bridge and message_bridge:
                         break
@@ -337,7 +337,7 @@ def run_l2_to_l1_bridge_and_call_test(bridge_amount: int = 8):
         
         if success:
             try:
-                claims_data = json.loads(output)
+                claims_data = json_loads(output)
                 claims = claims_data.get('claims', [])
                 total_claims = len(claims)
                 
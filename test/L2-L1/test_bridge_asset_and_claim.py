@@ -14,7 +14,7 @@ import json
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 
 from bridge_lib import BRIDGE_CONFIG, BridgeLogger, BridgeEnvironment, BridgeUtils
-from aggsandbox_api import AggsandboxAPI, BridgeAssetArgs, BridgeClaimArgs
+from aggsandbox_api import AggsandboxAPI, BridgeAssetArgs, BridgeClaimArgs, json_loads, find_tx_hash
 
 def run_l2_to_l1_asset_bridge_test(bridge_amount: int = 50):
     """
@@ -68,7 +68,7 @@ def run_l2_to_l1_asset_bridge_test(bridge_amount: int = 50):
         l1_wrapped_token_addr = None
         if success:
             try:
-                data = json.loads(output)
+                data = json_loads(output)
                 l1_wrapped_token_addr = data.get('precalculated_address')
                 if l1_wrapped_token_addr:
                     BridgeLogger.success(f"✅ L1 wrapped token address: {l1_wrapped_token_addr}")
@@ -86,21 +86,9 @@ def run_l2_to_l1_asset_bridge_test(bridge_amount: int = 50):
         # Check L2 wrapped token balance before bridge
         BridgeLogger.step("Checking L2 wrapped token balance before bridge")
         try:
-            import subprocess
-            result = subprocess.run([
-                "cast", "call", BRIDGE_CONFIG.agg_erc20_l2,
-                "balanceOf(address)(uint256)",
-                BRIDGE_CONFIG.account_address_1,
-                "--rpc-url", BRIDGE_CONFIG.rpc_2
-            ], capture_output=True, text=True, check=True)
-            
-            balance_output = result.stdout.strip()
-            # Handle cast output format like "1000000000000000000000000 [1e24]"
-            if '[' in balance_output:
-                balance_str = balance_output.split('[')[0].strip()
-            else:
-                balance_str = balance_output
-            l2_balance_before = int(balance_str)
+            l2_balance_before = BridgeUtils.get_token_balance(
+                BRIDGE_CONFIG.agg_erc20_l2, BRIDGE_CONFIG.account_address_1, BRIDGE_CONFIG.network_id_agglayer_1, BRIDGE_CONFIG
+            )
             BridgeLogger.info(f"L2 AggERC20 balance before bridge: {l2_balance_before} tokens")
             
             if l2_balance_before < bridge_amount:
@@ -115,14 +103,9 @@ def run_l2_to_l1_asset_bridge_test(bridge_amount: int = 50):
         # Check L1 wrapped token balance before claim
         BridgeLogger.step("Checking L1 wrapped token balance before claim")
         try:
-            result = subprocess.run([
-                "cast", "call", l1_wrapped_token_addr,
-                "balanceOf(address)(uint256)",
-                BRIDGE_CONFIG.account_address_2,
-                "--rpc-url", BRIDGE_CONFIG.rpc_1
-            ], capture_output=True, text=True, check=True)
-            
-            l1_balance_before = int(result.stdout.strip())
+            l1_balance_before = BridgeUtils.get_token_balance(
+                l1_wrapped_token_addr, BRIDGE_CONFIG.account_address_2, BRIDGE_CONFIG.network_id_mainnet, BRIDGE_CONFIG
+            )
             BridgeLogger.info(f"L1 wrapped token balance before claim: {l1_balance_before} tokens")
             
         except Exception as e:
@@ -153,21 +136,11 @@ def run_l2_to_l1_asset_bridge_test(bridge_amount: int = 50):
             return False
         
         # Extract bridge transaction hash from output
-        bridge_tx_hash = None
-        lines = output.split('\n')
-        for line in lines:
-            if 'bridge transaction submitted' in line.lower() and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        bridge_tx_hash = word
-                        break
-                if bridge_tx_hash:
-                    break
+        bridge_tx_hash = find_tx_hash(output, 'bridge transaction submitted')
         
         if not bridge_tx_hash:
             BridgeLogger.error("Could not extract bridge transaction hash from output")
-            BridgeLogger.debug(f"Bridge output: {output}")
+            BridgeLogger.debug("Bridge output: %s", output)
             return False
         
         BridgeLogger.success(f"✅ Bridge transaction submitted: {bridge_tx_hash}")
@@ -179,7 +152,7 @@ def run_l2_to_l1_asset_bridge_test(bridge_amount: int = 50):
         
         our_bridge = None
         for attempt in range(6):
-            BridgeLogger.debug(f"Attempt {attempt + 1}/6 to find bridge...")
+            BridgeLogger.debug("Attempt %s/6 to find bridge...", attempt + 1)
             time.sleep(3)
             
             success, output = AggsandboxAPI.show_bridges(
@@ -189,7 +162,7 @@ def run_l2_to_l1_asset_bridge_test(bridge_amount: int = 50):
             
             if success:
                 try:
-                    bridge_data = json.loads(output)
+                    bridge_data = json_loads(output)
                     bridges = bridge_data.get('bridges', [])
                     
                     # Look for our specific bridge transaction using BridgeUtils
@@ -244,17 +217,7 @@ def run_l2_to_l1_asset_bridge_test(bridge_amount: int = 50):
             return False
         
         # Extract claim transaction hash
-        claim_tx_hash = None
-        lines = output.split('\n')
-        for line in lines:
-            if '✅ claim transaction submitted:' in line.lower() and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        claim_tx_hash = word
-                        break
-                if claim_tx_hash:
-                    break
+        claim_tx_hash = find_tx_hash(output, '✅ claim transaction submitted:')
         
         if claim_tx_hash:
             BridgeLogger.success(f"✅ Claim transaction submitted: {claim_tx_hash}")
@@ -270,7 +233,7 @@ def run_l2_to_l1_asset_bridge_test(bridge_amount: int = 50):
         claim_completed = False
         for attempt in range(12):  # Try for up to 60 seconds (12 * 5 seconds)
             time.sleep(5)
-            BridgeLogger.debug(f"Checking claim status (attempt {attempt + 1}/12)...")
+            BridgeLogger.debug("Checking claim status (attempt %s/12)...", attempt + 1)
             
             success, output = AggsandboxAPI.show_claims(
                 network_id=BRIDGE_CONFIG.network_id_mainnet,  # Check L1 claims
@@ -279,7 +242,7 @@ def run_l2_to_l1_asset_bridge_test(bridge_amount: int = 50):
             
             if success:
                 try:
-                    claims_data = json.loads(output)
+                    claims_data = json_loads(output)
                     claims = claims_data.get('claims', [])
                     
                     # Look for our claim using bridge_tx_hash
@@ -294,7 +257,7 @@ def run_l2_to_l1_asset_bridge_test(bridge_amount: int = 50):
                              claim.get('destination_network') == BRIDGE_CONFIG.network_id_mainnet)):
                             
                             claim_status = claim.get('status', 'unknown')
-                            BridgeLogger.debug(f"Found matching claim: status={claim_status}, tx_hash={claim.get('claim_tx_hash')}")
+                            BridgeLogger.debug("Found matching claim: status=%s, tx_hash=%s", claim_status, claim.get('claim_tx_hash'))
                             
                             if claim_status == "completed":
                                 BridgeLogger.success(f"✅ Claim completed after {(attempt + 1) * 5} seconds!")
@@ -320,14 +283,9 @@ def run_l2_to_l1_asset_bridge_test(bridge_amount: int = 50):
         # Check L1 wrapped token balance after claim
         BridgeLogger.step("Checking L1 wrapped token balance after claim")
         try:
-            result = subprocess.run([
-                "cast", "call", l1_wrapped_token_addr,
-                "balanceOf(address)(uint256)",
-                BRIDGE_CONFIG.account_address_2,
-                "--rpc-url", BRIDGE_CONFIG.rpc_1
-            ], capture_output=True, text=True, check=True)
-            
-            l1_balance_after = int(result.stdout.strip())
+            l1_balance_after = BridgeUtils.get_token_balance(
+                l1_wrapped_token_addr, BRIDGE_CONFIG.account_address_2, BRIDGE_CONFIG.network_id_mainnet, BRIDGE_CONFIG
+            )
             BridgeLogger.info(f"L1 wrapped token balance after claim: {l1_balance_after} tokens")
             
             # Calculate balance difference
@@ -364,7 +322,7 @@ def run_l2_to_l1_asset_bridge_test(bridge_amount: int = 50):
         
         if success:
             try:
-                claims_data = json.loads(output)
+                claims_data = json_loads(output)
                 claims = claims_data.get('claims', [])
                 total_claims = len(claims)
                 
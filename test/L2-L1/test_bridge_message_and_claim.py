@@ -9,13 +9,14 @@ import sys
 import os
 import time
 import json
+import shlex
 import subprocess
 
 # Add the lib directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 
 from bridge_lib import BRIDGE_CONFIG, BridgeLogger, BridgeEnvironment, BridgeUtils
-from aggsandbox_api import AggsandboxAPI, BridgeClaimArgs
+from aggsandbox_api import AggsandboxAPI, BridgeClaimArgs, json_loads
 
 def deploy_message_receiver_contract() -> str:
     """Deploy SimpleBridgeMessageReceiver contract on L1"""
@@ -31,7 +32,8 @@ def deploy_message_receiver_contract() -> str:
             "--broadcast"
         ]
         
-        BridgeLogger.debug(f"Executing: {' '.join(cmd)}")
+        if BridgeLogger.debug_enabled:
+            BridgeLogger.debug("Executing: %s", shlex.join(cmd))
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         
         # Extract contract address from output
@@ -49,7 +51,7 @@ def deploy_message_receiver_contract() -> str:
             return contract_address
         else:
             BridgeLogger.error("Could not extract contract address from deployment output")
-            BridgeLogger.debug(f"Full output: {output}")
+            BridgeLogger.debug("Full output: %s", output)
             return None
             
     except subprocess.CalledProcessError as e:
@@ -146,7 +148,7 @@ def run_l2_to_l1_message_bridge_test(message: str = "L2 to L1 Message"):
         
         if not bridge_tx_hash:
             BridgeLogger.error("Could not extract bridge transaction hash from output")
-            BridgeLogger.debug(f"Bridge output: {output}")
+            BridgeLogger.debug("Bridge output: %s", output)
             return False
         
         BridgeLogger.success(f"✅ Message bridge transaction submitted: {bridge_tx_hash}")
@@ -158,7 +160,7 @@ def run_l2_to_l1_message_bridge_test(message: str = "L2 to L1 Message"):
         
         our_bridge = None
         for attempt in range(6):
-            BridgeLogger.debug(f"Attempt {attempt + 1}/6 to find bridge...")
+            BridgeLogger.debug("Attempt %s/6 to find bridge...", attempt + 1)
             time.sleep(3)
             
             success, output = AggsandboxAPI.show_bridges(
@@ -168,7 +170,7 @@ def run_l2_to_l1_message_bridge_test(message: str = "L2 to L1 Message"):
             
             if success:
                 try:
-                    bridge_data = json.loads(output)
+                    bridge_data = json_loads(output)
                     bridges = bridge_data.get('bridges', [])
                     
                     # Look for our specific bridge transaction using BridgeUtils
@@ -281,7 +283,7 @@ def run_l2_to_l1_message_bridge_test(message: str = "L2 to L1 Message"):
         
         if success:
             try:
-                claims_data = json.loads(output)
+                claims_data = json_loads(output)
                 claims = claims_data.get('claims', [])
                 total_claims = len(claims)
                 
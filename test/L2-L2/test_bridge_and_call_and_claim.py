@@ -17,7 +17,7 @@ import subprocess
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 
 from bridge_lib import BRIDGE_CONFIG, BridgeLogger, BridgeEnvironment, BridgeUtils
-from aggsandbox_api import AggsandboxAPI, BridgeClaimArgs
+from aggsandbox_api import AggsandboxAPI, BridgeClaimArgs, json_loads
 from bridge_and_call import BridgeAndCall
 
 def encode_call_data(function_signature: str, *args) -> str:
@@ -26,7 +26,7 @@ def encode_call_data(function_signature: str, *args) -> str:
         cmd = ["cast", "calldata", function_signature] + list(str(arg) for arg in args)
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         call_data = result.stdout.strip()
-        BridgeLogger.debug(f"Encoded call data: {call_data}")
+        BridgeLogger.debug("Encoded call data: %s", call_data)
         return call_data
     except subprocess.CalledProcessError as e:
         BridgeLogger.error(f"Failed to encode call data: {e}")
@@ -106,7 +106,7 @@ def run_l2_to_l2_bridge_and_call_test(bridge_amount: int = 12):
         l2_2_wrapped_token_addr = None
         if success:
             try:
-                data = json.loads(output)
+                data = json_loads(output)
                 l2_2_wrapped_token_addr = data.get('precalculated_address')
                 BridgeLogger.success(f"✅ L2-2 wrapped token will be: {l2_2_wrapped_token_addr}")
             except json.JSONDecodeError as e:
@@ -154,7 +154,7 @@ def run_l2_to_l2_bridge_and_call_test(bridge_amount: int = 12):
         
         if not bridge_tx_hash:
             BridgeLogger.error("Could not extract bridge transaction hash from output")
-            BridgeLogger.debug(f"Bridge output: {output}")
+            BridgeLogger.debug("Bridge output: %s", output)
             return False
         
         BridgeLogger.success(f"✅ Bridge-and-call transaction submitted: {bridge_tx_hash}")
@@ -172,7 +172,7 @@ def run_l2_to_l2_bridge_and_call_test(bridge_amount: int = 12):
         message_bridge = None
         
         for attempt in range(6):
-            BridgeLogger.debug(f"Attempt {attempt + 1}/6 to find bridges...")
+            BridgeLogger.debug("Attempt %s/6 to find bridges...", attempt + 1)
             time.sleep(3)
             
             success, output = AggsandboxAPI.show_bridges(
@@ -182,7 +182,7 @@ def run_l2_to_l2_bridge_and_call_test(bridge_amount: int = 12):
             
             if success:
                 try:
-                    bridge_data = json.loads(output)
+                    bridge_data = json_loads(output)
                     bridges = bridge_data.get('bridges', [])
                     
                     # Look for our bridge transactions (both asset and message)
@@ -198,7 +198,7 @@ def run_l2_to_l2_bridge_and_call_test(bridge_amount: int = 12):
                                 message_bridge = bridge
                                 BridgeLogger.success(f"✅ Found message bridge (deposit_count = {bridge['deposit_count']}, has calldata)")
                             else:
-                                BridgeLogger.debug(f"Found bridge but couldn't classify: leaf_type={bridge.get('leaf_type')}, amount={bridge.get('amount')}")
+                                BridgeLogger.debug("Found bridge but couldn't classify: leaf_type=%s, amount=%s", bridge.get('leaf_type'), bridge.get('amount'))
                     
                     if asset_bridge and message_bridge:
                         break
@@ -311,7 +311,7 @@ def run_l2_to_l2_bridge_and_call_test(bridge_amount: int = 12):
         
         for attempt in range(12):  # Try for up to 60 seconds (12 * 5 seconds)
             time.sleep(5)
-            BridgeLogger.debug(f"Checking claim statuses (attempt {attempt + 1}/12)...")
+            BridgeLogger.debug("Checking claim statuses (attempt %s/12)...", attempt + 1)
             
             success, output = AggsandboxAPI.show_claims(
                 network_id=2,  # Check L2-2 claims
@@ -320,7 +320,7 @@ def run_l2_to_l2_bridge_and_call_test(bridge_amount: int = 12):
             
             if success:
                 try:
-                    claims_data = json.loads(output)
+                    claims_data = json_loads(output)
                     claims = claims_data.get('claims', [])
                     
                     # Look for both our claims by matching bridge details
@@ -370,15 +370,9 @@ def run_l2_to_l2_bridge_and_call_test(bridge_amount: int = 12):
         
         try:
             # Check if contract received tokens
-            cmd = [
-                "cast", "call", l2_2_wrapped_token_addr,
-                "balanceOf(address)(uint256)",
-                contract_address,
-                "--rpc-url", "http://localhost:8547"  # L2-2 RPC
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            contract_balance = int(result.stdout.strip())
+            contract_balance = BridgeUtils.get_token_balance(
+                l2_2_wrapped_token_addr, contract_address, BRIDGE_CONFIG.network_id_agglayer_2, BRIDGE_CONFIG
+            )
             BridgeLogger.success(f"✅ Contract token balance: {contract_balance} tokens")
             
             # Check contract state to see if function was called
@@ -422,7 +416,7 @@ def run_l2_to_l2_bridge_and_call_test(bridge_amount: int = 12):
         
         if success:
             try:
-                claims_data = json.loads(output)
+                claims_data = json_loads(output)
                 claims = claims_data.get('claims', [])
                 total_claims = len(claims)
                 
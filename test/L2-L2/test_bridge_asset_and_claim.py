@@ -16,7 +16,7 @@ import json
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 
 from bridge_lib import BRIDGE_CONFIG, BridgeLogger, BridgeEnvironment, BridgeUtils
-from aggsandbox_api import AggsandboxAPI, BridgeAssetArgs, BridgeClaimArgs
+from aggsandbox_api import AggsandboxAPI, BridgeAssetArgs, BridgeClaimArgs, json_loads
 
 def run_l2_to_l2_asset_bridge_test(bridge_amount: int = 50):
     """
@@ -76,7 +76,7 @@ def run_l2_to_l2_asset_bridge_test(bridge_amount: int = 50):
         l3_wrapped_token_addr = None
         if success:
             try:
-                data = json.loads(output)
+                data = json_loads(output)
                 l3_wrapped_token_addr = data.get('precalculated_address')
                 if l3_wrapped_token_addr:
                     BridgeLogger.success(f"✅ L2-2 wrapped token address: {l3_wrapped_token_addr}")
@@ -94,21 +94,9 @@ def run_l2_to_l2_asset_bridge_test(bridge_amount: int = 50):
         # Check L2-1 token balance before bridge
         BridgeLogger.step("Checking L2-1 token balance before bridge")
         try:
-            import subprocess
-            result = subprocess.run([
-                "cast", "call", BRIDGE_CONFIG.agg_erc20_l2,
-                "balanceOf(address)(uint256)",
-                BRIDGE_CONFIG.account_address_1,
-                "--rpc-url", "http://localhost:8546"  # L2-1 RPC
-            ], capture_output=True, text=True, check=True)
-            
-            balance_output = result.stdout.strip()
-            # Handle cast output format like "1000000000000000000000000 [1e24]"
-            if '[' in balance_output:
-                balance_str = balance_output.split('[')[0].strip()
-            else:
-                balance_str = balance_output
-            l2_balance_before = int(balance_str)
+            l2_balance_before = BridgeUtils.get_token_balance(
+                BRIDGE_CONFIG.agg_erc20_l2, BRIDGE_CONFIG.account_address_1, BRIDGE_CONFIG.network_id_agglayer_1, BRIDGE_CONFIG
+            )
             BridgeLogger.info(f"L2-1 AggERC20 balance before bridge: {l2_balance_before} tokens")
             
             if l2_balance_before < bridge_amount:
@@ -123,20 +111,9 @@ def run_l2_to_l2_asset_bridge_test(bridge_amount: int = 50):
         # Check L2-2 wrapped token balance before claim (after bridge)
         BridgeLogger.step("Checking L2-2 wrapped token balance before claim")
         try:
-            result = subprocess.run([
-                "cast", "call", l3_wrapped_token_addr,
-                "balanceOf(address)(uint256)",
-                BRIDGE_CONFIG.account_address_2,
-                "--rpc-url", "http://localhost:8547"  # L2-2 RPC
-            ], capture_output=True, text=True, check=True)
-            
-            balance_output = result.stdout.strip()
-            # Handle cast output format like "1000000000000000000000000 [1e24]"
-            if '[' in balance_output:
-                balance_str = balance_output.split('[')[0].strip()
-            else:
-                balance_str = balance_output
-            l3_balance_before = int(balance_str)
+            l3_balance_before = BridgeUtils.get_token_balance(
+                l3_wrapped_token_addr, BRIDGE_CONFIG.account_address_2, BRIDGE_CONFIG.network_id_agglayer_2, BRIDGE_CONFIG
+            )
             BridgeLogger.info(f"L2-2 wrapped token balance before claim: {l3_balance_before} tokens")
             
         except Exception as e:
@@ -172,7 +149,7 @@ def run_l2_to_l2_asset_bridge_test(bridge_amount: int = 50):
         
         if not bridge_tx_hash:
             BridgeLogger.error("Could not extract bridge transaction hash from output")
-            BridgeLogger.debug(f"Bridge output: {output}")
+            BridgeLogger.debug("Bridge output: %s", output)
             return False
         
         BridgeLogger.success(f"✅ Bridge transaction submitted: {bridge_tx_hash}")
@@ -184,7 +161,7 @@ def run_l2_to_l2_asset_bridge_test(bridge_amount: int = 50):
         
         our_bridge = None
         for attempt in range(6):
-            BridgeLogger.debug(f"Attempt {attempt + 1}/6 to find bridge...")
+            BridgeLogger.debug("Attempt %s/6 to find bridge...", attempt + 1)
             time.sleep(3)
             
             success, output = AggsandboxAPI.show_bridges(
@@ -194,7 +171,7 @@ def run_l2_to_l2_asset_bridge_test(bridge_amount: int = 50):
             
             if success:
                 try:
-                    bridge_data = json.loads(output)
+                    bridge_data = json_loads(output)
                     bridges = bridge_data.get('bridges', [])
                     
                     # Look for our specific bridge transaction
@@ -297,7 +274,7 @@ def run_l2_to_l2_asset_bridge_test(bridge_amount: int = 50):
         claim_completed = False
         for attempt in range(12):  # Try for up to 60 seconds (12 * 5 seconds)
             time.sleep(5)
-            BridgeLogger.debug(f"Checking claim status (attempt {attempt + 1}/12)...")
+            BridgeLogger.debug("Checking claim status (attempt %s/12)...", attempt + 1)
             
             success, output = AggsandboxAPI.show_claims(
                 network_id=2,  # Check L2-2 claims
@@ -306,7 +283,7 @@ def run_l2_to_l2_asset_bridge_test(bridge_amount: int = 50):
             
             if success:
                 try:
-                    claims_data = json.loads(output)
+                    claims_data = json_loads(output)
                     claims = claims_data.get('claims', [])
                     
                     # Look for our claim using bridge_tx_hash
@@ -321,7 +298,7 @@ def run_l2_to_l2_asset_bridge_test(bridge_amount: int = 50):
                              claim.get('destination_network') == 2)):  # L2-2
                             
                             claim_status = claim.get('status', 'unknown')
-                            BridgeLogger.debug(f"Found matching claim: status={claim_status}, tx_hash={claim.get('claim_tx_hash')}")
+                            BridgeLogger.debug("Found matching claim: status=%s, tx_hash=%s", claim_status, claim.get('claim_tx_hash'))
                             
                             if claim_status == "completed":
                                 BridgeLogger.success(f"✅ Claim completed after {(attempt + 1) * 5} seconds!")
@@ -347,20 +324,9 @@ def run_l2_to_l2_asset_bridge_test(bridge_amount: int = 50):
         # Check L2-2 wrapped token balance after claim
         BridgeLogger.step("Checking L2-2 wrapped token balance after claim")
         try:
-            result = subprocess.run([
-                "cast", "call", l3_wrapped_token_addr,
-                "balanceOf(address)(uint256)",
-                BRIDGE_CONFIG.account_address_2,
-                "--rpc-url", "http://localhost:8547"  # L2-2 RPC
-            ], capture_output=True, text=True, check=True)
-            
-            balance_output = result.stdout.strip()
-            # Handle cast output format like "1000000000000000000000000 [1e24]"
-            if '[' in balance_output:
-                balance_str = balance_output.split('[')[0].strip()
-            else:
-                balance_str = balance_output
-            l3_balance_after = int(balance_str)
+            l3_balance_after = BridgeUtils.get_token_balance(
+                l3_wrapped_token_addr, BRIDGE_CONFIG.account_address_2, BRIDGE_CONFIG.network_id_agglayer_2, BRIDGE_CONFIG
+            )
             BridgeLogger.info(f"L2-2 wrapped token balance after claim: {l3_balance_after} tokens")
             
             # Calculate balance difference
@@ -397,7 +363,7 @@ def run_l2_to_l2_asset_bridge_test(bridge_amount: int = 50):
         
         if success:
             try:
-                claims_data = json.loads(output)
+                claims_data = json_loads(output)
                 claims = claims_data.get('claims', [])
                 total_claims = len(claims)
                 
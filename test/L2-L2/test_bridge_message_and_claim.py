@@ -11,42 +11,73 @@ The bridge transaction will succeed, but claiming will fail until the developer
 
 import sys
 import os
+import argparse
+import contextlib
+import multiprocessing
+import re
+import asyncio
 import time
-import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 
 # Add the lib directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 
 from bridge_lib import BRIDGE_CONFIG, BridgeLogger, BridgeEnvironment, BridgeUtils
 from aggsandbox_api import AggsandboxAPI, BridgeClaimArgs
+from rpc_client import RPCError, SELECTORS, decode_abi
+from artifacts import (
+    load_artifact, deploy_artifact, load_deployment, save_deployment, deployment_lock
+)
+
+DEPLOYED_TO_RE = re.compile(r'Deployed to:\s*(0x[0-9a-fA-F]{40})')
+RECEIVER_DEPLOYMENT = "l2_2_receiver"
+
+# Set in --jobs worker processes: the tests share the same accounts, so
+# transaction submission is serialized to keep their nonces from colliding
+_tx_lock = None
+
+def _init_worker(tx_lock):
+    global _tx_lock
+    _tx_lock = tx_lock
+
+def submitting_transaction():
+    """Context that serializes transaction submission across parallel test runs"""
+    return _tx_lock if _tx_lock is not None else contextlib.nullcontext()
 
 def deploy_message_receiver_contract() -> str:
     """Deploy SimpleBridgeMessageReceiver contract on L2-2"""
     BridgeLogger.step("Deploying SimpleBridgeMessageReceiver contract on L2-2")
     
+    # Deploy the cached artifact directly; only fall back to forge create if that fails
+    artifact = load_artifact(
+        "test/contracts/SimpleBridgeMessageReceiver.sol", "SimpleBridgeMessageReceiver"
+    )
+    l2_2_rpc_url = BridgeUtils.get_rpc_url(2, BRIDGE_CONFIG)
+    if artifact:
+        contract_address = deploy_artifact(
+            l2_2_rpc_url,
+            artifact,
+            BRIDGE_CONFIG.account_address_1,
+        )
+        if contract_address:
+            BridgeLogger.success(f"✅ Contract deployed at: {contract_address}")
+            return contract_address
+        BridgeLogger.warning("Cached artifact deployment failed, falling back to forge create")
+    
     try:
         # Deploy the contract using forge
         cmd = [
             "forge", "create", 
             "test/contracts/SimpleBridgeMessageReceiver.sol:SimpleBridgeMessageReceiver",
-            "--rpc-url", "http://localhost:8547",  # L2-2 RPC
+            "--rpc-url", l2_2_rpc_url,
             "--private-key", BRIDGE_CONFIG.private_key_1,
             "--broadcast"
         ]
         
-        BridgeLogger.debug(f"Executing: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        
-        # Extract contract address from output
-        output = result.stdout.strip()
-        lines = output.split('\n')
-        contract_address = None
-        
-        for line in lines:
-            if 'Deployed to:' in line:
-                contract_address = line.split('Deployed to:')[1].strip()
-                break
+        # Stop reading as soon as forge reports the contract address
+        contract_address = BridgeUtils.run_until_match(cmd, DEPLOYED_TO_RE)
         
         if contract_address:
             BridgeLogger.success(f"✅ Contract deployed at: {contract_address}")
@@ -57,9 +88,59 @@ def deploy_message_receiver_contract() -> str:
             
     except subprocess.CalledProcessError as e:
         BridgeLogger.error(f"Contract deployment failed: {e}")
-        BridgeLogger.error(f"Error output: {e.stderr}")
+        BridgeLogger.error(f"Error output: {e.output}")
         return None
 
+def get_message_receiver_contract() -> Tuple[Optional[str], bool]:
+    """Reuse the receiver deployed by an earlier run if it is still on L2-2, else deploy one
+    
+    Returns (contract_address, reused).
+    """
+    # Parallel runs wait here while the first one deploys, then reuse its receiver
+    with deployment_lock(RECEIVER_DEPLOYMENT):
+        contract_address = load_deployment(
+            RECEIVER_DEPLOYMENT, "SimpleBridgeMessageReceiver", BridgeUtils.get_rpc_url(2, BRIDGE_CONFIG)
+        )
+        if contract_address:
+            BridgeLogger.success(f"✅ Reusing message receiver at: {contract_address}")
+            return contract_address, True
+        
+        contract_address = deploy_message_receiver_contract()
+        if contract_address:
+            save_deployment(RECEIVER_DEPLOYMENT, contract_address)
+        return contract_address, False
+
+async def wait_for_claimable(deposit_count: int, bridge_tx: str, timeout: float = 20,
+                             interval: float = 2) -> Optional[dict]:
+    """Wait until our L2-1 bridge can be claimed on L2-2, or was already claimed there
+    
+    Both conditions are polled on one event loop and whichever shows up first
+    ends the wait. Returns {"claim": <claim>} if L2-2 already has a claim for
+    the bridge, {} once the deposit is in the L1 info tree, or None on timeout.
+    """
+    async def deposit_indexed():
+        while True:
+            success, _ = await AggsandboxAPI.show_l1_info_tree_index_async(1, deposit_count)
+            if success:
+                return {}
+            await asyncio.sleep(interval)
+    
+    async def already_claimed():
+        while True:
+            claims = await asyncio.to_thread(AggsandboxAPI.iter_claims, 2)  # L2-2 claims
+            if claims is not None:
+                for claim in BridgeUtils.iter_matching_claims(claims, bridge_tx, None):
+                    return {"claim": claim}
+            await asyncio.sleep(interval)
+    
+    tasks = [asyncio.create_task(deposit_indexed()), asyncio.create_task(already_claimed())]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        return done.pop().result() if done else None
+    finally:
+        for task in tasks:
+            task.cancel()
+
 def encode_message_data(message: str) -> str:
     """Encode a string message for bridge transmission"""
     try:
@@ -121,13 +202,23 @@ def run_l2_to_l2_message_bridge_test(message: str = "L2-1 to L2-2 Message"):
         
         # Step 0: Deploy message receiver contract on L2-2
         BridgeLogger.step("[0/6] Deploying message receiver contract on L2-2")
-        contract_address = deploy_message_receiver_contract()
+        contract_address, receiver_reused = get_message_receiver_contract()
         if not contract_address:
             BridgeLogger.error("Failed to deploy message receiver contract")
             return False
         
         BridgeLogger.info(f"Message receiver deployed at: {contract_address}")
-        time.sleep(5)
+        if not receiver_reused:
+            time.sleep(5)
+        
+        # The receiver may already hold messages from earlier runs; compare against this
+        l2_2_rpc = BridgeUtils.rpc_client(2, BRIDGE_CONFIG)
+        try:
+            result = l2_2_rpc.eth_call(contract_address, SELECTORS["totalMessagesReceived()"])
+            initial_messages = decode_abi(["uint256"], result)[0]
+        except (RPCError, OSError) as e:
+            BridgeLogger.warning(f"Could not read initial message count: {e}")
+            initial_messages = None
         print()
         
         # Step 1: Bridge message from L2-1 to L2-2
@@ -135,13 +226,14 @@ def run_l2_to_l2_message_bridge_test(message: str = "L2-1 to L2-2 Message"):
         BridgeLogger.info("Using: aggsandbox bridge message")
         BridgeLogger.info(f"Message data: {message_data}")
         
-        success, output = AggsandboxAPI.bridge_message(
-            network=1,  # L2-1
-            destination_network=2,  # L2-2
-            target=contract_address,
-            data=message_data,
-            private_key=BRIDGE_CONFIG.private_key_1
-        )
+        with submitting_transaction():
+            success, output = AggsandboxAPI.bridge_message(
+                network=1,  # L2-1
+                destination_network=2,  # L2-2
+                target=contract_address,
+                data=message_data,
+                private_key=BRIDGE_CONFIG.private_key_1
+            )
         
         if not success:
             BridgeLogger.error(f"Bridge message operation failed: {output}")
@@ -152,7 +244,7 @@ def run_l2_to_l2_message_bridge_test(message: str = "L2-1 to L2-2 Message"):
         
         if not bridge_tx_hash:
             BridgeLogger.error("Could not extract bridge transaction hash from output")
-            BridgeLogger.debug(f"Bridge output: {output}")
+            BridgeLogger.debug("Bridge output: %s", output)
             return False
         
         BridgeLogger.success(f"✅ Message bridge transaction submitted: {bridge_tx_hash}")
@@ -163,30 +255,27 @@ def run_l2_to_l2_message_bridge_test(message: str = "L2-1 to L2-2 Message"):
         BridgeLogger.info("Using: aggsandbox show bridges --network-id 1 --json")
         
         our_bridge = None
+        # Deposit counts only grow, so later attempts only scan bridges indexed since the last one
+        seen_deposit_count = None
         for attempt in range(6):
-            BridgeLogger.debug(f"Attempt {attempt + 1}/6 to find bridge...")
+            BridgeLogger.debug("Attempt %s/6 to find bridge...", attempt + 1)
             time.sleep(3)
             
-            success, output = AggsandboxAPI.show_bridges(
-                network_id=1,  # L2-1 bridges
-                json_output=True
-            )
+            bridge_data = AggsandboxAPI.get_bridges(1, since_deposit_count=seen_deposit_count)  # L2-1 bridges
             
-            if success:
-                try:
-                    bridge_data = json.loads(output)
-                    bridges = bridge_data.get('bridges', [])
-                    
-                    # Look for our specific bridge transaction
-                    our_bridge = BridgeUtils.find_bridge_by_tx_hash(bridges, bridge_tx_hash)
-                    if our_bridge:
-                        BridgeLogger.success(f"✅ Found our bridge (attempt {attempt + 1})")
-                        break
-                        
-                except json.JSONDecodeError as e:
-                    BridgeLogger.warning(f"Could not parse bridge data: {e}")
+            if bridge_data:
+                bridges = bridge_data.get('bridges', [])
+                
+                # Look for our specific bridge transaction
+                our_bridge = BridgeUtils.find_bridge_by_tx_hash(bridges, bridge_tx_hash)
+                if our_bridge:
+                    BridgeLogger.success(f"✅ Found our bridge (attempt {attempt + 1})")
+                    break
+                seen_deposit_count = max(
+                    (bridge.get('deposit_count', -1) for bridge in bridges), default=seen_deposit_count
+                )
             else:
-                BridgeLogger.warning(f"Could not get bridge data: {output}")
+                BridgeLogger.warning("Could not get bridge data")
         
         if not our_bridge:
             BridgeLogger.error("❌ Our bridge transaction not found in bridge events")
@@ -206,8 +295,15 @@ def run_l2_to_l2_message_bridge_test(message: str = "L2-1 to L2-2 Message"):
         BridgeLogger.step("Waiting for AggKit to sync bridge data from L2-1 to L2-2")
         BridgeLogger.info("L2→L2 bridging requires sync time for bridge data")
         BridgeLogger.info("AggKit needs ~10 seconds to sync bridge transactions between L2 networks")
-        BridgeLogger.info("This is based on successful manual testing results")
-        time.sleep(20)  # Reduced wait time based on manual success
+        BridgeLogger.info("Polling the L1 info tree index and L2-2 claims until one is ready (max 20 seconds)")
+        sync_deadline = time.monotonic() + 20  # Wait budget based on manual success
+        claimable = asyncio.run(wait_for_claimable(our_bridge['deposit_count'], bridge_tx))
+        if claimable is None:
+            BridgeLogger.info("No readiness signal within 20 seconds, trying the claim anyway")
+        elif claimable.get('claim'):
+            BridgeLogger.success("✅ L2-2 already has a claim for our bridge")
+        else:
+            BridgeLogger.success("✅ Deposit is in the L1 info tree")
         print()
         
         # Step 3: Claim the bridged message on L2-2
@@ -216,7 +312,6 @@ def run_l2_to_l2_message_bridge_test(message: str = "L2-1 to L2-2 Message"):
         BridgeLogger.info("This will trigger the contract execution on L2-2")
         
         # Create claim args
-        bridge_tx = BridgeUtils.get_bridge_tx_hash(our_bridge)
         claim_args = BridgeClaimArgs(
             network=2,  # Claim on L2-2
             tx_hash=bridge_tx,
@@ -224,19 +319,40 @@ def run_l2_to_l2_message_bridge_test(message: str = "L2-1 to L2-2 Message"):
             private_key=BRIDGE_CONFIG.private_key_2  # L2-2 account 2 (recipient)
         )
         
-        success, output = AggsandboxAPI.bridge_claim(claim_args)
+        existing_claim = claimable.get('claim') if claimable else None
+        if existing_claim:
+            # Claimed by the sandbox's auto-claimer while we were waiting
+            BridgeLogger.info("Skipping manual claim, the bridge was already claimed on L2-2")
+            success, output = True, ""
+        else:
+            with submitting_transaction():
+                success, output = AggsandboxAPI.bridge_claim(claim_args)
+            # The deposit can be indexed before its exit root reaches L2-2; retry within the sync budget
+            while not success and "GlobalExitRootInvalid" in output and time.monotonic() < sync_deadline:
+                BridgeLogger.info("Global exit root not on L2-2 yet, retrying claim...")
+                time.sleep(2)
+                with submitting_transaction():
+                    success, output = AggsandboxAPI.bridge_claim(claim_args)
         if not success:
             BridgeLogger.error(f"❌ Claim operation failed: {output}")
             return False
         
         # Extract claim transaction hash
-        claim_tx_hash = BridgeUtils.extract_tx_hash(output)
+        claim_tx_hash = (existing_claim.get('claim_tx_hash') if existing_claim
+                         else BridgeUtils.extract_tx_hash(output))
         if claim_tx_hash:
             BridgeLogger.success(f"✅ Claim transaction submitted: {claim_tx_hash}")
         else:
             BridgeLogger.success("✅ Claim completed successfully")
             claim_tx_hash = "completed"
         
+        # Claims for our message land on the receiver contract with no value attached.
+        # A reused or shared receiver also has claims from other runs, so only match
+        # on the tx hashes then.
+        # (destination, L2-1, L2-2, amount)
+        receiver_shared = receiver_reused or _tx_lock is not None
+        claim_details = None if receiver_shared else (contract_address, 1, 2, '0')
+        
         # Wait for claim to be processed
         BridgeLogger.info("Waiting for claim to be processed...")
         BridgeLogger.info("Checking claim status until completed...")
@@ -247,45 +363,29 @@ def run_l2_to_l2_message_bridge_test(message: str = "L2-1 to L2-2 Message"):
         
         claim_completed = False
         for attempt in range(3):  # Try for up to 15 seconds (3 * 5 seconds)
-            BridgeLogger.debug(f"Checking claim status (attempt {attempt + 1}/3)...")
+            BridgeLogger.debug("Checking claim status (attempt %s/3)...", attempt + 1)
             
-            success, output = AggsandboxAPI.show_claims(
-                network_id=2,  # Check L2-2 claims
-                json_output=True
-            )
+            claims = AggsandboxAPI.iter_claims(2)  # Check L2-2 claims
             
-            if success:
-                try:
-                    claims_data = json.loads(output)
-                    claims = claims_data.get('claims', [])
-                    
-                    # Look for our claim using multiple matching strategies
-                    bridge_tx = BridgeUtils.get_bridge_tx_hash(our_bridge)
-                    for claim in claims:
-                        # Match by bridge_tx_hash, claim_tx_hash, or bridge details
-                        if (claim.get('bridge_tx_hash') == bridge_tx or 
-                            claim.get('claim_tx_hash') == claim_tx_hash or
-                            (claim.get('destination_address') == contract_address and
-                             claim.get('origin_network') == 1 and  # L2-1
-                             claim.get('destination_network') == 2 and  # L2-2
-                             claim.get('amount') == '0')):
-                            
-                            claim_status = claim.get('status', 'unknown')
-                            BridgeLogger.debug(f"Found matching claim: status={claim_status}, tx_hash={claim.get('claim_tx_hash')}")
-                            
-                            if claim_status == "completed":
-                                BridgeLogger.success(f"✅ Claim completed after {2 + (attempt + 1) * 5} seconds!")
-                                claim_completed = True
-                                break
-                            elif claim_status == "pending":
-                                BridgeLogger.debug("⏳ Still pending...")
-                                continue
-                    
-                    if claim_completed:
+            if claims is not None:
+                # Look for our claim using multiple matching strategies
+                # (bridge_tx_hash, claim_tx_hash, or bridge details),
+                # decoding claims only until the completed one shows up
+                pending_seen = False
+                for claim in BridgeUtils.iter_matching_claims(claims, bridge_tx, claim_tx_hash, claim_details):
+                    if claim.get('status') == 'completed':
+                        BridgeLogger.debug("Found matching claim: tx_hash=%s", claim.get('claim_tx_hash'))
+                        BridgeLogger.success(f"✅ Claim completed after {2 + (attempt + 1) * 5} seconds!")
+                        claim_completed = True
                         break
-                        
-                except json.JSONDecodeError:
-                    BridgeLogger.debug("Could not parse claims data")
+                    pending_seen = pending_seen or claim.get('status') == 'pending'
+                
+                if claim_completed:
+                    break
+                if pending_seen:
+                    BridgeLogger.debug("⏳ Still pending...")
+            else:
+                BridgeLogger.debug("Could not get claims data")
             
             if attempt < 2:  # Don't sleep after last attempt
                 time.sleep(5)
@@ -297,34 +397,48 @@ def run_l2_to_l2_message_bridge_test(message: str = "L2-1 to L2-2 Message"):
         
         print()
         
+        # Steps 4 and 5 don't depend on each other: read the contract state over RPC
+        # while waiting for the claim to be indexed, instead of one after the other
+        def fetch_indexed_claims():
+            time.sleep(5)  # Reduced wait time based on manual testing success
+            return AggsandboxAPI.get_claims(2)  # L2-2 claims
+        
+        BridgeLogger.info("Verifying contract state while the claim is processed and indexed...")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            last_message_future = executor.submit(
+                l2_2_rpc.eth_call, contract_address, SELECTORS["getLastMessage()"]
+            )
+            total_messages_future = executor.submit(
+                l2_2_rpc.eth_call, contract_address, SELECTORS["totalMessagesReceived()"]
+            )
+            claims_future = executor.submit(fetch_indexed_claims)
+        
         # Step 4: Verify message was received by the contract
         BridgeLogger.step("[4/6] Verifying message received by contract")
         BridgeLogger.info("Checking if the message receiver contract got the message")
         
         try:
-            # Call getLastMessage() to see if contract received our message
-            cmd = [
-                "cast", "call", contract_address,
-                "getLastMessage()(address,uint32,bytes,uint256)",
-                "--rpc-url", "http://localhost:8547"  # L2-2 RPC
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            output_data = result.stdout.strip()
-            BridgeLogger.success(f"✅ Contract call successful: {output_data}")
+            # getLastMessage() shows whether the contract received our message
+            origin_address, origin_network, data, value = decode_abi(
+                ["address", "uint32", "bytes", "uint256"], last_message_future.result()
+            )
+            BridgeLogger.success("✅ Contract call successful:")
+            BridgeLogger.info(f"  • Origin address: {origin_address}")
+            BridgeLogger.info(f"  • Origin network: {origin_network}")
+            BridgeLogger.info(f"  • Data: 0x{data.hex()}")
+            BridgeLogger.info(f"  • Value: {value}")
             
             # Also check totalMessagesReceived
-            cmd = [
-                "cast", "call", contract_address,
-                "totalMessagesReceived()(uint256)",
-                "--rpc-url", "http://localhost:8547"  # L2-2 RPC
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            total_messages = int(result.stdout.strip())
+            total_messages = decode_abi(["uint256"], total_messages_future.result())[0]
             BridgeLogger.success(f"✅ Total messages received by contract: {total_messages}")
+            if initial_messages is not None:
+                new_messages = total_messages - initial_messages
+                if new_messages >= 1:
+                    BridgeLogger.success(f"✅ Contract received {new_messages} new message(s) during this run")
+                else:
+                    BridgeLogger.warning("No new messages received by the contract during this run")
             
-        except subprocess.CalledProcessError as e:
+        except (RPCError, OSError) as e:
             BridgeLogger.warning(f"Could not verify contract state: {e}")
         
         print()
@@ -332,83 +446,59 @@ def run_l2_to_l2_message_bridge_test(message: str = "L2-1 to L2-2 Message"):
         # Step 5: Verify claim using aggsandbox show claims
         BridgeLogger.step("[5/6] Verifying claim on L2-2")
         BridgeLogger.info("Using: aggsandbox show claims --network-id 2 --json")
-        BridgeLogger.info("Waiting for claim to be fully processed and indexed...")
-        
-        time.sleep(5)  # Reduced wait time based on manual testing success
         
-        success, output = AggsandboxAPI.show_claims(
-            network_id=2,  # L2-2 claims
-            json_output=True
-        )
+        claims_data = claims_future.result()
         
-        if success:
-            try:
-                claims_data = json.loads(output)
-                claims = claims_data.get('claims', [])
-                total_claims = len(claims)
-                
-                BridgeLogger.success(f"✅ Found {total_claims} total claims on L2-2")
-                
-                # Look for our specific claim using multiple matching strategies
-                bridge_tx = BridgeUtils.get_bridge_tx_hash(our_bridge)
-                our_claim = None
-                completed_claim = None
-                for claim in claims:
-                    # Match by bridge_tx_hash, claim_tx_hash, or bridge details
-                    # Note: Due to developer bug, L2-L2 message claims show type "asset"
-                    if (claim.get('bridge_tx_hash') == bridge_tx or 
-                        claim.get('claim_tx_hash') == claim_tx_hash or
-                        (claim.get('destination_address') == contract_address and
-                         claim.get('origin_network') == 1 and  # L2-1
-                         claim.get('destination_network') == 2 and  # L2-2
-                         claim.get('amount') == '0')):
-                        
-                        if claim.get('status') == 'completed':
-                            completed_claim = claim
-                        elif claim.get('status') == 'pending':
-                            our_claim = claim
+        if claims_data:
+            claims = claims_data.get('claims', [])
+            total_claims = len(claims)
+            
+            BridgeLogger.success(f"✅ Found {total_claims} total claims on L2-2")
+            
+            # Look for our specific claim using multiple matching strategies
+            # Match by bridge_tx_hash, claim_tx_hash, or bridge details
+            # Note: Due to developer bug, L2-L2 message claims show type "asset"
+            completed_claim, our_claim = BridgeUtils.pick_claims_by_status(
+                BridgeUtils.iter_matching_claims(claims, bridge_tx, claim_tx_hash, claim_details)
+            )
+            
+            # Prefer completed claim, fallback to pending
+            display_claim = completed_claim or our_claim
+            
+            if display_claim:
+                claim_status = display_claim.get('status', 'unknown')
+                claim_type = display_claim.get('type', 'unknown')
+                BridgeLogger.success("✅ Found our claim in L2-2 claims:")
+                BridgeLogger.info(f"  • Type: {claim_type}")
+                BridgeLogger.info(f"  • Block: {display_claim.get('block_num')}")
+                BridgeLogger.info(f"  • Status: {claim_status.upper()}")
+                BridgeLogger.info(f"  • Global Index: {display_claim.get('global_index')}")
+                BridgeLogger.info(f"  • Bridge TX: {display_claim.get('bridge_tx_hash')}")
+                BridgeLogger.info(f"  • Claim TX: {display_claim.get('claim_tx_hash')}")
                 
-                # Prefer completed claim, fallback to pending
-                display_claim = completed_claim or our_claim
+                # Note developer bug for L2-L2 message claims
+                if claim_type == 'asset' and display_claim.get('amount') == '0':
+                    BridgeLogger.warning("⚠️ Developer bug: L2-L2 message claims show type 'asset' instead of 'message'")
                 
-                if display_claim:
-                    claim_status = display_claim.get('status', 'unknown')
-                    claim_type = display_claim.get('type', 'unknown')
-                    BridgeLogger.success("✅ Found our claim in L2-2 claims:")
-                    BridgeLogger.info(f"  • Type: {claim_type}")
-                    BridgeLogger.info(f"  • Block: {display_claim.get('block_num')}")
-                    BridgeLogger.info(f"  • Status: {claim_status.upper()}")
-                    BridgeLogger.info(f"  • Global Index: {display_claim.get('global_index')}")
-                    BridgeLogger.info(f"  • Bridge TX: {display_claim.get('bridge_tx_hash')}")
-                    BridgeLogger.info(f"  • Claim TX: {display_claim.get('claim_tx_hash')}")
-                    
-                    # Note developer bug for L2-L2 message claims
-                    if claim_type == 'asset' and display_claim.get('amount') == '0':
-                        BridgeLogger.warning("⚠️ Developer bug: L2-L2 message claims show type 'asset' instead of 'message'")
-                    
-                    if claim_status == "completed":
-                        BridgeLogger.success("🎉 Claim is COMPLETE!")
-                    else:
-                        BridgeLogger.error(f"❌ Claim status is not completed: {claim_status}")
-                        return False
-                    
-                    # Show both statuses if we found both
-                    if completed_claim and our_claim:
-                        BridgeLogger.info(f"Note: Found both PENDING and COMPLETED entries (normal behavior)")
+                if claim_status == "completed":
+                    BridgeLogger.success("🎉 Claim is COMPLETE!")
                 else:
-                    BridgeLogger.error("❌ Our specific claim not found in claims API")
-                    # Show a few recent claims for debugging
-                    if claims:
-                        BridgeLogger.info("Recent claims for reference:")
-                        for i, claim in enumerate(claims[:3]):
-                            BridgeLogger.info(f"  {i+1}. Type: {claim.get('type')}, Status: {claim.get('status')}, TX: {claim.get('claim_tx_hash', 'N/A')[:10]}...")
+                    BridgeLogger.error(f"❌ Claim status is not completed: {claim_status}")
                     return False
-                    
-            except json.JSONDecodeError as e:
-                BridgeLogger.warning(f"Could not parse claims response: {e}")
+                
+                # Show both statuses if we found both
+                if completed_claim and our_claim:
+                    BridgeLogger.info(f"Note: Found both PENDING and COMPLETED entries (normal behavior)")
+            else:
+                BridgeLogger.error("❌ Our specific claim not found in claims API")
+                # Show a few recent claims for debugging
+                if claims:
+                    BridgeLogger.info("Recent claims for reference:")
+                    for i, claim in enumerate(claims[:3]):
+                        BridgeLogger.info(f"  {i+1}. Type: {claim.get('type')}, Status: {claim.get('status')}, TX: {claim.get('claim_tx_hash', 'N/A')[:10]}...")
                 return False
         else:
-            BridgeLogger.warning(f"Could not get claims data: {output}")
+            BridgeLogger.warning("Could not get claims data")
             return False
         
         # Final success summary
@@ -426,7 +516,6 @@ def run_l2_to_l2_message_bridge_test(message: str = "L2-1 to L2-2 Message"):
         BridgeLogger.info("✅ 6. aggsandbox show claims --json (verification)")
         
         print(f"\n📊 Transaction Summary:")
-        bridge_tx = BridgeUtils.get_bridge_tx_hash(our_bridge)
         BridgeLogger.info(f"Bridge TX (L2-1): {bridge_tx}")
         BridgeLogger.info(f"Claim TX (L2-2):  {claim_tx_hash}")
         BridgeLogger.info(f"Message Data:     {message_data}")
@@ -453,14 +542,27 @@ def main():
     """Main function to run the L2-L2 message bridge test"""
     
     # Parse command line arguments
-    if len(sys.argv) > 1:
-        message = sys.argv[1]
+    parser = argparse.ArgumentParser(description="L2-L2 message bridge test")
+    parser.add_argument("message", nargs="?", default="L2-1 to L2-2 Message",
+                        help="Message to bridge")
+    parser.add_argument("--messages", help="Comma-separated messages, each bridged by its own test run")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of test runs to execute in parallel")
+    args = parser.parse_args()
+    messages = args.messages.split(",") if args.messages else [args.message]
+    
+    # Run the L2-L2 message bridge test for each message
+    jobs = min(args.jobs, len(messages))
+    if jobs > 1:
+        # Runs spend their time waiting on the sandbox, so they overlap well across processes
+        tx_lock = multiprocessing.Lock()
+        with multiprocessing.Pool(jobs, initializer=_init_worker, initargs=(tx_lock,)) as pool:
+            results = pool.map(run_l2_to_l2_message_bridge_test, messages)
     else:
-        # Default message
-        message = "L2-1 to L2-2 Message"
+        results = [run_l2_to_l2_message_bridge_test(message) for message in messages]
     
-    # Run the L2-L2 message bridge test
-    success = run_l2_to_l2_message_bridge_test(message)
+    if len(messages) > 1:
+        print(f"\n📊 {sum(results)}/{len(messages)} message bridge tests passed")
+    success = all(results)
     
     if success:
         print(f"\n🎉 SUCCESS: L2→L2 message bridge test completed!")
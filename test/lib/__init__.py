@@ -4,16 +4,42 @@ Bridge Test Library - Python Package
 Modular bridge testing library for Agglayer Nether Sandbox
 """
 
+import os
+import importlib
+
 from .bridge_lib import (
-    NetworkID, BridgeConfig, BridgeLogger, BridgeEnvironment,
+    NetworkID, BridgeConfig, BridgeIndex, ClaimIndex, BridgeLogger, BridgeEnvironment,
     AggsandboxAPI, BridgeUtils, BRIDGE_CONFIG
 )
-from .bridge_asset import BridgeAsset
-from .bridge_message import BridgeMessage
-from .claim_asset import ClaimAsset
-from .claim_message import ClaimMessage
-from .bridge_and_call import BridgeAndCall
-from .claim_bridge_and_call import ClaimBridgeAndCall
+
+# Operation classes and helpers are imported on first access (PEP 562),
+# so a test only loads the modules it actually uses
+_LAZY = {
+    'BridgeAsset': '.bridge_asset',
+    'BridgeMessage': '.bridge_message',
+    'ClaimAsset': '.claim_asset',
+    'ClaimMessage': '.claim_message',
+    'BridgeAndCall': '.bridge_and_call',
+    'ClaimBridgeAndCall': '.claim_bridge_and_call',
+    'AggsandboxClient': '.aggsandbox_api',
+    'RPCClient': '.rpc_client',
+    'RPCError': '.rpc_client',
+    'decode_abi': '.rpc_client',
+    'encode_abi': '.rpc_client',
+    'signature_types': '.rpc_client',
+    'load_artifact': '.artifacts',
+    'deploy_artifact': '.artifacts',
+    'load_deployment': '.artifacts',
+    'save_deployment': '.artifacts',
+    'deployment_lock': '.artifacts',
+}
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Initialize environment on import
 def init_bridge_environment():
@@ -21,15 +47,13 @@ def init_bridge_environment():
     BridgeLogger.step("Initializing bridge test environment")
     
     try:
-        # Load environment variables
-        config = BridgeEnvironment.load_environment()
-        
-        # Validate sandbox status
-        if not BridgeEnvironment.validate_sandbox_status():
+        # Load environment variables while validating sandbox status
+        config = BridgeEnvironment.load_environment_and_validate()
+        if config is None:
             return False
         
         # Print configuration if verbose/debug
-        if os.environ.get('VERBOSE') == '1' or os.environ.get('DEBUG') == '1':
+        if os.environ.get('VERBOSE') == '1' or BridgeLogger.debug_enabled:
             print_test_config(config)
         
         BridgeLogger.success("Bridge test environment initialized successfully")
@@ -81,13 +105,18 @@ __author__ = "Agglayer Team"
 # Export all main classes and functions
 __all__ = [
     # Core classes
-    'NetworkID', 'BridgeConfig', 'BridgeLogger', 'BridgeEnvironment',
-    'AggsandboxAPI', 'BridgeUtils', 'BRIDGE_CONFIG',
+    'NetworkID', 'BridgeConfig', 'BridgeIndex', 'ClaimIndex', 'BridgeLogger', 'BridgeEnvironment',
+    'AggsandboxAPI', 'AggsandboxClient', 'BridgeUtils', 'BRIDGE_CONFIG',
     
     # Operation classes
     'BridgeAsset', 'BridgeMessage', 'ClaimAsset', 'ClaimMessage',
     'BridgeAndCall', 'ClaimBridgeAndCall',
     
+    # RPC client
+    'RPCClient', 'RPCError', 'decode_abi', 'encode_abi', 'signature_types',
+    'load_artifact', 'deploy_artifact',
+    'load_deployment', 'save_deployment', 'deployment_lock',
+    
     # Utility functions
     'init_bridge_environment', 'print_test_config', 'print_bridge_summary'
 ]
@@ -4,11 +4,181 @@ AggsandboxAPI - Complete Python wrapper for aggsandbox CLI
 Based on the actual CLI source code and cli-reference.md
 """
 
+import os
+import atexit
+import asyncio
 import subprocess
+import re
 import json
+import shlex
+import shutil
 import time
-from typing import Optional, Dict, Any, List, Tuple
-from dataclasses import dataclass
+import hashlib
+import inspect
+import functools
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Iterator, AsyncIterator, Callable, Sequence, Union
+from dataclasses import dataclass, field, asdict
+from collections.abc import Mapping
+from urllib.parse import urlparse
+from rpc_client import RPCClient, RPCError
+
+try:
+    # orjson is optional; it parses the large show bridges/claims responses several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Print every CLI command before running it (AGGSANDBOX_API_TRACE=1, or DEBUG=1
+# like BridgeLogger.debug). Read once, so poll loops don't pay for it per call.
+_TRACE = os.environ.get("AGGSANDBOX_API_TRACE") == "1" or os.environ.get("DEBUG") == "1"
+
+# A whitespace-delimited 32-byte hex transaction hash
+TX_HASH_RE = re.compile(r'(?<!\S)0x[0-9a-fA-F]{64}(?!\S)')
+
+@functools.lru_cache(maxsize=None)
+def _marked_tx_re(marker: str) -> re.Pattern:
+    """Regex for the first tx hash on a line containing marker (case-insensitive)
+    
+    One search over the whole output replaces splitting it into lines and
+    lowercasing and scanning each of them in Python.
+    """
+    return re.compile(r'^(?=[^\n]*?%s)[^\n]*?(?<!\S)(0x[0-9a-fA-F]{64})(?!\S)' % re.escape(marker),
+                      re.IGNORECASE | re.MULTILINE)
+
+# Parsed query results keyed by e.g. (kind, network_id). An entry is only reused
+# while the query keeps returning byte-identical output, so polls of an unchanged
+# indexer skip the JSON parse entirely. Results served from the TTL cache are the
+# very same string object, which skips hashing the output as well.
+_PARSED_CACHE: Dict[tuple, Tuple[Union[str, bytes], bytes, Any]] = {}
+
+def _parse_cached(key: tuple, output: Union[str, bytes],
+                  parse: Callable[[Union[str, bytes]], Any] = json_loads) -> Any:
+    """Parse query output, reusing the previous result if the output is unchanged"""
+    cached = _PARSED_CACHE.get(key)
+    if cached and cached[0] is output:
+        return cached[2]
+    raw = output if isinstance(output, bytes) else output.encode()
+    digest = hashlib.blake2b(raw, digest_size=8).digest()
+    if cached and cached[1] == digest:
+        _PARSED_CACHE[key] = (output, digest, cached[2])
+        return cached[2]
+    parsed = parse(output)
+    _PARSED_CACHE[key] = (output, digest, parsed)
+    return parsed
+
+# Successful read-only query results keyed by (method, epoch, bound arguments),
+# with the monotonic time the query returned
+_cache: Dict[tuple, Tuple[float, Tuple[bool, str]]] = {}
+
+# Bumped by every successful bridge or claim, which changes what the queries
+# return. It is part of the cache key, so caches passed in by callers are
+# invalidated too.
+_cache_epoch = 0
+
+def _state_changed(result: Tuple[bool, str]) -> Tuple[bool, str]:
+    """Invalidate cached query results if a state-changing command succeeded"""
+    global _cache_epoch
+    if result[0]:
+        _cache_epoch += 1
+        _cache.clear()
+    return result
+
+def _ttl_cached(func):
+    """Let callers reuse a recent result of a read-only query by passing ttl_ms
+    
+    Each caller's own ttl_ms is checked against the age of the stored result,
+    so a long-TTL caller never makes a short-TTL caller see stale data.
+    ttl_ms=0 (the default) always re-queries and drops the stored result.
+    Results are stored in the module-wide cache unless a cache dict is passed.
+    """
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, ttl_ms: int = 0, cache: Optional[dict] = None, **kwargs) -> Tuple[bool, str]:
+        store = _cache if cache is None else cache
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__name__, _cache_epoch, tuple(bound.arguments.items()))
+        
+        if ttl_ms <= 0:
+            store.pop(key, None)
+            return func(*args, **kwargs)
+        
+        cached = store.get(key)
+        if cached and time.monotonic() - cached[0] < ttl_ms / 1000:
+            return cached[1]
+        
+        result = func(*args, **kwargs)
+        if result[0]:
+            # Stamped after the query returns, so its duration doesn't eat into the window
+            store[key] = (time.monotonic(), result)
+        return result
+    
+    wrapper.ttl_cached = True
+    return wrapper
+
+# Most `show bridges|claims` queries a batch runs at once
+_BATCH_WORKERS = 4
+
+def _drop_cached(store: dict, func_name: str, arguments: tuple):
+    """Drop stored results of one _ttl_cached query, in every epoch"""
+    for key in [key for key in store if key[0] == func_name and key[2] == arguments]:
+        del store[key]
+
+# Successful `info` results. The sandbox configuration doesn't change while it
+# runs, so these are kept until start, stop or restart is called (_sandbox_reset).
+_INFO_CACHE: Dict[Tuple[bool, bool, Optional[str]], Tuple[bool, str]] = {}
+
+# `is-claimed --json` output for bridges already seen as claimed, keyed by
+# (network, index, source_network). A claim can't be undone, so these are kept
+# until the sandbox is started, stopped or restarted.
+_CLAIMED: Dict[Tuple[int, int, int], str] = {}
+
+def _sandbox_reset():
+    """Drop everything cached about the sandbox; start, stop and restart replace its chains"""
+    _INFO_CACHE.clear()
+    _CLAIMED.clear()
+    _state_changed((True, ""))
+
+# Final states of a sponsored claim, and whether they mean it succeeded
+_CLAIM_SETTLED = {"success": True, "failed": False}
+
+_JSON_DECODER = json.JSONDecoder()
+
+def _claim_status_field(output: str) -> Optional[str]:
+    """The status field of the first JSON object in claim_status output that has one"""
+    pos = output.find('{')
+    while pos != -1:
+        try:
+            data, end = _JSON_DECODER.raw_decode(output, pos)
+        except json.JSONDecodeError:
+            pos = output.find('{', pos + 1)
+            continue
+        if isinstance(data, dict) and isinstance(data.get('status'), str):
+            return data['status']
+        pos = output.find('{', end)
+    return None
+
+_ARRAY_SEPARATOR_RE = re.compile(r'[\s,]*')
+
+def _iter_json_array(output: str, key: str) -> Iterator[Any]:
+    """Decode the items of the `key` array in a JSON object one at a time"""
+    start = re.search(r'"%s"\s*:\s*\[' % re.escape(key), output)
+    if not start:
+        return
+    pos = start.end()
+    try:
+        while True:
+            pos = _ARRAY_SEPARATOR_RE.match(output, pos).end()
+            if pos >= len(output) or output[pos] == ']':
+                return
+            item, pos = _JSON_DECODER.raw_decode(output, pos)
+            yield item
+    except json.JSONDecodeError as e:
+        print(f"ERROR: Could not parse {key} JSON: {e}")
 
 @dataclass
 class BridgeAssetArgs:
@@ -22,7 +192,7 @@ class BridgeAssetArgs:
     gas_price: Optional[str] = None
     private_key: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BridgeClaimArgs:
     """Arguments for bridge claim command"""
     network: int
@@ -47,22 +217,382 @@ class BridgeUtilsArgs:
     source_network: Optional[int] = None
     private_key: Optional[str] = None
 
+@dataclass(eq=False)
+class ShowResponse(Mapping):
+    """Read-only Mapping view of a JSON `show` response
+    
+    get_bridges and get_claims return this, not a dict: `data["bridges"]`,
+    `data.get(...)` and iteration work, item assignment doesn't (copy with
+    dict(data) first). The output is parsed once, through _parse_cached, so a
+    poll that returns unchanged output reuses the previous parse. Build it with
+    ShowResponse.parse, which returns None for output that isn't valid JSON.
+    """
+    raw: Union[str, bytes]
+    cache_key: tuple
+    _parsed: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    
+    @classmethod
+    def parse(cls, raw: Union[str, bytes], cache_key: tuple) -> Optional["ShowResponse"]:
+        """Wrap query output, or return None if it isn't valid JSON"""
+        response = cls(raw, cache_key)
+        return response if response.data is not None else None
+    
+    @property
+    def data(self) -> Optional[Dict[str, Any]]:
+        """The parsed response, or None if the output isn't valid JSON"""
+        if self._parsed is None:
+            try:
+                self._parsed = _parse_cached(self.cache_key, self.raw)
+            except json.JSONDecodeError as e:
+                print(f"ERROR: Could not parse {self.cache_key[0]} JSON: {e}")
+                return None
+        return self._parsed
+    
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+    
+    def __len__(self) -> int:
+        return len(self.data)
+
+# Command specs for the CLI wrappers below. "required" options are always
+# passed, "flags" are passed when true, "kv" options when set, and
+# "positional" arguments go last. Keys are the wrapper's parameter names.
+_LOG_FLAGS = {"verbose": "--verbose", "quiet": "--quiet"}
+_LOG_KV = {"log_format": "--log-format"}
+
+_SPECS: Dict[str, Dict[str, Any]] = {
+    # Core commands
+    "start": {
+        "subcmd": ["start"],
+        "flags": {"detach": "--detach", "build": "--build", "fork": "--fork",
+                  "multi_l2": "--multi-l2", "claim_all": "--claim-all", **_LOG_FLAGS},
+        "kv": _LOG_KV,
+    },
+    "stop": {"subcmd": ["stop"], "flags": {"volumes": "--volumes", **_LOG_FLAGS}, "kv": _LOG_KV},
+    "restart": {"subcmd": ["restart"], "flags": _LOG_FLAGS, "kv": _LOG_KV},
+    "status": {"subcmd": ["status"], "flags": _LOG_FLAGS, "kv": _LOG_KV},
+    "info": {"subcmd": ["info"], "flags": _LOG_FLAGS, "kv": _LOG_KV},
+    "logs": {
+        "subcmd": ["logs"],
+        "flags": {"follow": "--follow", **_LOG_FLAGS},
+        "kv": {"tail": "--tail", "since": "--since", **_LOG_KV},
+        "positional": ["service"],
+    },
+    # Bridge commands
+    "bridge_asset": {
+        "subcmd": ["bridge", "asset"],
+        "required": {"network": "--network-id", "destination_network": "--destination-network-id",
+                     "amount": "--amount", "token_address": "--token-address"},
+        "kv": {"to_address": "--to-address", "gas_limit": "--gas-limit",
+               "gas_price": "--gas-price", "private_key": "--private-key"},
+    },
+    "bridge_claim": {
+        "subcmd": ["bridge", "claim"],
+        "required": {"network": "--network-id", "tx_hash": "--tx-hash",
+                     "source_network": "--source-network-id"},
+        "kv": {"deposit_count": "--deposit-count", "token_address": "--token-address",
+               "gas_limit": "--gas-limit", "gas_price": "--gas-price",
+               "private_key": "--private-key", "data": "--data", "msg_value": "--msg-value"},
+    },
+    "bridge_message": {
+        "subcmd": ["bridge", "message"],
+        "required": {"network": "--network-id", "destination_network": "--destination-network-id",
+                     "target": "--target", "data": "--data"},
+        "kv": {"amount": "--amount", "fallback_address": "--fallback-address",
+               "gas_limit": "--gas-limit", "gas_price": "--gas-price", "private_key": "--private-key"},
+    },
+    "bridge_and_call": {
+        "subcmd": ["bridge", "bridge-and-call"],
+        "required": {"network": "--network-id", "destination_network": "--destination-network-id",
+                     "token": "--token", "amount": "--amount", "target": "--target",
+                     "data": "--data", "fallback": "--fallback"},
+        "flags": _LOG_FLAGS,
+        "kv": {"gas_limit": "--gas-limit", "gas_price": "--gas-price",
+               "private_key": "--private-key", "msg_value": "--msg-value", **_LOG_KV},
+    },
+    # Information commands
+    "show_bridges": {
+        "subcmd": ["show", "bridges"],
+        "required": {"network_id": "--network-id"},
+        "flags": {"json_output": "--json", **_LOG_FLAGS},
+        "kv": _LOG_KV,
+    },
+    "show_claims": {
+        "subcmd": ["show", "claims"],
+        "required": {"network_id": "--network-id"},
+        "flags": {"json_output": "--json", **_LOG_FLAGS},
+        "kv": _LOG_KV,
+    },
+    "show_claim_proof": {
+        "subcmd": ["show", "claim-proof"],
+        "required": {"network_id": "--network-id", "leaf_index": "--leaf-index",
+                     "deposit_count": "--deposit-count"},
+        "flags": {"json_output": "--json", **_LOG_FLAGS},
+        "kv": _LOG_KV,
+    },
+    "show_l1_info_tree_index": {
+        "subcmd": ["show", "l1-info-tree-index"],
+        "required": {"network_id": "--network-id", "deposit_count": "--deposit-count"},
+        "flags": {"json_output": "--json", **_LOG_FLAGS},
+        "kv": _LOG_KV,
+    },
+    # Bridge utilities
+    "bridge_utils_get_mapped": {
+        "subcmd": ["bridge", "utils", "get-mapped"],
+        "required": {"network": "--network-id", "origin_network": "--origin-network",
+                     "origin_token": "--origin-token"},
+        "flags": {"json_output": "--json"},
+        "kv": {"private_key": "--private-key"},
+    },
+    "bridge_utils_precalculate": {
+        "subcmd": ["bridge", "utils", "precalculate"],
+        "required": {"network": "--network-id", "origin_network": "--origin-network",
+                     "origin_token": "--origin-token"},
+        "flags": {"json_output": "--json"},
+    },
+    "bridge_utils_get_origin": {
+        "subcmd": ["bridge", "utils", "get-origin"],
+        "required": {"network": "--network-id", "wrapped_token": "--wrapped-token"},
+        "flags": {"json_output": "--json"},
+    },
+    "bridge_utils_is_claimed": {
+        "subcmd": ["bridge", "utils", "is-claimed"],
+        "required": {"network": "--network-id", "index": "--index",
+                     "source_network": "--source-network"},
+        "flags": {"json_output": "--json"},
+        "kv": {"private_key": "--private-key"},
+    },
+    "bridge_utils_build_payload": {
+        "subcmd": ["bridge", "utils", "build-payload"],
+        "required": {"tx_hash": "--tx-hash", "source_network": "--source-network"},
+        "flags": {"json_output": "--json"},
+        "kv": {"bridge_index": "--bridge-index"},
+    },
+    "bridge_utils_compute_index": {
+        "subcmd": ["bridge", "utils", "compute-index"],
+        "required": {"local_index": "--local-index", "source_network": "--source-network"},
+        "flags": {"json_output": "--json"},
+    },
+    "bridge_utils_network_id": {
+        "subcmd": ["bridge", "utils", "network-id"],
+        "required": {"network": "--network-id"},
+        "flags": {"json_output": "--json", **_LOG_FLAGS},
+        "kv": {"private_key": "--private-key", **_LOG_KV},
+    },
+    # Claim sponsor commands
+    "sponsor_claim": {
+        "subcmd": ["sponsor-claim"],
+        "required": {"deposit": "--deposit", "origin_network": "--origin-network",
+                     "destination_network": "--destination-network"},
+        "flags": _LOG_FLAGS,
+        "kv": _LOG_KV,
+    },
+    "claim_status": {
+        "subcmd": ["claim-status"],
+        "required": {"global_index": "--global-index", "network_id": "--network-id"},
+        "flags": _LOG_FLAGS,
+        "kv": _LOG_KV,
+    },
+    # Event monitoring
+    "events": {
+        "subcmd": ["events"],
+        "required": {"network_id": "--network-id", "blocks": "--blocks"},
+        "flags": _LOG_FLAGS,
+        "kv": {"address": "--address", **_LOG_KV},
+    },
+}
+
+@functools.lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str:
+    """Absolute path of a command on PATH, or the name itself if it isn't found"""
+    return shutil.which(name) or name
+
+def _spawn_argv(cmd: Sequence[str]) -> List[str]:
+    """argv with an absolute executable path, which lets subprocess use posix_spawn
+    
+    CPython only takes the posix_spawn fast path for an executable with a
+    directory part and close_fds=False. Leaving fds open is safe because Python
+    creates them non-inheritable.
+    """
+    return [_resolve_executable(cmd[0]), *cmd[1:]]
+
+def _compile_spec(spec: Dict[str, Any]) -> tuple:
+    return (
+        ("aggsandbox", *spec["subcmd"]),
+        tuple(spec.get("required", {}).items()),
+        tuple(spec.get("flags", {}).items()),
+        tuple(spec.get("kv", {}).items()),
+        tuple(spec.get("positional", ())),
+    )
+
+# Specs flattened to tuples once, so building a command skips the dict lookups
+# and the throwaway two-item lists
+_COMPILED_SPECS = {name: _compile_spec(spec) for name, spec in _SPECS.items()}
+
+def _build_cmd(name: str, **kw) -> List[str]:
+    """Build the aggsandbox argv for a command from its spec and the wrapper's arguments"""
+    prefix, required, flags, kv, positional = _COMPILED_SPECS[name]
+    cmd = list(prefix)
+    append = cmd.append
+    for key, flag in required:
+        append(flag)
+        append(str(kw[key]))
+    for key, flag in flags:
+        if kw.get(key):
+            append(flag)
+    for key, flag in kv:
+        value = kw.get(key)
+        if value is not None:
+            append(flag)
+            append(str(value))
+    for key in positional:
+        if kw.get(key):
+            append(str(kw[key]))
+    return cmd
+
+class AggsandboxHTTPClient:
+    """Keep-alive client for the bridge service REST API behind `aggsandbox show`
+    
+    The read-only `show ... --json` queries print the API response unchanged,
+    so they can read it directly over a pooled connection instead of spawning
+    the CLI (and a new HTTP connection) each time. This is opt-in: set
+    AGGSANDBOX_HTTP_API=1 to use it. The API URL is taken from API_BASE_URL in
+    the environment or ./.env; sandboxes configured through an aggsandbox.toml
+    or .yaml file should keep going through the CLI.
+    """
+    
+    _local = threading.local()
+    
+    @staticmethod
+    def enabled() -> bool:
+        """Whether show queries should bypass the CLI"""
+        return os.environ.get("AGGSANDBOX_HTTP_API") == "1"
+    
+    @staticmethod
+    def api_base_url() -> str:
+        """API_BASE_URL as the CLI sees it: the environment first, then ./.env"""
+        base_url = os.environ.get("API_BASE_URL")
+        if base_url is None:
+            try:
+                with open(".env") as f:
+                    for line in f:
+                        key, sep, value = line.strip().partition("=")
+                        if sep and key.strip() == "API_BASE_URL":
+                            base_url = value.strip()
+            except FileNotFoundError:
+                pass
+        return (base_url or "http://localhost:5577").rstrip("/")
+    
+    @staticmethod
+    def base_url(network_id: int) -> str:
+        """API base URL for a network, like the CLI's Config::get_api_base_url
+        
+        Networks 2 and 3 are served by aggkit-l3 on port 5578 of the same host.
+        """
+        base_url = AggsandboxHTTPClient.api_base_url()
+        if network_id in (2, 3):
+            url = urlparse(base_url)
+            host = url.hostname or "localhost"
+            return url._replace(netloc=f"{host}:5578").geturl()
+        return base_url
+    
+    @staticmethod
+    def get(network_id: int, path: str, timeout: int = 30) -> Tuple[bool, str]:
+        """GET an API path and return (success, body)"""
+        success, body = AggsandboxHTTPClient.get_bytes(network_id, path, timeout)
+        return success, body.decode().strip()
+    
+    @staticmethod
+    def get_bytes(network_id: int, path: str, timeout: int = 30) -> Tuple[bool, bytes]:
+        """GET an API path and return (success, undecoded body)
+        
+        The body is returned as received. JSON parsers ignore surrounding
+        whitespace, so it isn't stripped (which would copy the whole buffer).
+        """
+        url = urlparse(AggsandboxHTTPClient.base_url(network_id) + path)
+        connections = AggsandboxHTTPClient._local.__dict__.setdefault("connections", {})
+        target = url.path + (f"?{url.query}" if url.query else "")
+        
+        for attempt in range(2):
+            conn = connections.get(url.netloc)
+            if conn is None:
+                conn_cls = (http.client.HTTPSConnection if url.scheme == "https"
+                            else http.client.HTTPConnection)
+                conn = connections[url.netloc] = conn_cls(url.netloc, timeout=timeout)
+            try:
+                conn.request("GET", target)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                # Drop the connection; retry once in case the idle keep-alive was closed
+                conn.close()
+                connections.pop(url.netloc, None)
+                if attempt:
+                    return False, f"API request to {url.geturl()} failed: {e}".encode()
+                continue
+            
+            if response.status != 200:
+                return False, (f"API request to {url.geturl()} failed with status "
+                               f"{response.status}: ").encode() + body
+            return True, body
+    
+    @staticmethod
+    def show_bridges(network_id: int) -> Tuple[bool, str]:
+        """Raw JSON for `aggsandbox show bridges --json`"""
+        return AggsandboxHTTPClient.get(network_id, f"/bridge/v1/bridges?network_id={network_id}")
+    
+    @staticmethod
+    def show_claims(network_id: int) -> Tuple[bool, str]:
+        """Raw JSON for `aggsandbox show claims --json`"""
+        return AggsandboxHTTPClient.get(network_id, f"/bridge/v1/claims?network_id={network_id}")
+    
+    @staticmethod
+    def show_claim_proof(network_id: int, leaf_index: int, deposit_count: int) -> Tuple[bool, str]:
+        """Raw JSON for `aggsandbox show claim-proof --json`"""
+        return AggsandboxHTTPClient.get(
+            network_id,
+            f"/bridge/v1/claim-proof?network_id={network_id}"
+            f"&leaf_index={leaf_index}&deposit_count={deposit_count}"
+        )
+    
+    @staticmethod
+    def show_l1_info_tree_index(network_id: int, deposit_count: int) -> Tuple[bool, str]:
+        """Raw JSON for `aggsandbox show l1-info-tree-index --json`"""
+        return AggsandboxHTTPClient.get(
+            network_id,
+            f"/bridge/v1/l1-info-tree-index?network_id={network_id}&deposit_count={deposit_count}"
+        )
+    
+    @staticmethod
+    def close():
+        """Close this thread's pooled API connections"""
+        connections = AggsandboxHTTPClient._local.__dict__.get("connections", {})
+        for conn in connections.values():
+            conn.close()
+        connections.clear()
+
+atexit.register(AggsandboxHTTPClient.close)
+
 class AggsandboxAPI:
     """Complete wrapper for aggsandbox CLI commands"""
     
     @staticmethod
-    def run_command(cmd: List[str], timeout: int = 30) -> Tuple[bool, str]:
+    def run_command(cmd: Sequence[str], timeout: int = 30) -> Tuple[bool, str]:
         """Run aggsandbox command and return (success, output)"""
-        # Always print the full command being executed
-        print(f"🔧 Executing: {' '.join(cmd)}")
+        if _TRACE:
+            print(f"🔧 Executing: {shlex.join(cmd)}")
         
         try:
             result = subprocess.run(
-                cmd, 
+                _spawn_argv(cmd), 
                 capture_output=True, 
                 text=True, 
                 check=True,
-                timeout=timeout
+                timeout=timeout,
+                close_fds=False
             )
             return True, result.stdout.strip()
         except subprocess.CalledProcessError as e:
@@ -70,6 +600,91 @@ class AggsandboxAPI:
         except subprocess.TimeoutExpired:
             return False, f"Command timed out after {timeout} seconds"
     
+    @staticmethod
+    def run_command_bytes(cmd: Sequence[str], timeout: int = 30) -> Tuple[bool, bytes]:
+        """Run aggsandbox command and return (success, undecoded output)
+        
+        For JSON output that goes straight to the parser, which accepts bytes,
+        so it isn't decoded to str first. Successful output isn't stripped either,
+        as that would copy the whole buffer and the parser ignores the trailing
+        newline anyway.
+        """
+        if _TRACE:
+            print(f"🔧 Executing: {shlex.join(cmd)}")
+        
+        try:
+            result = subprocess.run(_spawn_argv(cmd), capture_output=True, check=True,
+                                    timeout=timeout, close_fds=False)
+            return True, result.stdout
+        except subprocess.CalledProcessError as e:
+            return False, (e.stderr or e.stdout or b"").strip()
+        except subprocess.TimeoutExpired:
+            return False, f"Command timed out after {timeout} seconds".encode()
+    
+    @staticmethod
+    def run_command_streaming(cmd: Sequence[str], pattern: re.Pattern,
+                              timeout: int = 30) -> Tuple[bool, str]:
+        """Run aggsandbox command until a line of its output matches pattern
+        
+        Lines are scanned as the command prints them and it is stopped at the
+        first match, so callers that only need e.g. the submitted tx hash don't
+        wait for the rest of the run. Returns (True, first group of the match),
+        otherwise (False, output), also when the command succeeds without a match.
+        """
+        if _TRACE:
+            print(f"🔧 Executing: {shlex.join(cmd)}")
+        
+        proc = subprocess.Popen(_spawn_argv(cmd), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, bufsize=1, close_fds=False)
+        timed_out = threading.Event()
+        
+        def kill():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        output = []
+        try:
+            for line in proc.stdout:
+                match = pattern.search(line)
+                if match:
+                    proc.terminate()
+                    return True, match.group(1)
+                output.append(line)
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+            proc.wait()
+        
+        if timed_out.is_set():
+            return False, f"Command timed out after {timeout} seconds"
+        return False, ''.join(output).strip()
+    
+    @staticmethod
+    async def run_command_async(cmd: Sequence[str], timeout: int = 30) -> Tuple[bool, str]:
+        """Run aggsandbox command on the running event loop and return (success, output)"""
+        if _TRACE:
+            print(f"🔧 Executing: {shlex.join(cmd)}")
+        
+        proc = await asyncio.create_subprocess_exec(
+            *_spawn_argv(cmd), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            close_fds=False
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False, f"Command timed out after {timeout} seconds"
+        except asyncio.CancelledError:
+            proc.kill()
+            raise
+        
+        if proc.returncode != 0:
+            return False, (stderr or stdout).decode().strip()
+        return True, stdout.decode().strip()
+    
     # ============================================================================
     # CORE COMMANDS
     # ============================================================================
@@ -90,26 +705,8 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = ["aggsandbox", "start"]
-        
-        if detach:
-            cmd.append("--detach")
-        if build:
-            cmd.append("--build")
-        if fork:
-            cmd.append("--fork")
-        if multi_l2:
-            cmd.append("--multi-l2")
-        if claim_all:
-            cmd.append("--claim-all")
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
-        
-        return AggsandboxAPI.run_command(cmd)
+        _sandbox_reset()
+        return _state_changed(AggsandboxAPI.run_command(_build_cmd("start", **locals())))
     
     @staticmethod
     def stop(volumes: bool = False, verbose: bool = False, quiet: bool = False,
@@ -122,18 +719,8 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = ["aggsandbox", "stop"]
-        
-        if volumes:
-            cmd.append("--volumes")
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
-        
-        return AggsandboxAPI.run_command(cmd)
+        _sandbox_reset()
+        return _state_changed(AggsandboxAPI.run_command(_build_cmd("stop", **locals())))
     
     @staticmethod
     def restart(verbose: bool = False, quiet: bool = False,
@@ -148,16 +735,8 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = ["aggsandbox", "restart"]
-        
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
-        
-        return AggsandboxAPI.run_command(cmd)
+        _sandbox_reset()
+        return _state_changed(AggsandboxAPI.run_command(_build_cmd("restart", **locals())))
     
     @staticmethod
     def status(quiet: bool = False, verbose: bool = False, 
@@ -169,16 +748,7 @@ class AggsandboxAPI:
             verbose: Enable verbose output
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = ["aggsandbox", "status"]
-        
-        if quiet:
-            cmd.append("--quiet")
-        if verbose:
-            cmd.append("--verbose")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
-        
-        return AggsandboxAPI.run_command(cmd)
+        return AggsandboxAPI.run_command(_build_cmd("status", **locals()))
     
     @staticmethod
     def info(verbose: bool = False, quiet: bool = False, log_format: Optional[str] = None) -> Tuple[bool, str]:
@@ -189,16 +759,14 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings  
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = ["aggsandbox", "info"]
-        
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
-        
-        return AggsandboxAPI.run_command(cmd)
+        cmd = _build_cmd("info", **locals())
+        key = (verbose, quiet, log_format)
+        if key not in _INFO_CACHE:
+            result = AggsandboxAPI.run_command(cmd)
+            if not result[0]:
+                return result
+            _INFO_CACHE[key] = result
+        return _INFO_CACHE[key]
     
     @staticmethod
     def logs(follow: bool = False, tail: Optional[int] = None, 
@@ -216,24 +784,54 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = ["aggsandbox", "logs"]
-        
-        if follow:
-            cmd.append("--follow")
-        if tail:
-            cmd.extend(["--tail", str(tail)])
-        if since:
-            cmd.extend(["--since", since])
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
-        if service:
-            cmd.append(service)
-        
-        return AggsandboxAPI.run_command(cmd)
+        return AggsandboxAPI.run_command(_build_cmd("logs", **locals()))
+    
+    @staticmethod
+    def logs_stream(follow: bool = True, tail: Optional[int] = None,
+                    since: Optional[str] = None, service: Optional[str] = None,
+                    verbose: bool = False, quiet: bool = False,
+                    log_format: Optional[str] = None) -> Iterator[str]:
+        """Yield service log lines as they are written, without buffering them
+        
+        Takes the same arguments as logs(). With follow the CLI never exits on its
+        own, so stop iterating (or close the generator) when done; the process is
+        terminated then.
+        """
+        cmd = _build_cmd("logs", **locals())
+        if _TRACE:
+            print(f"🔧 Executing: {shlex.join(cmd)}")
+        
+        proc = subprocess.Popen(_spawn_argv(cmd), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, bufsize=1, close_fds=False)
+        try:
+            yield from proc.stdout
+        finally:
+            if proc.poll() is None:
+                proc.terminate()
+            proc.stdout.close()
+            proc.wait()
+    
+    @staticmethod
+    async def logs_stream_async(follow: bool = True, tail: Optional[int] = None,
+                                since: Optional[str] = None, service: Optional[str] = None,
+                                verbose: bool = False, quiet: bool = False,
+                                log_format: Optional[str] = None) -> AsyncIterator[str]:
+        """Async variant of logs_stream"""
+        cmd = _build_cmd("logs", **locals())
+        if _TRACE:
+            print(f"🔧 Executing: {shlex.join(cmd)}")
+        
+        proc = await asyncio.create_subprocess_exec(
+            *_spawn_argv(cmd), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+            close_fds=False
+        )
+        try:
+            async for line in proc.stdout:
+                yield line.decode(errors="replace")
+        finally:
+            if proc.returncode is None:
+                proc.terminate()
+            await proc.wait()
     
     # ============================================================================
     # BRIDGE COMMANDS
@@ -242,51 +840,24 @@ class AggsandboxAPI:
     @staticmethod
     def bridge_asset(args: BridgeAssetArgs) -> Tuple[bool, str]:
         """Bridge ERC20 tokens or ETH between networks"""
-        cmd = [
-            "aggsandbox", "bridge", "asset",
-            "--network-id", str(args.network),
-            "--destination-network-id", str(args.destination_network),
-            "--amount", str(args.amount),
-            "--token-address", args.token_address
-        ]
-        
-        if args.to_address:
-            cmd.extend(["--to-address", args.to_address])
-        if args.gas_limit:
-            cmd.extend(["--gas-limit", str(args.gas_limit)])
-        if args.gas_price:
-            cmd.extend(["--gas-price", args.gas_price])
-        if args.private_key:
-            cmd.extend(["--private-key", args.private_key])
-        
-        return AggsandboxAPI.run_command(cmd)
+        return _state_changed(AggsandboxAPI.run_command(_build_cmd("bridge_asset", **asdict(args))))
+    
+    @staticmethod
+    def bridge_asset_tx_hash(args: BridgeAssetArgs) -> Tuple[bool, str]:
+        """Bridge tokens and return (success, tx hash) as soon as the CLI reports it submitted"""
+        return _state_changed(AggsandboxAPI.run_command_streaming(
+            _build_cmd("bridge_asset", **asdict(args)), _marked_tx_re('transaction submitted')
+        ))
     
     @staticmethod
     def bridge_claim(args: BridgeClaimArgs) -> Tuple[bool, str]:
         """Claim previously bridged assets"""
-        cmd = [
-            "aggsandbox", "bridge", "claim",
-            "--network-id", str(args.network),
-            "--tx-hash", args.tx_hash,
-            "--source-network-id", str(args.source_network)
-        ]
-        
-        if args.deposit_count is not None:
-            cmd.extend(["--deposit-count", str(args.deposit_count)])
-        if args.token_address is not None:
-            cmd.extend(["--token-address", args.token_address])
-        if args.gas_limit is not None:
-            cmd.extend(["--gas-limit", str(args.gas_limit)])
-        if args.gas_price is not None:
-            cmd.extend(["--gas-price", args.gas_price])
-        if args.private_key is not None:
-            cmd.extend(["--private-key", args.private_key])
-        if args.data is not None:
-            cmd.extend(["--data", args.data])
-        if args.msg_value is not None:
-            cmd.extend(["--msg-value", args.msg_value])
-        
-        return AggsandboxAPI.run_command(cmd)
+        return _state_changed(AggsandboxAPI.run_command(_build_cmd("bridge_claim", **asdict(args))))
+    
+    @staticmethod
+    async def bridge_claim_async(args: BridgeClaimArgs) -> Tuple[bool, str]:
+        """Async variant of bridge_claim"""
+        return _state_changed(await AggsandboxAPI.run_command_async(_build_cmd("bridge_claim", **asdict(args))))
     
     @staticmethod
     def bridge_message(network: int, destination_network: int, target: str, 
@@ -295,26 +866,7 @@ class AggsandboxAPI:
                       gas_limit: Optional[int] = None, gas_price: Optional[str] = None,
                       private_key: Optional[str] = None) -> Tuple[bool, str]:
         """Bridge with contract calls"""
-        cmd = [
-            "aggsandbox", "bridge", "message",
-            "--network-id", str(network),
-            "--destination-network-id", str(destination_network),
-            "--target", target,
-            "--data", data
-        ]
-        
-        if amount:
-            cmd.extend(["--amount", amount])
-        if fallback_address:
-            cmd.extend(["--fallback-address", fallback_address])
-        if gas_limit:
-            cmd.extend(["--gas-limit", str(gas_limit)])
-        if gas_price:
-            cmd.extend(["--gas-price", gas_price])
-        if private_key:
-            cmd.extend(["--private-key", private_key])
-        
-        return AggsandboxAPI.run_command(cmd)
+        return _state_changed(AggsandboxAPI.run_command(_build_cmd("bridge_message", **locals())))
     
     @staticmethod
     def bridge_and_call(network: int, destination_network: int, token: str,
@@ -350,39 +902,35 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = [
-            "aggsandbox", "bridge", "bridge-and-call",
-            "--network-id", str(network),
-            "--destination-network-id", str(destination_network),
-            "--token", token,
-            "--amount", amount,
-            "--target", target,
-            "--data", data,
-            "--fallback", fallback
-        ]
-        
-        if gas_limit:
-            cmd.extend(["--gas-limit", str(gas_limit)])
-        if gas_price:
-            cmd.extend(["--gas-price", gas_price])
-        if private_key:
-            cmd.extend(["--private-key", private_key])
-        if msg_value:
-            cmd.extend(["--msg-value", msg_value])
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
-        
-        return AggsandboxAPI.run_command(cmd)
+        return _state_changed(AggsandboxAPI.run_command(_build_cmd("bridge_and_call", **locals())))
+    
+    @staticmethod
+    def bridge_and_call_tx_hash(network: int, destination_network: int, token: str,
+                                amount: str, target: str, data: str, fallback: str,
+                                gas_limit: Optional[int] = None, gas_price: Optional[str] = None,
+                                private_key: Optional[str] = None,
+                                msg_value: Optional[str] = None) -> Tuple[bool, str]:
+        """Bridge and call, returning (success, tx hash) as soon as the CLI reports it submitted
+        
+        Args are the same as for bridge_and_call. The hash is printed after the
+        approval is mined and bridgeAndCall is sent, so stopping the CLI there
+        only skips its closing instructions.
+        """
+        return _state_changed(AggsandboxAPI.run_command_streaming(
+            _build_cmd("bridge_and_call", **locals()), _marked_tx_re('transaction submitted')
+        ))
     
     # ============================================================================
     # INFORMATION COMMANDS
     # ============================================================================
     
     @staticmethod
+    def _show_bridges_cmd(network_id: int = 0, json_output: bool = True, verbose: bool = False, 
+                         quiet: bool = False, log_format: Optional[str] = None) -> List[str]:
+        return _build_cmd("show_bridges", **locals())
+    
+    @staticmethod
+    @_ttl_cached
     def show_bridges(network_id: int = 0, json_output: bool = True, verbose: bool = False, 
                     quiet: bool = False, log_format: Optional[str] = None) -> Tuple[bool, str]:
         """Show bridge information for a specific network
@@ -394,20 +942,29 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = ["aggsandbox", "show", "bridges", "--network-id", str(network_id)]
+        if json_output and AggsandboxHTTPClient.enabled():
+            return AggsandboxHTTPClient.show_bridges(network_id)
         
-        if json_output:
-            cmd.append("--json")
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
-        
-        return AggsandboxAPI.run_command(cmd)
+        return AggsandboxAPI.run_command(
+            AggsandboxAPI._show_bridges_cmd(network_id, json_output, verbose, quiet, log_format)
+        )
     
     @staticmethod
+    async def show_bridges_async(network_id: int = 0, json_output: bool = True, **kwargs) -> Tuple[bool, str]:
+        """Async variant of show_bridges"""
+        if json_output and AggsandboxHTTPClient.enabled():
+            return await asyncio.to_thread(AggsandboxHTTPClient.show_bridges, network_id)
+        return await AggsandboxAPI.run_command_async(
+            AggsandboxAPI._show_bridges_cmd(network_id, json_output, **kwargs)
+        )
+    
+    @staticmethod
+    def _show_claims_cmd(network_id: int = 1, json_output: bool = True, verbose: bool = False,
+                        quiet: bool = False, log_format: Optional[str] = None) -> List[str]:
+        return _build_cmd("show_claims", **locals())
+    
+    @staticmethod
+    @_ttl_cached
     def show_claims(network_id: int = 1, json_output: bool = True, verbose: bool = False,
                    quiet: bool = False, log_format: Optional[str] = None) -> Tuple[bool, str]:
         """Show pending claims for a network
@@ -419,20 +976,30 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = ["aggsandbox", "show", "claims", "--network-id", str(network_id)]
+        if json_output and AggsandboxHTTPClient.enabled():
+            return AggsandboxHTTPClient.show_claims(network_id)
         
-        if json_output:
-            cmd.append("--json")
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
-        
-        return AggsandboxAPI.run_command(cmd)
+        return AggsandboxAPI.run_command(
+            AggsandboxAPI._show_claims_cmd(network_id, json_output, verbose, quiet, log_format)
+        )
+    
+    @staticmethod
+    async def show_claims_async(network_id: int = 1, json_output: bool = True, **kwargs) -> Tuple[bool, str]:
+        """Async variant of show_claims"""
+        if json_output and AggsandboxHTTPClient.enabled():
+            return await asyncio.to_thread(AggsandboxHTTPClient.show_claims, network_id)
+        return await AggsandboxAPI.run_command_async(
+            AggsandboxAPI._show_claims_cmd(network_id, json_output, **kwargs)
+        )
+    
+    @staticmethod
+    def _show_claim_proof_cmd(network_id: int = 0, leaf_index: int = 0, deposit_count: int = 1,
+                             json_output: bool = True, verbose: bool = False,
+                             quiet: bool = False, log_format: Optional[str] = None) -> List[str]:
+        return _build_cmd("show_claim_proof", **locals())
     
     @staticmethod
+    @_ttl_cached
     def show_claim_proof(network_id: int = 0, leaf_index: int = 0, deposit_count: int = 1,
                         json_output: bool = True, verbose: bool = False,
                         quiet: bool = False, log_format: Optional[str] = None) -> Tuple[bool, str]:
@@ -447,25 +1014,33 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = [
-            "aggsandbox", "show", "claim-proof",
-            "--network-id", str(network_id),
-            "--leaf-index", str(leaf_index),
-            "--deposit-count", str(deposit_count)
-        ]
+        if json_output and AggsandboxHTTPClient.enabled():
+            return AggsandboxHTTPClient.show_claim_proof(network_id, leaf_index, deposit_count)
         
-        if json_output:
-            cmd.append("--json")
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
-        
-        return AggsandboxAPI.run_command(cmd)
+        return AggsandboxAPI.run_command(
+            AggsandboxAPI._show_claim_proof_cmd(network_id, leaf_index, deposit_count, json_output, verbose, quiet, log_format)
+        )
+    
+    @staticmethod
+    async def show_claim_proof_async(network_id: int = 0, leaf_index: int = 0, deposit_count: int = 1,
+                                     json_output: bool = True, **kwargs) -> Tuple[bool, str]:
+        """Async variant of show_claim_proof"""
+        if json_output and AggsandboxHTTPClient.enabled():
+            return await asyncio.to_thread(
+                AggsandboxHTTPClient.show_claim_proof, network_id, leaf_index, deposit_count
+            )
+        return await AggsandboxAPI.run_command_async(
+            AggsandboxAPI._show_claim_proof_cmd(network_id, leaf_index, deposit_count, json_output, **kwargs)
+        )
     
     @staticmethod
+    def _show_l1_info_tree_index_cmd(network_id: int = 0, deposit_count: int = 0,
+                                    json_output: bool = True, verbose: bool = False,
+                                    quiet: bool = False, log_format: Optional[str] = None) -> List[str]:
+        return _build_cmd("show_l1_info_tree_index", **locals())
+    
+    @staticmethod
+    @_ttl_cached
     def show_l1_info_tree_index(network_id: int = 0, deposit_count: int = 0,
                                json_output: bool = True, verbose: bool = False,
                                quiet: bool = False, log_format: Optional[str] = None) -> Tuple[bool, str]:
@@ -479,126 +1054,206 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = [
-            "aggsandbox", "show", "l1-info-tree-index",
-            "--network-id", str(network_id),
-            "--deposit-count", str(deposit_count)
-        ]
-        
-        if json_output:
-            cmd.append("--json")
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
-        
-        return AggsandboxAPI.run_command(cmd)
+        if json_output and AggsandboxHTTPClient.enabled():
+            return AggsandboxHTTPClient.show_l1_info_tree_index(network_id, deposit_count)
+        
+        return AggsandboxAPI.run_command(
+            AggsandboxAPI._show_l1_info_tree_index_cmd(network_id, deposit_count, json_output, verbose, quiet, log_format)
+        )
+    
+    @staticmethod
+    async def show_l1_info_tree_index_async(network_id: int = 0, deposit_count: int = 0,
+                                            json_output: bool = True, **kwargs) -> Tuple[bool, str]:
+        """Async variant of show_l1_info_tree_index"""
+        if json_output and AggsandboxHTTPClient.enabled():
+            return await asyncio.to_thread(
+                AggsandboxHTTPClient.show_l1_info_tree_index, network_id, deposit_count
+            )
+        return await AggsandboxAPI.run_command_async(
+            AggsandboxAPI._show_l1_info_tree_index_cmd(network_id, deposit_count, json_output, **kwargs)
+        )
+    
+    @staticmethod
+    def batch_show(queries: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Tuple[bool, str]]:
+        """Run several `show bridges` / `show claims` queries concurrently
+        
+        The CLI has no batch endpoint, so each query is still its own process, but
+        issuing them together makes a poll tick cost the slowest query rather than
+        the sum of all of them. Results are keyed by query, never by position.
+        
+        Args:
+            queries: (kind, network_id) pairs where kind is "bridges" or "claims"
+        """
+        results = AggsandboxAPI.batch(*(
+            (f"show_{kind}", {"network_id": network_id, "json_output": True})
+            for kind, network_id in queries
+        ))
+        return dict(zip(queries, results))
+    
+    @staticmethod
+    async def batch_show_async(queries: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Tuple[bool, str]]:
+        """Async variant of batch_show, gathering the queries on the running event loop"""
+        results = await AggsandboxAPI.batch_async(*(
+            (f"show_{kind}", {"network_id": network_id}) for kind, network_id in queries
+        ))
+        return dict(zip(queries, results))
+    
+    @staticmethod
+    def batch(*calls: Tuple[str, Dict[str, Any]]) -> List[Tuple[bool, str]]:
+        """Run independent queries concurrently and return their results in order
+        
+        A round of lookups then costs the slowest one instead of their sum.
+        
+        Args:
+            calls: (method_name, kwargs) pairs, e.g. ("show_claims", {"network_id": 1})
+        """
+        with ThreadPoolExecutor(max_workers=max(1, len(calls))) as executor:
+            futures = [executor.submit(getattr(AggsandboxAPI, name), **kwargs)
+                       for name, kwargs in calls]
+        return [future.result() for future in futures]
+    
+    @staticmethod
+    async def batch_async(*calls: Tuple[str, Dict[str, Any]]) -> List[Tuple[bool, str]]:
+        """Async variant of batch, using each method's *_async variant where there is one"""
+        def run(name: str, kwargs: Dict[str, Any]):
+            method = getattr(AggsandboxAPI, f"{name}_async", None)
+            if method is not None:
+                return method(**kwargs)
+            return asyncio.to_thread(getattr(AggsandboxAPI, name), **kwargs)
+        
+        return list(await asyncio.gather(*(run(name, kwargs) for name, kwargs in calls)))
     
     # ============================================================================
     # BRIDGE UTILITIES
     # ============================================================================
     
     @staticmethod
+    def _bridge_utils_get_mapped_cmd(network: int, origin_network: int, origin_token: str,
+                                    private_key: Optional[str] = None, json_output: bool = True) -> List[str]:
+        return _build_cmd("bridge_utils_get_mapped", **locals())
+    
+    @staticmethod
+    @_ttl_cached
     def bridge_utils_get_mapped(network: int, origin_network: int, origin_token: str,
                                private_key: Optional[str] = None, json_output: bool = True) -> Tuple[bool, str]:
         """Get wrapped token address for an origin token"""
-        cmd = [
-            "aggsandbox", "bridge", "utils", "get-mapped",
-            "--network-id", str(network),
-            "--origin-network", str(origin_network),
-            "--origin-token", origin_token
-        ]
-        
-        if private_key:
-            cmd.extend(["--private-key", private_key])
-        if json_output:
-            cmd.append("--json")
-        
-        return AggsandboxAPI.run_command(cmd)
+        return AggsandboxAPI.run_command(
+            AggsandboxAPI._bridge_utils_get_mapped_cmd(network, origin_network, origin_token, private_key, json_output)
+        )
+    
+    @staticmethod
+    async def bridge_utils_get_mapped_async(*args, **kwargs) -> Tuple[bool, str]:
+        """Async variant of bridge_utils_get_mapped, taking the same arguments"""
+        return await AggsandboxAPI.run_command_async(
+            AggsandboxAPI._bridge_utils_get_mapped_cmd(*args, **kwargs)
+        )
     
     @staticmethod
+    def _bridge_utils_precalculate_cmd(network: int, origin_network: int, origin_token: str,
+                                      json_output: bool = True) -> List[str]:
+        return _build_cmd("bridge_utils_precalculate", **locals())
+    
+    @staticmethod
+    @_ttl_cached
     def bridge_utils_precalculate(network: int, origin_network: int, origin_token: str,
                                  json_output: bool = True) -> Tuple[bool, str]:
         """Pre-calculate wrapped token address before deployment"""
-        cmd = [
-            "aggsandbox", "bridge", "utils", "precalculate",
-            "--network-id", str(network),
-            "--origin-network", str(origin_network),
-            "--origin-token", origin_token
-        ]
-        
-        if json_output:
-            cmd.append("--json")
-        
-        return AggsandboxAPI.run_command(cmd)
+        return AggsandboxAPI.run_command(
+            AggsandboxAPI._bridge_utils_precalculate_cmd(network, origin_network, origin_token, json_output)
+        )
     
     @staticmethod
+    async def bridge_utils_precalculate_async(*args, **kwargs) -> Tuple[bool, str]:
+        """Async variant of bridge_utils_precalculate, taking the same arguments"""
+        return await AggsandboxAPI.run_command_async(
+            AggsandboxAPI._bridge_utils_precalculate_cmd(*args, **kwargs)
+        )
+    
+    @staticmethod
+    def _bridge_utils_get_origin_cmd(network: int, wrapped_token: str,
+                                    json_output: bool = True) -> List[str]:
+        return _build_cmd("bridge_utils_get_origin", **locals())
+    
+    @staticmethod
+    @_ttl_cached
     def bridge_utils_get_origin(network: int, wrapped_token: str,
                                json_output: bool = True) -> Tuple[bool, str]:
         """Get origin token information from wrapped token"""
-        cmd = [
-            "aggsandbox", "bridge", "utils", "get-origin",
-            "--network-id", str(network),
-            "--wrapped-token", wrapped_token
-        ]
-        
-        if json_output:
-            cmd.append("--json")
-        
-        return AggsandboxAPI.run_command(cmd)
+        return AggsandboxAPI.run_command(
+            AggsandboxAPI._bridge_utils_get_origin_cmd(network, wrapped_token, json_output)
+        )
+    
+    @staticmethod
+    async def bridge_utils_get_origin_async(*args, **kwargs) -> Tuple[bool, str]:
+        """Async variant of bridge_utils_get_origin, taking the same arguments"""
+        return await AggsandboxAPI.run_command_async(
+            AggsandboxAPI._bridge_utils_get_origin_cmd(*args, **kwargs)
+        )
+    
+    @staticmethod
+    def _bridge_utils_is_claimed_cmd(network: int, index: int, source_network: int,
+                                    private_key: Optional[str] = None, json_output: bool = True) -> List[str]:
+        return _build_cmd("bridge_utils_is_claimed", **locals())
     
     @staticmethod
     def bridge_utils_is_claimed(network: int, index: int, source_network: int,
                                private_key: Optional[str] = None, json_output: bool = True) -> Tuple[bool, str]:
         """Check if a bridge has been claimed"""
-        cmd = [
-            "aggsandbox", "bridge", "utils", "is-claimed",
-            "--network-id", str(network),
-            "--index", str(index),
-            "--source-network", str(source_network)
-        ]
+        key = (network, index, source_network)
+        if json_output and key in _CLAIMED:
+            return True, _CLAIMED[key]
         
-        if private_key:
-            cmd.extend(["--private-key", private_key])
-        if json_output:
-            cmd.append("--json")
-        
-        return AggsandboxAPI.run_command(cmd)
+        success, output = AggsandboxAPI.run_command(
+            AggsandboxAPI._bridge_utils_is_claimed_cmd(network, index, source_network, private_key, json_output)
+        )
+        if success and json_output:
+            try:
+                if json_loads(output).get('is_claimed'):
+                    _CLAIMED[key] = output
+            except (json.JSONDecodeError, AttributeError):
+                pass
+        return success, output
+    
+    @staticmethod
+    async def bridge_utils_is_claimed_async(*args, **kwargs) -> Tuple[bool, str]:
+        """Async variant of bridge_utils_is_claimed, taking the same arguments"""
+        return await AggsandboxAPI.run_command_async(
+            AggsandboxAPI._bridge_utils_is_claimed_cmd(*args, **kwargs)
+        )
     
     @staticmethod
     def bridge_utils_build_payload(tx_hash: str, source_network: int,
                                   bridge_index: Optional[int] = None,
                                   json_output: bool = True) -> Tuple[bool, str]:
         """Build complete claim payload from bridge transaction"""
-        cmd = [
-            "aggsandbox", "bridge", "utils", "build-payload",
-            "--tx-hash", tx_hash,
-            "--source-network", str(source_network)
-        ]
-        
-        if bridge_index is not None:
-            cmd.extend(["--bridge-index", str(bridge_index)])
-        if json_output:
-            cmd.append("--json")
-        
-        return AggsandboxAPI.run_command(cmd)
+        return AggsandboxAPI.run_command(_build_cmd("bridge_utils_build_payload", **locals()))
     
     @staticmethod
+    def _bridge_utils_compute_index_cmd(local_index: int, source_network: int,
+                                       json_output: bool = True) -> List[str]:
+        return _build_cmd("bridge_utils_compute_index", **locals())
+    
+    @staticmethod
+    @_ttl_cached
     def bridge_utils_compute_index(local_index: int, source_network: int,
                                   json_output: bool = True) -> Tuple[bool, str]:
         """Calculate global bridge index from local index"""
-        cmd = [
-            "aggsandbox", "bridge", "utils", "compute-index",
-            "--local-index", str(local_index),
-            "--source-network", str(source_network)
-        ]
-        
-        if json_output:
-            cmd.append("--json")
-        
-        return AggsandboxAPI.run_command(cmd)
+        return AggsandboxAPI.run_command(
+            AggsandboxAPI._bridge_utils_compute_index_cmd(local_index, source_network, json_output)
+        )
+    
+    @staticmethod
+    async def bridge_utils_compute_index_async(*args, **kwargs) -> Tuple[bool, str]:
+        """Async variant of bridge_utils_compute_index, taking the same arguments"""
+        return await AggsandboxAPI.run_command_async(
+            AggsandboxAPI._bridge_utils_compute_index_cmd(*args, **kwargs)
+        )
+    
+    @staticmethod
+    def _bridge_utils_network_id_cmd(network: int, private_key: Optional[str] = None,
+                                     json_output: bool = True, verbose: bool = False,
+                                     quiet: bool = False, log_format: Optional[str] = None) -> List[str]:
+        return _build_cmd("bridge_utils_network_id", **locals())
     
     @staticmethod
     def bridge_utils_network_id(network: int, private_key: Optional[str] = None,
@@ -617,23 +1272,16 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = [
-            "aggsandbox", "bridge", "utils", "network-id",
-            "--network-id", str(network)
-        ]
-        
-        if private_key:
-            cmd.extend(["--private-key", private_key])
-        if json_output:
-            cmd.append("--json")
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
-        
-        return AggsandboxAPI.run_command(cmd)
+        return AggsandboxAPI.run_command(
+            AggsandboxAPI._bridge_utils_network_id_cmd(network, private_key, json_output, verbose, quiet, log_format)
+        )
+    
+    @staticmethod
+    async def bridge_utils_network_id_async(*args, **kwargs) -> Tuple[bool, str]:
+        """Async variant of bridge_utils_network_id, taking the same arguments"""
+        return await AggsandboxAPI.run_command_async(
+            AggsandboxAPI._bridge_utils_network_id_cmd(*args, **kwargs)
+        )
     
     # ============================================================================
     # CLAIM SPONSOR COMMANDS
@@ -659,21 +1307,31 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = [
-            "aggsandbox", "sponsor-claim",
-            "--deposit", str(deposit),
-            "--origin-network", str(origin_network),
-            "--destination-network", str(destination_network)
-        ]
+        return _state_changed(AggsandboxAPI.run_command(_build_cmd("sponsor_claim", **locals())))
+    
+    @staticmethod
+    async def sponsor_claim_async(deposit: int, origin_network: int = 0, destination_network: int = 1,
+                                  verbose: bool = False, quiet: bool = False,
+                                  log_format: Optional[str] = None) -> Tuple[bool, str]:
+        """Async variant of sponsor_claim"""
+        return _state_changed(await AggsandboxAPI.run_command_async(_build_cmd("sponsor_claim", **locals())))
+    
+    @staticmethod
+    async def sponsor_claims_bulk(items: List[Dict[str, Any]],
+                                  max_concurrency: int = 8) -> List[Tuple[bool, str]]:
+        """Submit several sponsored claims concurrently, returning results in order
         
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
+        Args:
+            items: sponsor_claim keyword arguments for each claim, e.g. {"deposit": 3}
+            max_concurrency: Most claims in flight at once, so the claim sponsor isn't flooded
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def submit(item: Dict[str, Any]) -> Tuple[bool, str]:
+            async with semaphore:
+                return await AggsandboxAPI.sponsor_claim_async(**item)
         
-        return AggsandboxAPI.run_command(cmd)
+        return list(await asyncio.gather(*(submit(item) for item in items)))
     
     @staticmethod
     def claim_status(global_index: int, network_id: int, verbose: bool = False,
@@ -687,20 +1345,34 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = [
-            "aggsandbox", "claim-status",
-            "--global-index", str(global_index),
-            "--network-id", str(network_id)
-        ]
-        
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
-        
-        return AggsandboxAPI.run_command(cmd)
+        return AggsandboxAPI.run_command(_build_cmd("claim_status", **locals()))
+    
+    @staticmethod
+    def wait_for_claim(global_index: int, network_id: int, timeout: float = 60,
+                       initial_delay: float = 0.1, max_delay: float = 2.0) -> Tuple[bool, str]:
+        """Poll claim_status until the sponsored claim succeeds or fails
+        
+        The claim is classified by the status field of the JSON claim_status
+        prints, not by words elsewhere in its output. The poll interval starts
+        short and grows by 1.7x up to max_delay, so a quick claim is noticed
+        quickly and a slow one isn't polled every tick.
+        Returns (True, output) on success, (False, output) if the claim failed
+        and (False, "timeout") if it didn't settle in time.
+        """
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+        while True:
+            success, output = AggsandboxAPI.claim_status(global_index, network_id)
+            if success:
+                status = (_claim_status_field(output) or "").lower()
+                if status in _CLAIM_SETTLED:
+                    return _CLAIM_SETTLED[status], output
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False, "timeout"
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.7, max_delay)
     
     # ============================================================================
     # EVENT MONITORING
@@ -720,59 +1392,201 @@ class AggsandboxAPI:
             quiet: Suppress all output except errors and warnings
             log_format: Set log output format (pretty, compact, json)
         """
-        cmd = [
-            "aggsandbox", "events",
-            "--network-id", str(network_id),
-            "--blocks", str(blocks)
-        ]
+        return AggsandboxAPI.run_command(_build_cmd("events", **locals()))
+    
+    @staticmethod
+    def events_subscribe(network_id: int, address: Optional[str] = None,
+                         rpc_url: Optional[str] = None, poll_interval: float = 1.0,
+                         max_filter_retries: int = 3) -> Iterator[dict]:
+        """Yield raw logs emitted on a network from now on, as they arrive
         
-        if address:
-            cmd.extend(["--address", address])
-        if verbose:
-            cmd.append("--verbose")
-        if quiet:
-            cmd.append("--quiet")
-        if log_format:
-            cmd.extend(["--log-format", log_format])
+        Instead of re-running `events` and rescanning recent blocks, this installs
+        one log filter on the node and drains it over a keep-alive RPC connection,
+        so each log is seen exactly once. Stop iterating when done; the filter is
+        removed then.
+        
+        Args:
+            network_id: Network ID to watch
+            address: Only yield logs from this contract address
+            rpc_url: Node RPC URL (default: resolved from the sandbox info)
+            poll_interval: Seconds to wait when no new logs have arrived, and
+                before re-creating a filter the node dropped
+            max_filter_retries: Re-create the filter at most this many times in a
+                row before the RPCError of reading it is raised. An error
+                creating the filter is raised straight away.
+        """
+        if rpc_url is None:
+            from bridge_lib import BridgeEnvironment, BridgeUtils
+            rpc_url = BridgeUtils.get_rpc_url(network_id, BridgeEnvironment.load_environment())
         
-        return AggsandboxAPI.run_command(cmd)
+        rpc = RPCClient.for_url(rpc_url)
+        log_filter = {"fromBlock": "latest"}
+        if address:
+            log_filter["address"] = address
+        filter_id = rpc.call("eth_newFilter", [log_filter])
+        failures = 0
+        try:
+            while True:
+                try:
+                    logs = rpc.call("eth_getFilterChanges", [filter_id])
+                except RPCError:
+                    # The node dropped the filter (e.g. it expired); start a new one
+                    failures += 1
+                    if failures > max_filter_retries:
+                        raise
+                    time.sleep(poll_interval)
+                    filter_id = rpc.call("eth_newFilter", [log_filter])
+                    continue
+                failures = 0
+                yield from logs
+                if not logs:
+                    time.sleep(poll_interval)
+        finally:
+            try:
+                rpc.call("eth_uninstallFilter", [filter_id])
+            except (RPCError, OSError):
+                pass
     
     # ============================================================================
     # CONVENIENCE METHODS WITH JSON PARSING
     # ============================================================================
     
     @staticmethod
-    def get_bridges(network_id: int) -> Optional[Dict[str, Any]]:
-        """Get bridge information as parsed JSON"""
-        success, output = AggsandboxAPI.show_bridges(network_id, json_output=True)
-        if success:
-            try:
-                return json.loads(output)
-            except json.JSONDecodeError as e:
-                print(f"ERROR: Could not parse bridge JSON: {e}")
+    @_ttl_cached
+    def _show_json_bytes(kind: str, network_id: int) -> Tuple[bool, bytes]:
+        """Undecoded `show bridges|claims --json` output for the parsing helpers below"""
+        if AggsandboxHTTPClient.enabled():
+            path = f"/bridge/v1/{kind}?network_id={network_id}"
+            return AggsandboxHTTPClient.get_bytes(network_id, path)
+        return AggsandboxAPI.run_command_bytes(
+            _build_cmd(f"show_{kind}", network_id=network_id, json_output=True)
+        )
+    
+    @staticmethod
+    def get_bridges(network_id: int, since_deposit_count: Optional[int] = None,
+                    ttl_ms: int = 0, cache: Optional[dict] = None) -> Optional[Mapping[str, Any]]:
+        """Get bridge information as parsed JSON
+        
+        Returns a read-only Mapping (a ShowResponse) rather than a dict; with
+        since_deposit_count it is a filtered dict copy. Returns None if the
+        query fails or its output isn't valid JSON.
+        
+        Args:
+            network_id: Network ID to query
+            since_deposit_count: Only return bridges with a higher deposit count, so
+                pollers can skip entries they already scanned on a previous attempt
+            ttl_ms: Reuse a `show bridges` result up to this old. The default, 0,
+                always re-queries; results are dropped after any successful bridge or claim
+            cache: TTL cache to use instead of the module-wide one
+        """
+        success, output = AggsandboxAPI._show_json_bytes("bridges", network_id,
+                                                         ttl_ms=ttl_ms, cache=cache)
+        data = ShowResponse.parse(output, ("bridges", network_id)) if success else None
+        if data is not None:
+            if since_deposit_count is None:
+                return data
+            new_bridges = [bridge for bridge in data.get('bridges', [])
+                           if bridge.get('deposit_count', -1) > since_deposit_count]
+            return {**data, 'bridges': new_bridges}
         return None
     
     @staticmethod
-    def get_claims(network_id: int) -> Optional[Dict[str, Any]]:
-        """Get claims information as parsed JSON"""
+    def get_claims(network_id: int, ttl_ms: int = 0,
+                   cache: Optional[dict] = None) -> Optional[Mapping[str, Any]]:
+        """Get claims information as parsed JSON
+        
+        Returns a read-only Mapping (a ShowResponse), not a dict, or None if the
+        query fails or its output isn't valid JSON.
+        
+        Args:
+            network_id: Network ID to query
+            ttl_ms: Reuse a `show claims` result up to this old. The default, 0,
+                always re-queries; results are dropped after any successful bridge or claim
+            cache: TTL cache to use instead of the module-wide one
+        """
+        success, output = AggsandboxAPI._show_json_bytes("claims", network_id,
+                                                         ttl_ms=ttl_ms, cache=cache)
+        return ShowResponse.parse(output, ("claims", network_id)) if success else None
+    
+    @staticmethod
+    def invalidate_bridges(network_id: int, cache: Optional[dict] = None):
+        """Drop the cached `show bridges` result for a network
+        
+        Successful bridges and claims made through this module invalidate the
+        cache already; this is for state changed by another process.
+        """
+        _drop_cached(_cache if cache is None else cache, "_show_json_bytes",
+                     (("kind", "bridges"), ("network_id", network_id)))
+    
+    @staticmethod
+    def invalidate_claims(network_id: int, cache: Optional[dict] = None):
+        """Drop the cached `show claims` result for a network (see invalidate_bridges)"""
+        _drop_cached(_cache if cache is None else cache, "_show_json_bytes",
+                     (("kind", "claims"), ("network_id", network_id)))
+    
+    @staticmethod
+    def _get_batch(kind: str, network_ids: Sequence[int], ttl_ms: int,
+                   cache: Optional[dict]) -> Dict[int, Optional[Mapping[str, Any]]]:
+        # Capped, as more concurrent queries only queue up on the bridge service
+        with ThreadPoolExecutor(max_workers=max(1, min(_BATCH_WORKERS, len(network_ids)))) as executor:
+            futures = [executor.submit(AggsandboxAPI._show_json_bytes, kind, network_id,
+                                       ttl_ms=ttl_ms, cache=cache)
+                       for network_id in network_ids]
+        
+        results: Dict[int, Optional[Mapping[str, Any]]] = {}
+        for network_id, future in zip(network_ids, futures):
+            success, output = future.result()
+            results[network_id] = ShowResponse.parse(output, (kind, network_id)) if success else None
+        return results
+    
+    @staticmethod
+    def get_bridges_batch(network_ids: Sequence[int], ttl_ms: int = 0,
+                          cache: Optional[dict] = None) -> Dict[int, Optional[Mapping[str, Any]]]:
+        """Get bridge information for several networks, querying them concurrently
+        
+        The outputs are parsed together once every query has returned, each
+        skipping the parse if it is unchanged since the previous poll. Networks
+        whose query fails or returns invalid JSON map to None.
+        
+        Args:
+            network_ids: Network IDs to query
+            ttl_ms: Reuse a `show bridges` result up to this old (the default, 0,
+                always re-queries)
+            cache: TTL cache to use instead of the module-wide one
+        """
+        return AggsandboxAPI._get_batch("bridges", network_ids, ttl_ms, cache)
+    
+    @staticmethod
+    def get_claims_batch(network_ids: Sequence[int], ttl_ms: int = 0,
+                         cache: Optional[dict] = None) -> Dict[int, Optional[Mapping[str, Any]]]:
+        """Get claims for several networks, querying them concurrently (see get_bridges_batch)"""
+        return AggsandboxAPI._get_batch("claims", network_ids, ttl_ms, cache)
+    
+    @staticmethod
+    def iter_claims(network_id: int) -> Optional[Iterator[dict]]:
+        """Get claims as a lazily decoded iterator, or None if the query failed
+        
+        Claims are decoded one at a time, so a caller looking for a single
+        claim can stop early without materializing the whole response.
+        """
         success, output = AggsandboxAPI.show_claims(network_id, json_output=True)
-        if success:
-            try:
-                return json.loads(output)
-            except json.JSONDecodeError as e:
-                print(f"ERROR: Could not parse claims JSON: {e}")
-        return None
+        if not success:
+            return None
+        return _iter_json_array(output, "claims")
     
     @staticmethod
-    def get_wrapped_token_address(network: int, origin_network: int, origin_token: str) -> Optional[str]:
+    def get_wrapped_token_address(network: int, origin_network: int, origin_token: str,
+                                  ttl_ms: int = 0, cache: Optional[dict] = None) -> Optional[str]:
         """Get wrapped token address as string"""
         success, output = AggsandboxAPI.bridge_utils_get_mapped(
-            network, origin_network, origin_token, json_output=True
+            network, origin_network, origin_token, json_output=True, ttl_ms=ttl_ms, cache=cache
         )
         if success:
             try:
-                data = json.loads(output)
-                return data.get('wrapped_token_address')
+                return _parse_cached(
+                    ("mapped", network, origin_network, origin_token), output,
+                    lambda raw: json_loads(raw).get('wrapped_token_address')
+                )
             except json.JSONDecodeError as e:
                 print(f"ERROR: Could not parse wrapped token JSON: {e}")
         return None
@@ -785,7 +1599,7 @@ class AggsandboxAPI:
         )
         if success:
             try:
-                data = json.loads(output)
+                data = json_loads(output)
                 return data.get('is_claimed', False)
             except json.JSONDecodeError as e:
                 print(f"ERROR: Could not parse is_claimed JSON: {e}")
@@ -815,17 +1629,7 @@ class AggsandboxAPI:
             return None
         
         # Extract transaction hash
-        tx_hash = None
-        lines = output.split('\n')
-        for line in lines:
-            if 'bridge transaction submitted' in line.lower() and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        tx_hash = word
-                        break
-                if tx_hash:
-                    break
+        tx_hash = find_tx_hash(output, 'bridge transaction submitted')
         
         if not tx_hash:
             print("ERROR: Could not extract bridge transaction hash")
@@ -833,16 +1637,30 @@ class AggsandboxAPI:
         
         print(f"SUCCESS: Bridge transaction: {tx_hash}")
         
-        # Step 2: Find bridge in bridge events
-        for attempt in range(6):
-            time.sleep(2)
+        # Step 2: Find bridge in bridge events. Deposit counts only grow, so each
+        # attempt only fetches and indexes bridges added since the previous one.
+        # Check right away, then back off by 1.7x within the same 12s budget.
+        index: Dict[str, dict] = {}
+        seen_deposit_count = None
+        deadline = time.monotonic() + 12
+        delay = 0.2
+        attempt = 0
+        while True:
+            attempt += 1
+            bridge_data = AggsandboxAPI.get_bridges(network, since_deposit_count=seen_deposit_count)  # Source network
+            bridges = (bridge_data or {}).get('bridges')
+            if bridges:
+                seen_deposit_count = index_bridges_by_tx_hash(bridges, index, seen_deposit_count)
+                bridge = index.get(tx_hash)
+                if bridge:
+                    BridgeLogger.success(f"Found bridge in events (attempt {attempt})")
+                    return bridge
             
-            bridge_data = AggsandboxAPI.get_bridges(network)  # Source network
-            if bridge_data and bridge_data.get('bridges'):
-                for bridge in bridge_data['bridges']:
-                    if bridge.get('bridge_tx_hash') == tx_hash:
-                        BridgeLogger.success(f"Found bridge in events (attempt {attempt + 1})")
-                        return bridge
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.7, 3.0)
         
         BridgeLogger.error("Bridge not found in events")
         return None
@@ -866,17 +1684,7 @@ class AggsandboxAPI:
             return None
         
         # Extract claim transaction hash
-        claim_tx_hash = None
-        lines = output.split('\n')
-        for line in lines:
-            if 'claim transaction submitted' in line.lower() and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        claim_tx_hash = word
-                        break
-                if claim_tx_hash:
-                    break
+        claim_tx_hash = find_tx_hash(output, 'claim transaction submitted')
         
         if claim_tx_hash:
             BridgeLogger.success(f"Claim transaction: {claim_tx_hash}")
@@ -893,28 +1701,70 @@ class AggsandboxAPI:
         
         return claim_tx_hash
 
+# Convenience lookups that pass ttl_ms and cache through to a TTL-cached query
+_TTL_FORWARDING = frozenset({"get_bridges", "get_claims", "get_bridges_batch", "get_claims_batch",
+                             "get_wrapped_token_address"})
+_CACHE_FORWARDING = frozenset({"invalidate_bridges", "invalidate_claims"})
+
+class AggsandboxClient:
+    """AggsandboxAPI with its own query cache and default TTL
+    
+    AggsandboxAPI keeps its state (TTL cache, HTTP and RPC connections) at
+    module level so its static methods can be called from anywhere. A client
+    exposes the same methods, but the TTL-cached ones use the client's own
+    cache and default to its ttl_ms. Tests that need isolation from other
+    callers can create their own client.
+    """
+    
+    def __init__(self, *, default_ttl_ms: int = 0):
+        self.default_ttl_ms = default_ttl_ms
+        self._cache: Dict[tuple, Tuple[float, Tuple[bool, str]]] = {}
+    
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(AggsandboxAPI, name)
+        if getattr(method, "ttl_cached", False) or name in _TTL_FORWARDING:
+            # Callers can still override ttl_ms per call
+            return functools.partial(method, ttl_ms=self.default_ttl_ms, cache=self._cache)
+        if name in _CACHE_FORWARDING:
+            return functools.partial(method, cache=self._cache)
+        return method
+    
+    def clear_cache(self):
+        """Forget all cached query results"""
+        self._cache.clear()
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+def find_tx_hash(output: str, marker: str) -> Optional[str]:
+    """Find the first tx hash on a line containing marker (case-insensitive)
+    
+    The regex only matches 0x followed by exactly 64 hex digits, so candidates
+    are validated in the same scan instead of checked word by word.
+    """
+    match = _marked_tx_re(marker).search(output)
+    return match.group(1) if match else None
+
 def extract_tx_hash_from_output(output: str, operation: str = "transaction") -> Optional[str]:
     """Extract transaction hash from aggsandbox output"""
-    lines = output.split('\n')
-    
-    # Look for specific operation transaction
-    for line in lines:
-        if f'{operation} submitted' in line.lower() and '0x' in line:
-            words = line.split()
-            for word in words:
-                if word.startswith('0x') and len(word) == 66:
-                    return word
-    
-    # Fallback: look for any transaction hash
-    for line in lines:
-        if 'transaction' in line.lower() and '0x' in line:
-            words = line.split()
-            for word in words:
-                if word.startswith('0x') and len(word) == 66:
-                    return word
+    # Prefer the specific operation transaction, fall back to any transaction hash
+    match = (_marked_tx_re(f'{operation} submitted').search(output)
+             or _marked_tx_re('transaction').search(output))
+    return match.group(1) if match else None
+
+def index_bridges_by_tx_hash(bridges: List[dict], index: Dict[str, dict],
+                             seen_deposit_count: Optional[int] = None) -> Optional[int]:
+    """Add bridges to an index keyed by bridge_tx_hash and return the highest deposit count
     
-    return None
+    Args:
+        bridges: Bridges from a `show bridges` response
+        index: Index to update, kept across polling attempts
+        seen_deposit_count: Highest deposit count indexed so far
+    """
+    for bridge in bridges:
+        index.setdefault(bridge.get('bridge_tx_hash'), bridge)
+        deposit_count = bridge.get('deposit_count', -1)
+        if seen_deposit_count is None or deposit_count > seen_deposit_count:
+            seen_deposit_count = deposit_count
+    return seen_deposit_count
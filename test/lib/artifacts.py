@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Contract Artifacts Module - Python Implementation
+Caches compiled test contracts and deploys them without re-running solc
+"""
+
+import os
+import json
+import fcntl
+import shutil
+import tempfile
+import subprocess
+from contextlib import contextmanager
+from typing import Optional
+from bridge_lib import BridgeLogger
+from rpc_client import RPCClient, RPCError
+
+LIB_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(LIB_DIR, '..', '..'))
+ARTIFACTS_DIR = os.path.join(LIB_DIR, '_artifacts')
+DEPLOYMENTS_DIR = os.path.join(REPO_ROOT, 'test', '.aggsandbox-cache')
+
+def _artifact_path(contract_name: str) -> str:
+    return os.path.join(ARTIFACTS_DIR, f"{contract_name}.json")
+
+def load_artifact(source: str, contract_name: str) -> Optional[dict]:
+    """Load a compiled contract artifact, building it with forge if the cache is stale
+    
+    Args:
+        source: Solidity source path relative to the repository root
+        contract_name: Contract name inside the source file
+    """
+    source_path = os.path.join(REPO_ROOT, source)
+    cached_path = _artifact_path(contract_name)
+    
+    if (os.path.exists(cached_path)
+            and os.path.getmtime(cached_path) >= os.path.getmtime(source_path)):
+        with open(cached_path) as f:
+            return json.load(f)
+    
+    BridgeLogger.info(f"Compiling {contract_name} (artifact cache is missing or stale)")
+    with tempfile.TemporaryDirectory() as out_dir:
+        cmd = ["forge", "build", source, "--out", out_dir]
+        try:
+            subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+        except (OSError, subprocess.CalledProcessError) as e:
+            BridgeLogger.warning(f"forge build failed: {e}")
+            return None
+        
+        built_path = os.path.join(out_dir, os.path.basename(source), f"{contract_name}.json")
+        if not os.path.exists(built_path):
+            BridgeLogger.warning(f"forge build produced no artifact at {built_path}")
+            return None
+        
+        os.makedirs(ARTIFACTS_DIR, exist_ok=True)
+        shutil.copyfile(built_path, cached_path)
+    
+    with open(cached_path) as f:
+        return json.load(f)
+
+def deploy_artifact(rpc_url: str, artifact: dict, from_address: str,
+                    gas: int = 2_000_000) -> Optional[str]:
+    """Deploy a compiled artifact from an unlocked node account and return its address
+    
+    Args:
+        rpc_url: RPC URL of the target network
+        artifact: Artifact as returned by load_artifact
+        from_address: Unlocked (anvil default) account that sends the deployment
+        gas: Gas limit for the deployment transaction
+    """
+    bytecode = artifact.get('bytecode', {}).get('object')
+    if not bytecode:
+        BridgeLogger.warning("Artifact has no deployable bytecode")
+        return None
+    
+    rpc = RPCClient.for_url(rpc_url)
+    try:
+        tx_hash = rpc.send_transaction({
+            "from": from_address,
+            "data": bytecode,
+            "gas": hex(gas),
+        })
+        receipt = rpc.wait_for_receipt(tx_hash)
+    except (RPCError, OSError) as e:
+        BridgeLogger.warning(f"Deployment transaction failed: {e}")
+        return None
+    
+    if not receipt or receipt.get('status') != '0x1':
+        BridgeLogger.warning(f"Deployment transaction {tx_hash} was not successful")
+        return None
+    return receipt.get('contractAddress')
+
+def load_deployment(key: str, contract_name: str, rpc_url: str) -> Optional[str]:
+    """Return a previously saved deployment address if the contract is still on chain
+    
+    Args:
+        key: Deployment name the address was saved under
+        contract_name: Contract whose cached artifact the on-chain code is compared to
+        rpc_url: RPC URL of the network the contract was deployed to
+    """
+    try:
+        with open(os.path.join(DEPLOYMENTS_DIR, f"{key}.addr")) as f:
+            address = f.read().strip()
+    except OSError:
+        return None
+    
+    try:
+        code = RPCClient.for_url(rpc_url).call("eth_getCode", [address, "latest"])
+    except (RPCError, OSError) as e:
+        BridgeLogger.debug("Could not check saved deployment %s: %s", key, e)
+        return None
+    if not code or code == "0x":
+        # The sandbox was restarted since the contract was deployed
+        return None
+    
+    # A restarted chain can reuse the address for a different contract
+    cached_path = _artifact_path(contract_name)
+    if os.path.exists(cached_path):
+        with open(cached_path) as f:
+            expected = json.load(f).get('deployedBytecode', {}).get('object')
+        if expected and code.lower() != expected.lower():
+            return None
+    return address
+
+@contextmanager
+def deployment_lock(key: str):
+    """Hold an exclusive file lock for a deployment, so concurrent runs deploy it only once"""
+    os.makedirs(DEPLOYMENTS_DIR, exist_ok=True)
+    with open(os.path.join(DEPLOYMENTS_DIR, f"{key}.lock"), 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def save_deployment(key: str, address: str):
+    """Save a deployment address for reuse by later test runs"""
+    os.makedirs(DEPLOYMENTS_DIR, exist_ok=True)
+    with open(os.path.join(DEPLOYMENTS_DIR, f"{key}.addr"), 'w') as f:
+        f.write(address + "\n")
+
+__all__ = ['ARTIFACTS_DIR', 'DEPLOYMENTS_DIR', 'load_artifact', 'deploy_artifact',
+           'load_deployment', 'save_deployment', 'deployment_lock']
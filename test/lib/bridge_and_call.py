@@ -5,10 +5,11 @@ Functions for bridging assets and executing calls using aggsandbox CLI
 """
 
 import subprocess
-import json
-import os
-from typing import Optional, Tuple
-from bridge_lib import BridgeLogger, AggsandboxAPI, BridgeUtils, BRIDGE_CONFIG
+from typing import Optional
+import bridge_lib
+from bridge_lib import BridgeLogger, BridgeUtils
+from aggsandbox_api import AggsandboxAPI
+from rpc_client import SELECTORS, RPCClient, RPCError, decode_abi
 
 class BridgeAndCall:
     """Bridge and call operations"""
@@ -25,7 +26,8 @@ class BridgeAndCall:
         BridgeLogger.info(f"Call data: {call_data[:66]}...")
         BridgeLogger.info(f"Fallback address: {fallback_address or 'auto-detected'}")
         
-        success, output = AggsandboxAPI.bridge_and_call(
+        # Only the tx hash is needed, so don't wait for the CLI to finish
+        success, output = AggsandboxAPI.bridge_and_call_tx_hash(
             network=source_network,
             destination_network=dest_network,
             token=token_address,
@@ -36,16 +38,11 @@ class BridgeAndCall:
             private_key=private_key
         )
         if not success:
-            BridgeLogger.error(f"Bridge and call transaction failed: {output}")
+            BridgeLogger.error(f"Bridge and call transaction failed or reported no transaction hash: {output}")
             return None
         
-        tx_hash = BridgeUtils.extract_tx_hash(output)
-        if tx_hash:
-            BridgeLogger.success(f"Bridge and call transaction initiated: {tx_hash}")
-            return tx_hash
-        else:
-            BridgeLogger.warning("Could not extract transaction hash")
-            return None
+        BridgeLogger.success(f"Bridge and call transaction initiated: {output}")
+        return output
     
     @staticmethod
     def bridge_and_call_function(source_network: int, dest_network: int, amount: int,
@@ -63,7 +60,7 @@ class BridgeAndCall:
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
             call_data = result.stdout.strip()
             
-            BridgeLogger.debug(f"Encoded call data: {call_data}")
+            BridgeLogger.debug("Encoded call data: %s", call_data)
             
             return BridgeAndCall.bridge_and_call(source_network, dest_network, amount,
                                                token_address, call_address, call_data,
@@ -76,7 +73,7 @@ class BridgeAndCall:
     def deploy_bridge_call_receiver(network_id: int, private_key: str,
                                    contract_name: str = "SimpleBridgeAndCallReceiver") -> Optional[str]:
         """Deploy a receiver contract for testing bridge and call"""
-        if not BRIDGE_CONFIG:
+        if not bridge_lib.BRIDGE_CONFIG:
             BridgeLogger.error("Bridge configuration not initialized")
             return None
         
@@ -87,7 +84,7 @@ class BridgeAndCall:
         BridgeLogger.step(f"Deploying bridge and call receiver contract on network {network_id}")
         BridgeLogger.info(f"Contract: {contract_name}")
         
-        rpc_url = BridgeUtils.get_rpc_url(network_id, BRIDGE_CONFIG)
+        rpc_url = BridgeUtils.get_rpc_url(network_id, bridge_lib.BRIDGE_CONFIG)
         
         cmd = [
             "forge", "create", f"test/contracts/{contract_name}.sol:{contract_name}",
@@ -114,7 +111,7 @@ class BridgeAndCall:
                 return contract_address
             else:
                 BridgeLogger.error("Could not extract contract address from deployment output")
-                BridgeLogger.debug(f"Full output: {output}")
+                BridgeLogger.debug("Full output: %s", output)
                 return None
                 
         except subprocess.CalledProcessError as e:
@@ -127,21 +124,19 @@ class BridgeAndCall:
                                         expected_message: Optional[str] = None,
                                         expected_amount: Optional[int] = None) -> bool:
         """Verify bridge and call execution by checking receiver contract state"""
-        if not BRIDGE_CONFIG:
+        if not bridge_lib.BRIDGE_CONFIG:
             return False
         
         BridgeLogger.step("Verifying bridge and call execution")
         BridgeLogger.info(f"Receiver contract: {receiver_contract}")
         BridgeLogger.info(f"Network: {network_id}")
         
-        rpc_url = BridgeUtils.get_rpc_url(network_id, BRIDGE_CONFIG)
+        # Read the contract over the pooled RPC connection instead of spawning cast per call
+        rpc = RPCClient.for_url(BridgeUtils.get_rpc_url(network_id, bridge_lib.BRIDGE_CONFIG))
         
         try:
             # Check call count
-            cmd = ["cast", "call", receiver_contract, "getCallCount()", "--rpc-url", rpc_url]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            call_count_hex = result.stdout.strip()
-            call_count = int(call_count_hex, 16) if call_count_hex else 0
+            call_count = decode_abi(["uint256"], rpc.eth_call(receiver_contract, SELECTORS["getCallCount()"]))[0]
             
             BridgeLogger.info(f"Call count: {call_count}")
             
@@ -150,19 +145,10 @@ class BridgeAndCall:
                 
                 # Get last message if expected message is provided
                 if expected_message:
-                    cmd = ["cast", "call", receiver_contract, "getLastMessage()", "--rpc-url", rpc_url]
-                    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                    last_message_hex = result.stdout.strip()
+                    last_message = rpc.eth_call(receiver_contract, SELECTORS["getLastMessage()"])
                     
-                    if last_message_hex:
-                        # Decode the string from hex
-                        cmd = ["cast", "abi-decode", "f()(string)", last_message_hex]
-                        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                        decoded_message = result.stdout.strip()
-                        
-                        # Remove surrounding quotes if present (cast abi-decode sometimes adds them)
-                        if decoded_message.startswith('"') and decoded_message.endswith('"'):
-                            decoded_message = decoded_message[1:-1]
+                    if last_message:
+                        decoded_message = decode_abi(["string"], last_message)[0]
                         
                         BridgeLogger.info(f"Last message received: '{decoded_message}'")
                         
@@ -178,6 +164,6 @@ class BridgeAndCall:
                 BridgeLogger.error("❌ No calls recorded in receiver contract")
                 return False
                 
-        except (subprocess.CalledProcessError, ValueError) as e:
+        except (RPCError, OSError, ValueError) as e:
             BridgeLogger.error(f"Could not verify bridge and call execution: {e}")
             return False
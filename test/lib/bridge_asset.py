@@ -4,12 +4,12 @@ Bridge Asset Module - Python Implementation
 Functions for bridging assets using aggsandbox CLI
 """
 
-import subprocess
 import time
-import os
 from typing import Optional, Tuple
-from bridge_lib import BridgeLogger, BridgeUtils, BRIDGE_CONFIG
-from aggsandbox_api import AggsandboxAPI, BridgeAssetArgs
+import bridge_lib
+from bridge_lib import BridgeLogger
+from aggsandbox_api import AggsandboxAPI, BridgeAssetArgs, index_bridges_by_tx_hash
+from claim_asset import ClaimAsset
 
 class BridgeAsset:
     """Asset bridging operations"""
@@ -32,50 +32,119 @@ class BridgeAsset:
             private_key=private_key
         )
         
-        success, output = AggsandboxAPI.bridge_asset(args)
+        # Only the tx hash is needed, so don't wait for the CLI to finish
+        success, output = AggsandboxAPI.bridge_asset_tx_hash(args)
         if not success:
-            BridgeLogger.error(f"Bridge transaction failed: {output}")
+            BridgeLogger.error(f"Bridge transaction failed or reported no transaction hash: {output}")
             return None
         
-        tx_hash = BridgeUtils.extract_tx_hash(output)
-        if tx_hash:
-            BridgeLogger.success(f"Bridge transaction initiated: {tx_hash}")
-            return tx_hash
-        else:
-            BridgeLogger.warning("Could not extract transaction hash")
-            BridgeLogger.debug(f"Output: {output}")
-            return None
+        BridgeLogger.success(f"Bridge transaction initiated: {output}")
+        return output
     
     @staticmethod
     def find_bridge_by_tx_hash(tx_hash: str, source_network: int, max_attempts: int = 6) -> Optional[dict]:
-        """Find bridge transaction in bridge events using aggsandbox show bridges --network-id --json"""
+        """Find bridge transaction in bridge events using aggsandbox show bridges --network-id --json
+        
+        The first check is immediate and the wait between checks grows from
+        200ms by 1.7x up to 3s, within the same max_attempts * 3s budget.
+        """
         BridgeLogger.step(f"Finding bridge in network {source_network} bridge events")
         BridgeLogger.info(f"Looking for bridge TX: {tx_hash}")
         
-        for attempt in range(max_attempts):
-            BridgeLogger.info(f"Checking network {source_network} bridge events (attempt {attempt + 1}/{max_attempts})")
-            time.sleep(3)  # Wait between attempts
+        # Bridges indexed by tx hash; later attempts only add the ones that are new since
+        index = {}
+        seen_deposit_count = None
+        deadline = time.monotonic() + max_attempts * 3
+        delay = 0.2
+        attempt = 0
+        while True:
+            attempt += 1
+            BridgeLogger.info(f"Checking network {source_network} bridge events (attempt {attempt})")
             
             # Get bridges from source network where bridge events are stored
-            bridge_data = AggsandboxAPI.get_bridges(source_network)
-            if bridge_data and bridge_data.get('bridges'):
-                BridgeLogger.debug(f"Found {len(bridge_data['bridges'])} total bridges on network {source_network}")
+            bridge_data = AggsandboxAPI.get_bridges(source_network, since_deposit_count=seen_deposit_count)
+            bridges = (bridge_data or {}).get('bridges')
+            if bridges:
+                BridgeLogger.debug("Found %s new bridges on network %s", len(bridges), source_network)
                 
                 # Look for our specific bridge transaction
-                for bridge in bridge_data['bridges']:
-                    if bridge.get('bridge_tx_hash') == tx_hash:
-                        BridgeLogger.success(f"✅ Found our bridge on network {source_network} (attempt {attempt + 1})!")
-                        return bridge
+                seen_deposit_count = index_bridges_by_tx_hash(bridges, index, seen_deposit_count)
+                bridge = index.get(tx_hash)
+                if bridge:
+                    BridgeLogger.success(f"✅ Found our bridge on network {source_network} (attempt {attempt})!")
+                    return bridge
                 
-                BridgeLogger.debug(f"Our TX {tx_hash} not found yet in network {source_network} bridges")
+                BridgeLogger.debug("Our TX %s not found yet in network %s bridges", tx_hash, source_network)
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.7, 3.0)
         
-        BridgeLogger.warning(f"Bridge TX {tx_hash} not found after {max_attempts} attempts")
+        BridgeLogger.warning(f"Bridge TX {tx_hash} not found after {attempt} attempts")
         return None
     
     @staticmethod
     def get_most_recent_bridge(source_network: int) -> Optional[dict]:
         """Get the most recent bridge from specified network bridge events"""
         bridge_data = AggsandboxAPI.get_bridges(source_network)
-        if bridge_data and bridge_data.get('bridges'):
-            return bridge_data['bridges'][0]  # Most recent
-        return None
\ No newline at end of file
+        bridges = (bridge_data or {}).get('bridges')
+        return bridges[0] if bridges else None  # Most recent
+    
+    @staticmethod
+    def execute_bridge_flow(source_network: int, dest_network: int, amount: int, token_address: str,
+                            dest_account: str, source_private_key: str,
+                            dest_private_key: str) -> Tuple[Optional[str], Optional[str]]:
+        """Bridge assets, wait for the bridge to be indexed and claim it on the destination
+        
+        Returns (bridge tx hash, claim tx hash); either is None if that step failed.
+        """
+        bridge_tx = BridgeAsset.bridge_asset(source_network, dest_network, amount,
+                                             token_address, dest_account, source_private_key)
+        if not bridge_tx:
+            return None, None
+        
+        bridge = BridgeAsset.find_bridge_by_tx_hash(bridge_tx, source_network)
+        if not bridge:
+            return bridge_tx, None
+        
+        # The claim needs the global exit root, which AggKit updates a few seconds after bridging
+        time.sleep(5)
+        claim_tx = ClaimAsset.claim_asset(dest_network, bridge_tx, source_network,
+                                          deposit_count=bridge.get('deposit_count'),
+                                          private_key=dest_private_key)
+        if not claim_tx:
+            return bridge_tx, None
+        
+        ClaimAsset.verify_claim_status(dest_network, bridge_tx, bridge.get('deposit_count'),
+                                       source_network)
+        return bridge_tx, claim_tx
+    
+    @staticmethod
+    def execute_l1_to_l2_bridge(amount: int, token_address: str, source_account: str, dest_account: str,
+                                source_private_key: str, dest_private_key: str) -> Tuple[Optional[str], Optional[str]]:
+        """Complete L1→L2 flow: bridge from L1, wait for indexing and claim on L2
+        
+        source_account is the account of source_private_key; it is kept for
+        symmetry with dest_account.
+        """
+        config = bridge_lib.BRIDGE_CONFIG
+        return BridgeAsset.execute_bridge_flow(
+            config.network_id_mainnet, config.network_id_agglayer_1, amount,
+            token_address, dest_account, source_private_key, dest_private_key
+        )
+    
+    @staticmethod
+    def execute_l2_to_l1_bridge(amount: int, token_address: str, source_account: str, dest_account: str,
+                                source_private_key: str, dest_private_key: str) -> Tuple[Optional[str], Optional[str]]:
+        """Complete L2→L1 flow: bridge from L2, wait for indexing and claim on L1
+        
+        source_account is the account of source_private_key; it is kept for
+        symmetry with dest_account.
+        """
+        config = bridge_lib.BRIDGE_CONFIG
+        return BridgeAsset.execute_bridge_flow(
+            config.network_id_agglayer_1, config.network_id_mainnet, amount,
+            token_address, dest_account, source_private_key, dest_private_key
+        )
@@ -9,26 +9,33 @@ import subprocess
 import json
 import time
 import os
+import functools
+import re
 import sys
-from typing import Optional, Dict, Any, List, Tuple
-from dataclasses import dataclass
-from enum import Enum
+import shlex
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Iterator, Union
+from dataclasses import dataclass, field
+from enum import IntEnum
 
 # Import AggsandboxAPI
 try:
-    from aggsandbox_api import AggsandboxAPI
+    from aggsandbox_api import AggsandboxAPI, json_loads, TX_HASH_RE
 except ImportError:
     # If running as a script, add current directory to path
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from aggsandbox_api import AggsandboxAPI
+    from aggsandbox_api import AggsandboxAPI, json_loads, TX_HASH_RE
+from rpc_client import SELECTORS, RPCClient
 
-class NetworkID(Enum):
-    """Network identifiers"""
+class NetworkID(IntEnum):
+    """Network identifiers, comparable with plain int network IDs"""
     MAINNET = 0
     AGGLAYER_1 = 1
     AGGLAYER_2 = 2
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BridgeConfig:
     """Bridge configuration from environment"""
     private_key_1: str
@@ -48,61 +55,199 @@ class BridgeConfig:
     agg_erc20_l2: Optional[str] = None
     agg_erc20_l3: Optional[str] = None  # L3 AggERC20 contract
     asset_and_call_receiver_l2: Optional[str] = None  # Bridge-and-call receiver contract
+    _rpc_by_net: Dict[int, str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        rpc_by_net = {
+            self.network_id_mainnet: self.rpc_1,
+            self.network_id_agglayer_1: self.rpc_2,
+        }
+        if self.rpc_3:
+            rpc_by_net[self.network_id_agglayer_2 or NetworkID.AGGLAYER_2] = self.rpc_3
+        # Frozen, so the derived field is set around the generated __setattr__
+        object.__setattr__(self, '_rpc_by_net', rpc_by_net)
+
+@dataclass(slots=True)
+class ClaimIndex:
+    """Claims from one `show claims` response, indexed by the keys tests match on"""
+    claims: List[dict]
+    by_bridge_tx: Dict[str, List[int]] = field(default_factory=dict)
+    by_claim_tx: Dict[str, List[int]] = field(default_factory=dict)
+    by_details: Dict[Tuple, List[int]] = field(default_factory=dict)
+    by_deposit: Dict[Tuple[Any, int], List[int]] = field(default_factory=dict)
+    
+    def lookup(self, bridge_tx: Optional[str], claim_tx: Optional[str],
+               details: Optional[Tuple] = None) -> List[dict]:
+        """Return claims matching any of the keys, in response order
+        
+        Args:
+            bridge_tx: Bridge transaction hash
+            claim_tx: Claim transaction hash
+            details: (destination_address, origin_network, destination_network, amount)
+        """
+        positions = set(self.by_bridge_tx.get(bridge_tx, ()))
+        positions.update(self.by_claim_tx.get(claim_tx, ()))
+        positions.update(self.by_details.get(details, ()))
+        return [self.claims[i] for i in sorted(positions)]
+    
+    def for_deposit(self, source_network: Any, deposit_count: int,
+                    statuses: Optional[Tuple[str, ...]] = None) -> List[dict]:
+        """Return claims of one deposit, in response order
+        
+        Deposit counts are per bridge contract, so a deposit is identified by
+        the source (origin) network together with its deposit count.
+        
+        Args:
+            statuses: Only return claims in one of these statuses
+        """
+        claims = [self.claims[i] for i in self.by_deposit.get((source_network, deposit_count), ())]
+        if statuses is not None:
+            claims = [claim for claim in claims if claim.get('status') in statuses]
+        return claims
+
+@dataclass(slots=True)
+class BridgeIndex:
+    """Bridges from one `show bridges` response, indexed by tx hash and deposit count
+    
+    Bridges listed for one network come from a single bridge contract, so the
+    deposit count identifies a bridge within the list. The first bridge wins
+    for each key.
+    """
+    bridges: List[dict]
+    by_tx_hash: Dict[str, dict] = field(default_factory=dict)
+    by_deposit_count: Dict[int, dict] = field(default_factory=dict)
 
 class BridgeLogger:
     """Colored logging for bridge operations"""
     
-    # ANSI color codes
-    GREEN = '\033[0;32m'
-    YELLOW = '\033[1;33m'
-    RED = '\033[0;31m'
-    BLUE = '\033[0;34m'
-    CYAN = '\033[0;36m'
-    NC = '\033[0m'  # No Color
+    # ANSI color codes, left out when output isn't a terminal or NO_COLOR is set
+    _COLOR = sys.stdout.isatty() and 'NO_COLOR' not in os.environ
+    GREEN = '\033[0;32m' if _COLOR else ''
+    YELLOW = '\033[1;33m' if _COLOR else ''
+    RED = '\033[0;31m' if _COLOR else ''
+    BLUE = '\033[0;34m' if _COLOR else ''
+    CYAN = '\033[0;36m' if _COLOR else ''
+    NC = '\033[0m' if _COLOR else ''  # No Color
+    
+    # Level prefixes, built once instead of on every call
+    _STEP = f"{GREEN}[STEP]{NC}"
+    _INFO = f"{YELLOW}[INFO]{NC}"
+    _SUCCESS = f"{GREEN}[SUCCESS]{NC}"
+    _ERROR = f"{RED}[ERROR]{NC}"
+    _WARNING = f"{CYAN}[WARNING]{NC}"
+    _DEBUG = f"{BLUE}[DEBUG]{NC}"
+    
+    # Read once, so debug calls in poll loops don't look up the environment
+    debug_enabled = os.environ.get('DEBUG') == '1'
     
     @classmethod
     def step(cls, msg: str):
-        print(f"{cls.GREEN}[STEP]{cls.NC} {msg}")
+        print(cls._STEP, msg)
     
     @classmethod
     def info(cls, msg: str):
-        print(f"{cls.YELLOW}[INFO]{cls.NC} {msg}")
+        print(cls._INFO, msg)
     
     @classmethod
     def success(cls, msg: str):
-        print(f"{cls.GREEN}[SUCCESS]{cls.NC} {msg}")
+        print(cls._SUCCESS, msg)
     
     @classmethod
     def error(cls, msg: str):
-        print(f"{cls.RED}[ERROR]{cls.NC} {msg}")
+        print(cls._ERROR, msg)
     
     @classmethod
     def warning(cls, msg: str):
-        print(f"{cls.CYAN}[WARNING]{cls.NC} {msg}")
+        print(cls._WARNING, msg)
     
     @classmethod
-    def debug(cls, msg: str):
-        if os.environ.get('DEBUG') == '1':
-            print(f"{cls.BLUE}[DEBUG]{cls.NC} {msg}")
+    def debug(cls, msg: str, *args):
+        """Print a debug message when DEBUG=1
+        
+        Pass values as %-style args rather than formatting them into msg, so
+        the message is only built when it is printed.
+        """
+        if cls.debug_enabled:
+            print(cls._DEBUG, msg % args if args else msg)
+
+# Seconds that sandbox info and status results are reused within a test run
+ENV_CACHE_TTL = 10
+
+# Seconds that a successful transaction receipt is reused
+RECEIPT_CACHE_TTL = 30
+
+# Claim statuses that mean a deposit is claimed or being claimed; anything else
+# (a failed claim) can be sent again
+CLAIMED_STATUSES = ('pending', 'completed', 'complete')
+
+# Parsed sandbox info shared between test processes. It is rebuilt when the
+# .env file changes, which `aggsandbox start` rewrites with the deployed
+# contracts. That stamp stands in for checking `aggsandbox status` or the
+# sandbox PID, which would spawn the subprocess the cache is there to save.
+# Set BRIDGE_CACHE=0 to always query aggsandbox info.
+ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '.env')
+CONFIG_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                                 '.aggsandbox-cache', 'sandbox-config.json')
+
+# Patterns for `aggsandbox info` output. Values may be wrapped in ANSI color codes.
+_ANSI = r'(?:\x1b\[[0-9;]*m)*'
+_ACCOUNT_RE = re.compile(r'\(\d+\):[ \t]+' + _ANSI + r'(0x[0-9a-fA-F]{40})(?![0-9a-fA-F])')
+_PK_RE = re.compile(r'\(\d+\):[ \t]+' + _ANSI + r'(0x[0-9a-fA-F]{64})(?![0-9a-fA-F])')
+_CHAIN_RPC_RE = re.compile(r'Chain ID: ' + _ANSI + r'(\d+)' + _ANSI + r'[ \t]+RPC: ' + _ANSI + r'([^\s\x1b]+)')
+_AGG_RE = re.compile(r'AggERC20: ' + _ANSI + r'([^\s\x1b]+)')
+_MULTI_L2_MARKERS = ('Multi-L2 Polygon Sandbox Config', 'L2-2 (')
+
+# KEY=value lines of a .env file; comments and blank lines don't match
+_ENV_LINE_RE = re.compile(r'^\s*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(.*?)\s*$', re.M)
+
+# Blank line ending an info section, including CRLF and whitespace-only lines
+_BLANK_LINE_RE = re.compile(r'\n[ \t\r]*\n')
+
+def _section(text: str, header: str) -> str:
+    """Text from a section header up to the next blank line"""
+    start = text.find(header)
+    if start < 0:
+        return ''
+    end = _BLANK_LINE_RE.search(text, start)
+    return text[start:] if end is None else text[start:end.start()]
 
 class BridgeEnvironment:
     """Environment management for bridge testing"""
     
     @staticmethod
     def load_environment() -> BridgeConfig:
-        """Load environment configuration from aggsandbox info and .env file"""
+        """Load environment configuration from aggsandbox info and .env file
+        
+        The result is reused for ENV_CACHE_TTL seconds, so importing the library
+        and initializing the environment don't both shell out to aggsandbox info.
+        """
+        return BridgeEnvironment._load_environment(BridgeEnvironment._cache_window())
+    
+    @staticmethod
+    def _cache_window() -> int:
+        return int(time.monotonic() // ENV_CACHE_TTL)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_environment(_window: int) -> BridgeConfig:
         BridgeLogger.step("Loading environment from aggsandbox info")
         
         # Load .env file if it exists
         BridgeEnvironment._load_env_file()
         
-        # Get sandbox info
-        success, info_output = AggsandboxAPI.info()
-        if not success:
-            raise RuntimeError(f"Failed to get sandbox info: {info_output}")
-        
-        # Parse the info output to extract configuration
-        config_data = BridgeEnvironment._parse_sandbox_info(info_output)
+        # Stamped before `info` runs, so info from before a concurrent .env
+        # rewrite is never saved under the new stamp
+        stamp = BridgeEnvironment._env_file_stamp()
+        config_data = BridgeEnvironment._read_config_cache(stamp)
+        if config_data is None:
+            # Get sandbox info
+            success, info_output = AggsandboxAPI.info()
+            if not success:
+                raise RuntimeError(f"Failed to get sandbox info: {info_output}")
+            
+            # Parse the info output to extract configuration
+            config_data = BridgeEnvironment._parse_sandbox_info(info_output)
+            BridgeEnvironment._write_config_cache(config_data, stamp)
         
         config = BridgeConfig(
             private_key_1=config_data['private_keys'][0],  # Account (0)
@@ -131,88 +276,84 @@ class BridgeEnvironment:
         BridgeLogger.info(f"Account 1: {config.account_address_1}")
         BridgeLogger.info(f"Account 2: {config.account_address_2}")
         if config.network_id_agglayer_2:
-            BridgeLogger.debug(f"Multi-L2 mode detected: L3 Network ID {config.network_id_agglayer_2}")
+            BridgeLogger.debug("Multi-L2 mode detected: L3 Network ID %s", config.network_id_agglayer_2)
         
         return config
     
+    @staticmethod
+    def _env_file_stamp() -> Optional[List[int]]:
+        try:
+            stat = os.stat(ENV_FILE)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+    
+    @staticmethod
+    def _read_config_cache(stamp: Optional[List[int]]) -> Optional[Dict[str, Any]]:
+        """Parsed sandbox info saved by a previous run, if it was saved under this .env stamp"""
+        if os.environ.get('BRIDGE_CACHE') == '0':
+            return None
+        if stamp is None:
+            return None
+        try:
+            with open(CONFIG_CACHE_PATH, 'rb') as f:
+                cached = json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if cached.get('env_stamp') != stamp:
+            return None
+        BridgeLogger.debug("Using cached sandbox info from %s", CONFIG_CACHE_PATH)
+        return cached.get('config')
+    
+    @staticmethod
+    def _write_config_cache(config_data: Dict[str, Any], stamp: Optional[List[int]]):
+        """Save parsed sandbox info for later runs, replacing the file atomically
+        
+        stamp is the .env stamp taken before `info` ran. Nothing is saved if
+        .env has changed since, as the info may predate the change.
+        """
+        if stamp is None or os.environ.get('BRIDGE_CACHE') == '0':
+            return
+        if BridgeEnvironment._env_file_stamp() != stamp:
+            BridgeLogger.debug(".env changed while reading sandbox info; not caching it")
+            return
+        tmp_path = f"{CONFIG_CACHE_PATH}.{os.getpid()}"
+        try:
+            os.makedirs(os.path.dirname(CONFIG_CACHE_PATH), exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({'env_stamp': stamp, 'config': config_data}, f)
+            os.replace(tmp_path, CONFIG_CACHE_PATH)
+        except OSError as e:
+            BridgeLogger.debug("Could not save sandbox info cache: %s", e)
+    
     @staticmethod
     def _parse_sandbox_info(info_output: str) -> Dict[str, Any]:
         """Parse aggsandbox info output to extract configuration"""
-        lines = info_output.split('\n')
-        
-        accounts = []
-        private_keys = []
+        accounts = [m.group(1) for m in _ACCOUNT_RE.finditer(_section(info_output, "Available Accounts"))]
+        private_keys = [m.group(1) for m in _PK_RE.finditer(_section(info_output, "Private Keys"))]
         l1_rpc = None
         l2_rpc = None
         l3_rpc = None
         l2_chain_id = None
         l3_chain_id = None
-        agg_erc20_l1 = None
-        agg_erc20_l2 = None
-        agg_erc20_l3 = None
-        is_multi_l2 = False
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Parse Available Accounts section
-            if line == "Available Accounts":
-                i += 2  # Skip separator line
-                while i < len(lines) and lines[i].strip().startswith('('):
-                    account_line = lines[i].strip()
-                    if ': 0x' in account_line:
-                        account_addr = account_line.split(': ')[1]
-                        accounts.append(account_addr)
-                    i += 1
-                continue
-            
-            # Parse Private Keys section
-            elif line == "Private Keys":
-                i += 2  # Skip separator line
-                while i < len(lines) and lines[i].strip().startswith('('):
-                    key_line = lines[i].strip()
-                    if ': 0x' in key_line:
-                        private_key = key_line.split(': ')[1]
-                        private_keys.append(private_key)
-                    i += 1
-                continue
-            
-            # Parse L1 RPC (looking for Chain ID: 1)
-            elif 'Chain ID: 1    RPC:' in line:
-                rpc_part = line.split('RPC: ')[1]
-                l1_rpc = rpc_part.strip()
-            
-            # Parse L2 RPC and Chain ID (looking for Chain ID: 1101)
-            elif 'Chain ID: 1101    RPC:' in line:
-                chain_id_part = line.split('Chain ID: ')[1].split('RPC:')[0].strip()
-                l2_chain_id = int(chain_id_part)
-                rpc_part = line.split('RPC: ')[1]
-                l2_rpc = rpc_part.strip()
-            
-            # Parse L3 RPC and Chain ID (looking for Chain ID: 137 - L2-2)
-            elif 'Chain ID: 137    RPC:' in line:
-                chain_id_part = line.split('Chain ID: ')[1].split('RPC:')[0].strip()
-                l3_chain_id = int(chain_id_part)
-                rpc_part = line.split('RPC: ')[1]
-                l3_rpc = rpc_part.strip()
-                is_multi_l2 = True
-            
-            # Detect multi-L2 mode
-            elif 'Multi-L2 Polygon Sandbox Config:' in line or 'L2-2 (' in line:
+        is_multi_l2 = any(marker in info_output for marker in _MULTI_L2_MARKERS)
+        
+        # Network lines are told apart by the chain IDs the sandbox deploys
+        for m in _CHAIN_RPC_RE.finditer(info_output):
+            chain_id, rpc = int(m.group(1)), m.group(2)
+            if chain_id == 1 and l1_rpc is None:
+                l1_rpc = rpc
+            elif chain_id == 1101 and l2_rpc is None:
+                l2_chain_id, l2_rpc = chain_id, rpc
+            elif chain_id == 137 and l3_rpc is None:
+                l3_chain_id, l3_rpc = chain_id, rpc
                 is_multi_l2 = True
-            
-            # Parse AggERC20 contracts
-            elif 'AggERC20:' in line:
-                contract_addr = line.split('AggERC20: ')[1].strip()
-                if agg_erc20_l1 is None:  # First occurrence is L1
-                    agg_erc20_l1 = contract_addr
-                elif agg_erc20_l2 is None:  # Second occurrence is L2
-                    agg_erc20_l2 = contract_addr
-                elif agg_erc20_l3 is None and is_multi_l2:  # Third occurrence is L3 (if multi-L2)
-                    agg_erc20_l3 = contract_addr
-            
-            i += 1
+        
+        # AggERC20 lines come in L1, L2, L3 order; the third only exists in multi-L2 mode
+        agg_erc20 = _AGG_RE.findall(info_output)
+        agg_erc20_l1 = agg_erc20[0] if len(agg_erc20) > 0 else None
+        agg_erc20_l2 = agg_erc20[1] if len(agg_erc20) > 1 else None
+        agg_erc20_l3 = agg_erc20[2] if len(agg_erc20) > 2 and is_multi_l2 else None
         
         # Add manual L3 configuration if multi-L2 mode detected but L3 info missing
         if is_multi_l2:
@@ -255,22 +396,38 @@ class BridgeEnvironment:
     @staticmethod
     def _load_env_file():
         """Load .env file variables into environment"""
-        env_path = os.path.join(os.path.dirname(__file__), '..', '..', '.env')
-        if os.path.exists(env_path):
-            BridgeLogger.debug(f"Loading .env file from {env_path}")
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        os.environ[key.strip()] = value.strip()
-            BridgeLogger.debug("✅ .env file loaded successfully")
-        else:
+        try:
+            with open(ENV_FILE, 'r') as f:
+                text = f.read()
+        except FileNotFoundError:
             BridgeLogger.debug("No .env file found")
+            return
+        BridgeLogger.debug("Loading .env file from %s", ENV_FILE)
+        os.environ.update(_ENV_LINE_RE.findall(text))
+        BridgeLogger.debug("✅ .env file loaded successfully")
+    
+    @staticmethod
+    def load_environment_and_validate() -> Optional[BridgeConfig]:
+        """Validate sandbox status and load the environment concurrently
+        
+        Both shell out to aggsandbox, so running them side by side takes as long
+        as the slower one. Returns None if the sandbox is not running.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            config_future = executor.submit(BridgeEnvironment.load_environment)
+            status_future = executor.submit(BridgeEnvironment.validate_sandbox_status)
+            if not status_future.result():
+                return None
+            return config_future.result()
     
     @staticmethod
     def validate_sandbox_status() -> bool:
-        """Validate that aggsandbox is running"""
+        """Validate that aggsandbox is running (cached for ENV_CACHE_TTL seconds)"""
+        return BridgeEnvironment._validate_sandbox_status(BridgeEnvironment._cache_window())
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _validate_sandbox_status(_window: int) -> bool:
         BridgeLogger.step("Validating sandbox status")
         
         # Check if sandbox is running using AggsandboxAPI
@@ -285,105 +442,320 @@ class BridgeEnvironment:
 
 # AggsandboxAPI is now in aggsandbox_api.py - import from there
 
+# Lines that carry the transaction hash, in priority order:
+# claim, message, bridge-and-call and bridge transactions (not approvals), then any transaction
+_TX_LINE_MARKERS = (
+    '✅ claim transaction submitted:',
+    'bridge message transaction submitted',
+    'bridge and call transaction submitted',
+    'bridge transaction submitted',
+    'transaction',
+)
+_TX_LINE_MARKERS_BYTES = tuple(marker.encode() for marker in _TX_LINE_MARKERS)
+_TX_HASH_BYTES_RE = re.compile(TX_HASH_RE.pattern.encode())
+
+def _claim_match_keys(claim: dict) -> Tuple[Tuple, Tuple, Tuple]:
+    """Keys a claim can be matched on, in the form used by iter_matching_claims"""
+    return (
+        ('bridge_tx', claim.get('bridge_tx_hash')),
+        ('claim_tx', claim.get('claim_tx_hash')),
+        ('details', claim.get('destination_address'), claim.get('origin_network'),
+         claim.get('destination_network'), claim.get('amount')),
+    )
+
 class BridgeUtils:
     """Utility functions for bridge operations"""
     
     @staticmethod
-    def extract_tx_hash(output: str) -> Optional[str]:
+    def extract_tx_hash(output: Union[str, bytes]) -> Optional[str]:
         """Extract transaction hash from aggsandbox output"""
-        lines = output.split('\n')
-        
-        # Look for claim transaction submitted (for claim operations)
-        for line in lines:
-            if '✅ claim transaction submitted:' in line.lower() and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        return word
-        
-        # Look for bridge message transaction (for message bridges)
-        for line in lines:
-            line_clean = line.lower().strip()
-            if 'bridge message transaction submitted' in line_clean and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        return word
-        
-        # Look for bridge and call transaction (for bridge-and-call operations)
-        for line in lines:
-            if 'bridge and call transaction submitted' in line.lower() and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        return word
-        
-        # Look for the bridge transaction specifically (not approval)
-        for line in lines:
-            if 'bridge transaction submitted' in line.lower() and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        return word
-        
-        # Fallback: look for any transaction hash
-        for line in lines:
-            if 'transaction' in line.lower() and '0x' in line:
-                words = line.split()
-                for word in words:
-                    if word.startswith('0x') and len(word) == 66:
-                        return word
+        # The marker with the lowest priority wins, and within one marker the first
+        # matching line wins. Lines are located by searching one ASCII-lowercased
+        # copy of the output instead of splitting it and lowercasing every line.
+        data = output.encode() if isinstance(output, str) else output
+        lowered = data.lower()
+        for priority, marker in enumerate(_TX_LINE_MARKERS_BYTES):
+            pos = lowered.find(marker)
+            while pos >= 0:
+                start = lowered.rfind(b'\n', 0, pos) + 1
+                end = lowered.find(b'\n', pos)
+                if end < 0:
+                    end = len(lowered)
+                # A line only counts for the highest-priority marker it contains
+                if not any(lowered.find(m, start, end) >= 0 for m in _TX_LINE_MARKERS_BYTES[:priority]):
+                    match = _TX_HASH_BYTES_RE.search(data, start, end)
+                    if match:
+                        return match.group(0).decode()
+                pos = lowered.find(marker, end)
         
         return None
     
     @staticmethod
     def get_rpc_url(network_id: int, config: BridgeConfig) -> str:
         """Get RPC URL for a network"""
-        if network_id == config.network_id_mainnet:
-            return config.rpc_1
-        elif network_id == config.network_id_agglayer_1:
-            return config.rpc_2
-        elif network_id == config.network_id_agglayer_2 and config.rpc_3:
-            return config.rpc_3
-        elif network_id == 2:  # Fallback for L2-2 (Agglayer-2) in multi-L2 mode
-            return "http://localhost:8547"
-        else:
-            raise ValueError(f"Unknown network ID: {network_id}")
+        try:
+            return config._rpc_by_net[network_id]
+        except KeyError:
+            raise ValueError(f"Unknown network ID: {network_id}") from None
+    
+    @staticmethod
+    def backoff_delay(base_delay: float, attempt: int, max_delay: float = 60) -> float:
+        """Seconds to wait after failed attempt number `attempt` (from 1)
+        
+        The delay doubles per attempt up to max_delay, with +/-50% jitter so
+        concurrent retries don't hit the node in lockstep.
+        """
+        return min(base_delay * 2 ** (attempt - 1), max_delay) * random.uniform(0.5, 1.5)
+    
+    @staticmethod
+    def rpc_client(network_id: int, config: BridgeConfig) -> RPCClient:
+        """Get the shared keep-alive JSON-RPC client for a network"""
+        return RPCClient.for_url(BridgeUtils.get_rpc_url(network_id, config))
+    
+    _receipts: Dict[Tuple[str, int], Tuple[float, dict]] = {}
+    
+    @staticmethod
+    def get_transaction_receipt(tx_hash: str, network_id: int, config: BridgeConfig,
+                                timeout: float = 30) -> Optional[dict]:
+        """Wait for a transaction receipt like `cast receipt`, over the shared RPC connection
+        
+        Successful receipts are kept for RECEIPT_CACHE_TTL seconds, so verifying
+        the same transaction again doesn't go back to the node. Failed or
+        missing receipts are always fetched again.
+        
+        Args:
+            timeout: Seconds to keep polling for the receipt (0 polls once)
+        """
+        key = (tx_hash, network_id)
+        cached = BridgeUtils._receipts.get(key)
+        if cached is not None and time.monotonic() - cached[0] < RECEIPT_CACHE_TTL:
+            return cached[1]
+        
+        receipt = BridgeUtils.rpc_client(network_id, config).wait_for_receipt(tx_hash, timeout=timeout)
+        if receipt and receipt.get('status') == '0x1':
+            BridgeUtils._receipts[key] = (time.monotonic(), receipt)
+        return receipt
+    
+    @staticmethod
+    def get_transaction_receipts(tx_hashes: List[str], network_id: int,
+                                 config: BridgeConfig) -> List[Optional[dict]]:
+        """Get several transaction receipts without waiting, in one JSON-RPC batch
+        
+        Cached successful receipts are reused as in get_transaction_receipt, and
+        only the others are fetched. Returns the receipts in order (None when a
+        transaction isn't mined yet).
+        """
+        now = time.monotonic()
+        receipts: List[Optional[dict]] = []
+        missing = []
+        for position, tx_hash in enumerate(tx_hashes):
+            cached = BridgeUtils._receipts.get((tx_hash, network_id))
+            if cached is not None and now - cached[0] < RECEIPT_CACHE_TTL:
+                receipts.append(cached[1])
+            else:
+                receipts.append(None)
+                missing.append(position)
+        
+        fetched = BridgeUtils.rpc_client(network_id, config).batch_call(
+            [("eth_getTransactionReceipt", [tx_hashes[position]]) for position in missing]
+        )
+        now = time.monotonic()
+        for position, receipt in zip(missing, fetched):
+            receipts[position] = receipt
+            if receipt and receipt.get('status') == '0x1':
+                BridgeUtils._receipts[(tx_hashes[position], network_id)] = (now, receipt)
+        return receipts
     
     @staticmethod
     def get_token_balance(token_address: str, account_address: str, 
                          network_id: int, config: BridgeConfig) -> int:
-        """Get token balance using aggsandbox CLI (placeholder - would need aggsandbox balance command)"""
-        # Note: aggsandbox doesn't have a direct balance command yet
-        # This is a placeholder that would use aggsandbox when available
-        # For now, we'll indicate this limitation
-        BridgeLogger.debug(f"Balance check needed for {account_address} on network {network_id}")
-        BridgeLogger.debug("Note: aggsandbox CLI doesn't have balance command yet")
-        return 0  # Placeholder return
+        """Get an ERC20 token balance with an eth_call to balanceOf"""
+        return BridgeUtils.get_token_balances([(token_address, account_address, network_id)], config)[0]
+    
+    @staticmethod
+    def get_token_balances(queries: List[Tuple[str, str, int]], config: BridgeConfig) -> List[int]:
+        """Get ERC20 token balances with one JSON-RPC batch per network
+        
+        Args:
+            queries: (token_address, account_address, network_id) tuples
+            config: Bridge configuration used to find each network's RPC URL
+        
+        Returns the balances in query order. Raises RPCError if a call fails.
+        """
+        by_network: Dict[int, List[int]] = {}
+        for position, (_, _, network_id) in enumerate(queries):
+            by_network.setdefault(network_id, []).append(position)
+        
+        balances = [0] * len(queries)
+        for network_id, positions in by_network.items():
+            calls = []
+            for position in positions:
+                token_address, account_address, _ = queries[position]
+                data = SELECTORS["balanceOf(address)"] + account_address[2:].lower().rjust(64, '0')
+                calls.append(("eth_call", [{"to": token_address, "data": data}, "latest"]))
+            results = BridgeUtils.rpc_client(network_id, config).batch_call(calls)
+            for position, result in zip(positions, results):
+                balances[position] = int(result, 16) if result and result != "0x" else 0
+        return balances
     
     @staticmethod
     def get_bridge_tx_hash(bridge: dict) -> str:
         """Get transaction hash from bridge object, handling both old and new field names"""
-        return bridge.get('bridge_tx_hash') or bridge.get('bridge_tx_hash')
+        return bridge.get('bridge_tx_hash') or bridge.get('tx_hash')
+    
+    _bridge_index: Optional[BridgeIndex] = None
+    
+    @staticmethod
+    def index_bridges(bridges: List[dict]) -> BridgeIndex:
+        """Index bridges by transaction hash and deposit count
+        
+        Like index_claims, the index of the last bridges list is kept for polls
+        that get the same cached response back from AggsandboxAPI.get_bridges.
+        """
+        cached = BridgeUtils._bridge_index
+        if cached is not None and cached.bridges is bridges:
+            return cached
+        
+        index = BridgeIndex(bridges)
+        for bridge in bridges:
+            tx_hash = BridgeUtils.get_bridge_tx_hash(bridge)
+            if tx_hash:
+                index.by_tx_hash.setdefault(tx_hash, bridge)
+            deposit_count = bridge.get('deposit_count')
+            if deposit_count is not None:
+                index.by_deposit_count.setdefault(deposit_count, bridge)
+        
+        BridgeUtils._bridge_index = index
+        return index
+    
+    _claim_index: Optional[ClaimIndex] = None
+    
+    @staticmethod
+    def index_claims(claims: List[dict]) -> ClaimIndex:
+        """Index claims by bridge tx, claim tx, bridge details and (origin network, deposit count)
+        
+        The index of the last claims list is kept, so polls that get the same
+        cached response back from AggsandboxAPI.get_claims reuse it.
+        """
+        cached = BridgeUtils._claim_index
+        if cached is not None and cached.claims is claims:
+            return cached
+        
+        index = ClaimIndex(claims)
+        for position, claim in enumerate(claims):
+            bridge_tx = claim.get('bridge_tx_hash')
+            if bridge_tx:
+                index.by_bridge_tx.setdefault(bridge_tx, []).append(position)
+            claim_tx = claim.get('claim_tx_hash')
+            if claim_tx:
+                index.by_claim_tx.setdefault(claim_tx, []).append(position)
+            details = (claim.get('destination_address'), claim.get('origin_network'),
+                       claim.get('destination_network'), claim.get('amount'))
+            index.by_details.setdefault(details, []).append(position)
+            deposit_count = claim.get('deposit_count')
+            if deposit_count is not None:
+                index.by_deposit.setdefault((claim.get('origin_network'), deposit_count), []).append(position)
+        
+        BridgeUtils._claim_index = index
+        return index
+    
+    @staticmethod
+    def iter_matching_claims(claims: Iterable[dict], bridge_tx: Optional[str], claim_tx: Optional[str],
+                             details: Optional[Tuple] = None) -> Iterator[dict]:
+        """Yield claims matching a bridge by bridge tx, claim tx or bridge details
+        
+        A claims list is matched through its index; any other iterable (such as
+        AggsandboxAPI.iter_claims) is filtered lazily so the caller can stop early.
+        """
+        if isinstance(claims, list):
+            yield from BridgeUtils.index_claims(claims).lookup(bridge_tx, claim_tx, details)
+            return
+        
+        # Build the accepted keys once, then each claim costs three set probes
+        wanted = set()
+        if bridge_tx:
+            wanted.add(('bridge_tx', bridge_tx))
+        if claim_tx:
+            wanted.add(('claim_tx', claim_tx))
+        if details is not None:
+            wanted.add(('details',) + tuple(details))
+        
+        for claim in claims:
+            if not wanted.isdisjoint(_claim_match_keys(claim)):
+                yield claim
+    
+    @staticmethod
+    def pick_claims_by_status(matches: Iterable[dict]) -> Tuple[Optional[dict], Optional[dict]]:
+        """Return the (completed, pending) entries among matching claims
+        
+        The same deposit is commonly listed both as PENDING and as COMPLETED.
+        """
+        completed = pending = None
+        for claim in matches:
+            status = claim.get('status')
+            if status == 'completed':
+                completed = claim
+            elif status == 'pending':
+                pending = claim
+        return completed, pending
     
     @staticmethod
     def find_bridge_by_tx_hash(bridges: list, tx_hash: str) -> dict:
         """Find bridge in list by transaction hash, handling both old and new field names"""
-        for bridge in bridges:
-            if bridge.get('bridge_tx_hash') == tx_hash:
-                return bridge
+        return BridgeUtils.index_bridges(bridges).by_tx_hash.get(tx_hash)
+    
+    @staticmethod
+    def find_bridge_by_deposit_count(bridges: list, deposit_count: int) -> Optional[dict]:
+        """Find bridge in list by deposit count"""
+        return BridgeUtils.index_bridges(bridges).by_deposit_count.get(deposit_count)
+    
+    @staticmethod
+    def run_until_match(cmd: List[str], pattern: re.Pattern, timeout: int = 120) -> Optional[str]:
+        """Run a command and return the first group of pattern from its output
+        
+        Output is read line by line and the process is terminated as soon as a
+        line matches, instead of waiting for it to exit and buffering everything.
+        Raises subprocess.CalledProcessError if it exits non-zero without a match.
+        """
+        if BridgeLogger.debug_enabled:
+            BridgeLogger.debug("Executing: %s", shlex.join(cmd))
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, bufsize=1)
+        timer = threading.Timer(timeout, proc.kill)
+        timer.start()
+        output = []
+        try:
+            for line in proc.stdout:
+                match = pattern.search(line)
+                if match:
+                    proc.terminate()
+                    return match.group(1)
+                output.append(line)
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+            proc.wait()
+        
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, output=''.join(output))
         return None
 
-# Initialize global configuration
-try:
-    BRIDGE_CONFIG = BridgeEnvironment.load_environment()
-    BridgeLogger.debug("Bridge library initialized successfully")
-except Exception as e:
-    BridgeLogger.error(f"Failed to initialize bridge library: {e}")
-    BRIDGE_CONFIG = None
+# Global configuration is loaded on first access, so importing the library only
+# for BridgeLogger or BridgeUtils doesn't shell out to aggsandbox info
+def __getattr__(name: str):
+    if name == 'BRIDGE_CONFIG':
+        try:
+            config = BridgeEnvironment.load_environment()
+            BridgeLogger.debug("Bridge library initialized successfully")
+        except Exception as e:
+            BridgeLogger.error(f"Failed to initialize bridge library: {e}")
+            config = None
+        globals()['BRIDGE_CONFIG'] = config
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Export main classes for use in other modules
 __all__ = [
-    'NetworkID', 'BridgeConfig', 'BridgeLogger', 'BridgeEnvironment',
-    'BridgeUtils', 'BRIDGE_CONFIG'
+    'NetworkID', 'BridgeConfig', 'BridgeIndex', 'ClaimIndex', 'BridgeLogger', 'BridgeEnvironment',
+    'BridgeUtils', 'BRIDGE_CONFIG', 'json_loads'
 ]
@@ -4,11 +4,45 @@ Bridge Message Module - Python Implementation
 Functions for bridging messages using aggsandbox CLI
 """
 
-import subprocess
 import os
-from typing import Optional
+import subprocess
+from typing import List, Optional
 from bridge_lib import BridgeLogger, BridgeUtils
 from aggsandbox_api import AggsandboxAPI
+from rpc_client import encode_abi, signature_types
+
+# Set AGGSANDBOX_CAST_ENCODE=1 to encode with `cast abi-encode` (for parity checks)
+_CAST_ENCODE = os.environ.get("AGGSANDBOX_CAST_ENCODE") == "1"
+
+def _encode_cli_args(function_signature: str, args: List[str]) -> Optional[str]:
+    """Encode `cast abi-encode` style string arguments in-process
+    
+    Returns None when the signature uses types encode_abi doesn't handle
+    (arrays, tuples), so the caller can fall back to cast. Raises ValueError
+    or OverflowError for arguments it can't parse (such as "1e18"), which
+    cast may still accept.
+    """
+    types = signature_types(function_signature)
+    if types is None or len(types) != len(args):
+        return None
+    values = []
+    for abi_type, arg in zip(types, args):
+        if abi_type in ('address', 'string'):
+            values.append(arg)
+        elif abi_type == 'bool':
+            if arg not in ('true', 'false'):
+                raise ValueError(f"Invalid bool {arg!r}")
+            values.append(arg == 'true')
+        elif abi_type.startswith('bytes'):
+            values.append(bytes.fromhex(arg[2:] if arg.startswith('0x') else arg))
+        else:
+            values.append(int(arg, 0))
+    return encode_abi(types, values)
+
+def _cast_abi_encode(function_signature: str, args: List[str]) -> str:
+    cmd = ["cast", "abi-encode", function_signature] + args
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
 
 class BridgeMessage:
     """Message bridging operations"""
@@ -46,15 +80,16 @@ class BridgeMessage:
         """Bridge a simple text message"""
         BridgeLogger.step(f"Bridging text message: '{text_message}'")
         
-        # Encode the text message as bytes
+        # Encode the text message as bytes (what `cast abi-encode "f(string)"` produces)
         try:
-            cmd = ["cast", "abi-encode", "f(string)", text_message]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            message_data = result.stdout.strip()
+            if _CAST_ENCODE:
+                message_data = _cast_abi_encode("f(string)", [text_message])
+            else:
+                message_data = encode_abi(["string"], [text_message])
             
-            BridgeLogger.debug(f"Encoded message data: {message_data}")
+            BridgeLogger.debug("Encoded message data: %s", message_data)
             
-            return BridgeMessage.bridge_message(source_network, dest_network, 
+            return BridgeMessage.bridge_message(source_network, dest_network,
                                               to_address, message_data, private_key)
         except subprocess.CalledProcessError as e:
             BridgeLogger.error(f"Failed to encode text message: {e}")
@@ -69,13 +104,19 @@ class BridgeMessage:
         BridgeLogger.info(f"Function: {function_signature}")
         BridgeLogger.info(f"Parameters: {args}")
         
-        # Encode the function call
+        # Encode the function call, using cast only for types or arguments
+        # encode_abi doesn't handle
         try:
-            cmd = ["cast", "abi-encode", function_signature] + list(args)
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            message_data = result.stdout.strip()
+            message_data = None
+            if not _CAST_ENCODE:
+                try:
+                    message_data = _encode_cli_args(function_signature, list(args))
+                except (ValueError, OverflowError) as e:
+                    BridgeLogger.debug("Encoding with cast instead: %s", e)
+            if message_data is None:
+                message_data = _cast_abi_encode(function_signature, list(args))
             
-            BridgeLogger.debug(f"Encoded function call: {message_data}")
+            BridgeLogger.debug("Encoded function call: %s", message_data)
             
             return BridgeMessage.bridge_message(source_network, dest_network,
                                               to_address, message_data, private_key)
@@ -5,31 +5,31 @@ Functions for claiming bridged assets using aggsandbox CLI
 """
 
 import time
-import os
-import json
-import subprocess
-from typing import Optional
-from bridge_lib import BridgeLogger, BridgeUtils, BRIDGE_CONFIG
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+from bridge_lib import BridgeLogger, BridgeUtils, CLAIMED_STATUSES
 from aggsandbox_api import AggsandboxAPI, BridgeClaimArgs
 
 class ClaimAsset:
     """Asset claiming operations"""
     
     @staticmethod
-    def claim_asset(dest_network: int, tx_hash: str, source_network: int) -> Optional[str]:
-        """Claim bridged assets using aggsandbox CLI"""
+    def _claim_args(dest_network: int, tx_hash: str, source_network: int,
+                    deposit_count: Optional[int], private_key: Optional[str]) -> BridgeClaimArgs:
         BridgeLogger.step(f"Claiming bridged assets on network {dest_network}")
         BridgeLogger.info(f"Source transaction: {tx_hash}")
         BridgeLogger.info(f"Source network: {source_network}")
         
-        # Use the new aggsandbox API
-        args = BridgeClaimArgs(
+        return BridgeClaimArgs(
             network=dest_network,
             tx_hash=tx_hash,
             source_network=source_network,
+            deposit_count=deposit_count,
+            private_key=private_key,
         )
-        
-        success, output = AggsandboxAPI.bridge_claim(args)
+    
+    @staticmethod
+    def _claim_outcome(success: bool, output: str) -> Optional[str]:
         if not success:
             BridgeLogger.error(f"Claim transaction failed: {output}")
             
@@ -52,7 +52,165 @@ class ClaimAsset:
             return "completed"
     
     @staticmethod
-    def verify_claim_status(network_id: int, bridge_tx_hash: str, deposit_count: int) -> Optional[str]:
+    def claim_asset(dest_network: int, tx_hash: str, source_network: int,
+                    deposit_count: Optional[int] = None, private_key: Optional[str] = None) -> Optional[str]:
+        """Claim bridged assets using aggsandbox CLI"""
+        args = ClaimAsset._claim_args(dest_network, tx_hash, source_network, deposit_count, private_key)
+        return ClaimAsset._claim_outcome(*AggsandboxAPI.bridge_claim(args))
+    
+    @staticmethod
+    async def claim_asset_async(dest_network: int, tx_hash: str, source_network: int,
+                                deposit_count: Optional[int] = None,
+                                private_key: Optional[str] = None) -> Optional[str]:
+        """Async variant of claim_asset"""
+        args = ClaimAsset._claim_args(dest_network, tx_hash, source_network, deposit_count, private_key)
+        return ClaimAsset._claim_outcome(*await AggsandboxAPI.bridge_claim_async(args))
+    
+    @staticmethod
+    def find_existing_claim(dest_network: int, bridge_tx_hash: str, deposit_count: Optional[int] = None,
+                            source_network: Optional[int] = None, ttl_ms: int = 1000) -> Optional[dict]:
+        """Return the pending or completed claim for a bridge from one `show claims` poll
+        
+        Failed claims are ignored, so a deposit whose claim failed is claimed again.
+        """
+        claims_data = AggsandboxAPI.get_claims(dest_network, ttl_ms=ttl_ms)
+        if not claims_data:
+            return None
+        return ClaimAsset._lookup_claim(claims_data.get('claims', []), bridge_tx_hash, deposit_count,
+                                        source_network, statuses=CLAIMED_STATUSES)
+    
+    @staticmethod
+    def _wait_for_claim_ready(dest_network: int, bridge_tx_hash: str, deposit_count: Optional[int],
+                              source_network: Optional[int], max_wait: float,
+                              max_interval: float) -> Optional[dict]:
+        """Poll for the claim until it appears or max_wait expires
+        
+        Polls start 500ms apart and double up to max_interval, so a claim that
+        lands soon after a failed attempt is seen without sitting out the whole
+        retry delay.
+        """
+        deadline = time.monotonic() + max_wait
+        interval = 0.5
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(interval, remaining))
+            existing = ClaimAsset.find_existing_claim(dest_network, bridge_tx_hash, deposit_count,
+                                                     source_network, ttl_ms=0)
+            if existing:
+                return existing
+            interval = min(interval * 2, max_interval)
+    
+    @staticmethod
+    def _lookup_claim(claims: List[dict], bridge_tx_hash: str, deposit_count: Optional[int],
+                      source_network: Optional[int] = None,
+                      statuses: Optional[Tuple[str, ...]] = None) -> Optional[dict]:
+        """First claim in the list for the deposit, optionally only in one of statuses
+        
+        A deposit count is only unique per source network, so the claim is
+        matched on (source network, deposit count) when both are known and on
+        the bridge tx hash otherwise.
+        """
+        index = BridgeUtils.index_claims(claims)
+        if deposit_count is not None and source_network is not None:
+            matches = index.for_deposit(source_network, deposit_count, statuses)
+        else:
+            matches = [claims[i] for i in index.by_bridge_tx.get(bridge_tx_hash, ())]
+            if statuses is not None:
+                matches = [claim for claim in matches if claim.get('status') in statuses]
+        return matches[0] if matches else None
+    
+    @staticmethod
+    def claim_asset_with_retry(dest_network: int, tx_hash: str, source_network: int,
+                               deposit_count: Optional[int] = None, private_key: Optional[str] = None,
+                               max_retries: int = 3, retry_delay: int = 10) -> Optional[str]:
+        """Claim bridged assets with retry logic
+        
+        The claims on the destination network are checked before the first
+        attempt and polled while waiting between attempts, so a claim that
+        already landed (for example one submitted by an earlier attempt that
+        timed out) isn't sent again. The wait between attempts doubles, with
+        jitter, and ends early as soon as the claim shows up.
+        """
+        BridgeLogger.step(f"Claiming asset with retry logic (max {max_retries} attempts)")
+        
+        existing = ClaimAsset.find_existing_claim(dest_network, tx_hash, deposit_count, source_network)
+        for attempt in range(1, max_retries + 1):
+            if existing:
+                BridgeLogger.info(f"Asset was already claimed (status: {existing.get('status', 'unknown')})")
+                return "already_claimed"
+            
+            BridgeLogger.info(f"Claim attempt {attempt}/{max_retries}")
+            result = ClaimAsset.claim_asset(dest_network, tx_hash, source_network,
+                                            deposit_count, private_key)
+            if result:
+                if result != "already_claimed":
+                    BridgeLogger.success(f"Asset claimed successfully on attempt {attempt}")
+                return result
+            
+            if attempt < max_retries:
+                delay = BridgeUtils.backoff_delay(retry_delay, attempt)
+                BridgeLogger.warning(f"Claim failed, retrying in up to {delay:.1f}s...")
+                existing = ClaimAsset._wait_for_claim_ready(dest_network, tx_hash, deposit_count,
+                                                            source_network, delay, retry_delay)
+            else:
+                BridgeLogger.error("Max retries reached, claim failed")
+        
+        return None
+    
+    @staticmethod
+    async def claim_asset_with_retry_async(dest_network: int, tx_hash: str, source_network: int,
+                                           deposit_count: Optional[int] = None,
+                                           private_key: Optional[str] = None,
+                                           max_retries: int = 3, retry_delay: int = 10) -> Optional[str]:
+        """Async variant of claim_asset_with_retry
+        
+        Waits between attempts in a worker thread rather than on the event
+        loop, so other claims gathered with it keep progressing.
+        """
+        BridgeLogger.step(f"Claiming asset with retry logic (max {max_retries} attempts)")
+        
+        existing = await asyncio.to_thread(ClaimAsset.find_existing_claim,
+                                           dest_network, tx_hash, deposit_count, source_network)
+        for attempt in range(1, max_retries + 1):
+            if existing:
+                BridgeLogger.info(f"Asset was already claimed (status: {existing.get('status', 'unknown')})")
+                return "already_claimed"
+            
+            BridgeLogger.info(f"Claim attempt {attempt}/{max_retries}")
+            result = await ClaimAsset.claim_asset_async(dest_network, tx_hash, source_network,
+                                                        deposit_count, private_key)
+            if result:
+                if result != "already_claimed":
+                    BridgeLogger.success(f"Asset claimed successfully on attempt {attempt}")
+                return result
+            
+            if attempt < max_retries:
+                delay = BridgeUtils.backoff_delay(retry_delay, attempt)
+                BridgeLogger.warning(f"Claim failed, retrying in up to {delay:.1f}s...")
+                existing = await asyncio.to_thread(ClaimAsset._wait_for_claim_ready, dest_network,
+                                                   tx_hash, deposit_count, source_network,
+                                                   delay, retry_delay)
+            else:
+                BridgeLogger.error("Max retries reached, claim failed")
+        
+        return None
+    
+    @staticmethod
+    async def claim_assets_async(claims: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Claim several bridges concurrently, returning the results in order
+        
+        Args:
+            claims: claim_asset_with_retry_async keyword arguments for each claim
+        """
+        return list(await asyncio.gather(
+            *(ClaimAsset.claim_asset_with_retry_async(**claim) for claim in claims)
+        ))
+    
+    @staticmethod
+    def verify_claim_status(network_id: int, bridge_tx_hash: str, deposit_count: int,
+                            source_network: Optional[int] = None) -> Optional[str]:
         """Verify claim status using aggsandbox show claims --network-id --json"""
         BridgeLogger.step(f"Verifying claim status on network {network_id}")
         BridgeLogger.info(f"Looking for claim of bridge TX: {bridge_tx_hash}")
@@ -67,17 +225,9 @@ class ClaimAsset:
         claims = claims_data.get('claims', [])
         BridgeLogger.info(f"Found {len(claims)} total claims on network {network_id}")
         
-        # Look for our specific claim by deposit count or other identifiers
-        our_claim = None
-        for claim in claims:
-            # Match by deposit count (most reliable identifier)
-            if claim.get('deposit_count') == deposit_count:
-                our_claim = claim
-                break
-            # Alternative: match by bridge transaction hash if available
-            elif claim.get('bridge_tx_hash') == bridge_tx_hash:
-                our_claim = claim
-                break
+        # Look for our specific claim by source network and deposit count (most
+        # reliable identifier) or bridge transaction hash, through the claims index
+        our_claim = ClaimAsset._lookup_claim(claims, bridge_tx_hash, deposit_count, source_network)
         
         if our_claim:
             claim_status = our_claim.get('status', 'unknown')
@@ -103,3 +253,10 @@ class ClaimAsset:
             BridgeLogger.warning(f"Our claim not found (deposit_count: {deposit_count})")
             BridgeLogger.info("This might mean the claim hasn't been processed yet")
             return "not_found"
+    
+    @staticmethod
+    async def verify_claim_status_async(network_id: int, bridge_tx_hash: str, deposit_count: int,
+                                        source_network: Optional[int] = None) -> Optional[str]:
+        """Async variant of verify_claim_status, run in a worker thread"""
+        return await asyncio.to_thread(ClaimAsset.verify_claim_status, network_id,
+                                       bridge_tx_hash, deposit_count, source_network)
@@ -5,33 +5,60 @@ Functions for claiming bridged messages using aggsandbox CLI
 """
 
 import time
-import os
+import asyncio
 import subprocess
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from bridge_lib import BridgeLogger, BridgeUtils
 from aggsandbox_api import AggsandboxAPI, BridgeClaimArgs
+from rpc_client import decode_abi, signature_types
+
+def _decode_message(types: List[str], message_data: str) -> Optional[str]:
+    """Decode message data in-process, formatted one value per line like `cast abi-decode`
+    
+    Returns None when the data doesn't hold values of these types.
+    """
+    try:
+        data = bytes.fromhex(message_data[2:] if message_data.startswith("0x") else message_data)
+    except ValueError:
+        return None
+    if len(data) < 32 * len(types):
+        return None
+    for i, abi_type in enumerate(types):
+        if abi_type in ("bytes", "string"):
+            offset = int.from_bytes(data[32 * i:32 * (i + 1)], "big")
+            if offset + 32 > len(data) or offset + 32 + int.from_bytes(data[offset:offset + 32], "big") > len(data):
+                return None
+    try:
+        values = decode_abi(types, data)
+    except (UnicodeDecodeError, ValueError):
+        return None
+    return "\n".join(
+        "0x" + value.hex() if isinstance(value, bytes)
+        else str(value).lower() if isinstance(value, bool)
+        else str(value)
+        for value in values
+    )
 
 class ClaimMessage:
     """Message claiming operations"""
     
     @staticmethod
-    def claim_message(dest_network: int, tx_hash: str, source_network: int,
-                     private_key: str, deposit_count: Optional[int] = None) -> Optional[str]:
-        """Claim bridged messages using aggsandbox CLI"""
+    def _claim_args(dest_network: int, tx_hash: str, source_network: int,
+                    private_key: str, deposit_count: Optional[int]) -> BridgeClaimArgs:
         BridgeLogger.step(f"Claiming bridged message on network {dest_network}")
         BridgeLogger.info(f"Source transaction: {tx_hash}")
         BridgeLogger.info(f"Source network: {source_network}")
         
-        # Create claim args
-        claim_args = BridgeClaimArgs(
+        return BridgeClaimArgs(
             network=dest_network,
             tx_hash=tx_hash,
             source_network=source_network,
             private_key=private_key,
             deposit_count=deposit_count
         )
-        
-        success, output = AggsandboxAPI.bridge_claim(claim_args)
+    
+    @staticmethod
+    def _claim_outcome(success: bool, output: str) -> Optional[str]:
         if not success:
             BridgeLogger.error(f"Claim message transaction failed: {output}")
             
@@ -53,11 +80,29 @@ class ClaimMessage:
             BridgeLogger.success("Claim message transaction completed successfully")
             return "completed"
     
+    @staticmethod
+    def claim_message(dest_network: int, tx_hash: str, source_network: int,
+                     private_key: str, deposit_count: Optional[int] = None) -> Optional[str]:
+        """Claim bridged messages using aggsandbox CLI"""
+        args = ClaimMessage._claim_args(dest_network, tx_hash, source_network, private_key, deposit_count)
+        return ClaimMessage._claim_outcome(*AggsandboxAPI.bridge_claim(args))
+    
+    @staticmethod
+    async def claim_message_async(dest_network: int, tx_hash: str, source_network: int,
+                                  private_key: str, deposit_count: Optional[int] = None) -> Optional[str]:
+        """Async variant of claim_message"""
+        args = ClaimMessage._claim_args(dest_network, tx_hash, source_network, private_key, deposit_count)
+        return ClaimMessage._claim_outcome(*await AggsandboxAPI.bridge_claim_async(args))
+    
     @staticmethod
     def claim_message_with_retry(dest_network: int, tx_hash: str, source_network: int,
                                 private_key: str, deposit_count: Optional[int] = None,
                                 max_retries: int = 3, retry_delay: int = 10) -> Optional[str]:
-        """Claim message with retry logic"""
+        """Claim message with retry logic
+        
+        The wait between attempts starts at retry_delay and doubles (up to 60s),
+        with jitter.
+        """
         BridgeLogger.step(f"Claiming message with retry logic (max {max_retries} attempts)")
         
         for attempt in range(1, max_retries + 1):
@@ -66,21 +111,62 @@ class ClaimMessage:
             result = ClaimMessage.claim_message(dest_network, tx_hash, source_network,
                                               private_key, deposit_count)
             
-            if result == "already_claimed":
-                BridgeLogger.info("Message was already claimed")
+            if ClaimMessage._retry_done(result, attempt):
                 return result
-            elif result:
-                BridgeLogger.success(f"Message claimed successfully on attempt {attempt}")
+            if attempt < max_retries:
+                delay = BridgeUtils.backoff_delay(retry_delay, attempt)
+                BridgeLogger.warning(f"Claim failed, retrying in {delay:.1f}s...")
+                time.sleep(delay)
+            else:
+                BridgeLogger.error("Max retries reached, claim failed")
+        
+        return None
+    
+    @staticmethod
+    async def claim_message_with_retry_async(dest_network: int, tx_hash: str, source_network: int,
+                                             private_key: str, deposit_count: Optional[int] = None,
+                                             max_retries: int = 3, retry_delay: int = 10) -> Optional[str]:
+        """Async variant of claim_message_with_retry, sleeping without blocking the event loop"""
+        BridgeLogger.step(f"Claiming message with retry logic (max {max_retries} attempts)")
+        
+        for attempt in range(1, max_retries + 1):
+            BridgeLogger.info(f"Claim attempt {attempt}/{max_retries}")
+            
+            result = await ClaimMessage.claim_message_async(dest_network, tx_hash, source_network,
+                                                            private_key, deposit_count)
+            
+            if ClaimMessage._retry_done(result, attempt):
                 return result
+            if attempt < max_retries:
+                delay = BridgeUtils.backoff_delay(retry_delay, attempt)
+                BridgeLogger.warning(f"Claim failed, retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
             else:
-                if attempt < max_retries:
-                    BridgeLogger.warning(f"Claim failed, retrying in {retry_delay}s...")
-                    time.sleep(retry_delay)
-                else:
-                    BridgeLogger.error("Max retries reached, claim failed")
+                BridgeLogger.error("Max retries reached, claim failed")
         
         return None
     
+    @staticmethod
+    def _retry_done(result: Optional[str], attempt: int) -> bool:
+        if result == "already_claimed":
+            BridgeLogger.info("Message was already claimed")
+            return True
+        elif result:
+            BridgeLogger.success(f"Message claimed successfully on attempt {attempt}")
+            return True
+        return False
+    
+    @staticmethod
+    async def claim_many(claims: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Claim several messages concurrently, returning the results in order
+        
+        Args:
+            claims: claim_message_with_retry_async keyword arguments for each claim
+        """
+        return list(await asyncio.gather(
+            *(ClaimMessage.claim_message_with_retry_async(**claim) for claim in claims)
+        ))
+    
     @staticmethod
     def decode_message_data(message_data: str, function_signature: Optional[str] = None) -> Optional[str]:
         """Decode message data for debugging"""
@@ -88,30 +174,29 @@ class ClaimMessage:
         BridgeLogger.info(f"Raw data: {message_data}")
         
         if function_signature:
-            # Try to decode with provided function signature
-            try:
-                cmd = ["cast", "abi-decode", function_signature, message_data]
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                decoded = result.stdout.strip()
+            # Try to decode with provided function signature, in-process unless
+            # it uses types decode_abi doesn't handle. Like cast, decode the
+            # output tuple of signatures such as "f()(string)".
+            types = signature_types(function_signature, outputs=True)
+            if types:
+                decoded = _decode_message(types, message_data)
+            else:
+                try:
+                    cmd = ["cast", "abi-decode", function_signature, message_data]
+                    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+                    decoded = result.stdout.strip()
+                except subprocess.CalledProcessError:
+                    decoded = None
+            if decoded is not None:
                 BridgeLogger.success(f"Decoded with signature '{function_signature}': {decoded}")
                 return decoded
-            except subprocess.CalledProcessError:
-                BridgeLogger.warning("Could not decode with provided signature")
+            BridgeLogger.warning("Could not decode with provided signature")
         
         # Try common decodings
-        decodings = [
-            ("string", "f(string)"),
-            ("bytes", "f(bytes)")
-        ]
-        
-        for desc, sig in decodings:
-            try:
-                cmd = ["cast", "abi-decode", sig, message_data]
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                decoded = result.stdout.strip()
+        for desc in ("string", "bytes"):
+            decoded = _decode_message([desc], message_data)
+            if decoded is not None:
                 BridgeLogger.info(f"As {desc}: {decoded}")
-            except subprocess.CalledProcessError:
-                pass
         
         BridgeLogger.info(f"Hex data: {message_data}")
         return None
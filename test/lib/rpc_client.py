@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+RPC Client Module - Python Implementation
+Keep-alive JSON-RPC client and minimal ABI encoding and decoding for direct contract calls
+"""
+
+import re
+import json
+import time
+import itertools
+import threading
+import http.client
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+try:
+    # orjson is optional; it parses bytes directly and is several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# 4-byte function selectors (first bytes of keccak256(signature)).
+# Precomputed because hashlib has no keccak256.
+SELECTORS = {
+    "balanceOf(address)": "0x70a08231",
+    "getCallCount()": "0xa96b2dc0",
+    "getLastMessage()": "0x526bf76e",
+    "totalMessagesReceived()": "0x5721d4f7",
+}
+
+class RPCError(Exception):
+    """JSON-RPC error returned by the node"""
+
+class RPCClient:
+    """JSON-RPC client that keeps one HTTP connection open per node URL and thread"""
+    
+    _clients: Dict[str, 'RPCClient'] = {}
+    _clients_lock = threading.Lock()
+    
+    def __init__(self, url: str):
+        parsed = urlparse(url)
+        self.url = url
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        self.path = parsed.path or "/"
+        self.https = parsed.scheme == "https"
+        # One keep-alive connection per thread so concurrent calls don't serialize
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+    
+    @classmethod
+    def for_url(cls, url: str) -> 'RPCClient':
+        """Get the shared client for a node URL"""
+        with cls._clients_lock:
+            client = cls._clients.get(url)
+            if client is None:
+                client = cls._clients[url] = cls(url)
+            return client
+    
+    def _connect(self) -> http.client.HTTPConnection:
+        conn_cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        return conn_cls(self.host, self.port, timeout=30)
+    
+    def _post(self, body: bytes) -> bytes:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        conn.request("POST", self.path, body, {"Content-Type": "application/json"})
+        response = conn.getresponse()
+        return response.read()
+    
+    def _request(self, payload: Any) -> Any:
+        body = json.dumps(payload).encode()
+        try:
+            raw = self._post(body)
+        except (http.client.HTTPException, ConnectionError):
+            # Server closed the idle keep-alive connection; reconnect once
+            self.close()
+            raw = self._post(body)
+        return json_loads(raw)
+    
+    @staticmethod
+    def _result(reply: dict) -> Any:
+        if reply.get("error"):
+            raise RPCError(reply["error"].get("message", str(reply["error"])))
+        return reply.get("result")
+    
+    def _payload(self, method: str, params: Optional[List[Any]]) -> dict:
+        return {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params or []}
+    
+    def call(self, method: str, params: Optional[List[Any]] = None) -> Any:
+        """Send a JSON-RPC request and return its result"""
+        return self._result(self._request(self._payload(method, params)))
+    
+    def batch_call(self, calls: List[Tuple[str, Optional[List[Any]]]]) -> List[Any]:
+        """Send several JSON-RPC requests in one batch and return their results in order
+        
+        Raises RPCError if any request in the batch failed.
+        """
+        if not calls:
+            return []
+        payloads = [self._payload(method, params) for method, params in calls]
+        replies = self._request(payloads)
+        if isinstance(replies, dict):
+            # Nodes answer a rejected batch with a single error object
+            self._result(replies)
+            raise RPCError("Batch request was not answered with a list")
+        # Batch replies may come back in any order
+        by_id = {reply.get("id"): reply for reply in replies}
+        return [self._result(by_id.get(payload["id"], {"error": {"message": "missing reply"}}))
+                for payload in payloads]
+    
+    def eth_call(self, to: str, data: str, block: str = "latest") -> bytes:
+        """Execute a read-only contract call and return the raw return data"""
+        result = self.call("eth_call", [{"to": to, "data": data}, block])
+        return bytes.fromhex(result[2:] if result.startswith("0x") else result)
+    
+    def send_transaction(self, tx: Dict[str, Any]) -> str:
+        """Send a transaction from an unlocked node account and return its hash"""
+        return self.call("eth_sendTransaction", [tx])
+    
+    def wait_for_receipt(self, tx_hash: str, timeout: float = 30, poll_interval: float = 0.25) -> Optional[dict]:
+        """Poll for a transaction receipt until it is mined or the timeout expires"""
+        deadline = time.monotonic() + timeout
+        while True:
+            receipt = self.call("eth_getTransactionReceipt", [tx_hash])
+            if receipt or time.monotonic() >= deadline:
+                return receipt
+            time.sleep(poll_interval)
+    
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+_SIMPLE_TYPE_RE = re.compile(r'address|bool|string|bytes\d*|u?int\d*')
+
+# name(inputs) optionally followed by (outputs), without nested tuples
+_SIGNATURE_RE = re.compile(r'\s*\w*\(([^()]*)\)\s*(?:\(([^()]*)\))?\s*')
+
+def signature_types(signature: str, outputs: bool = False) -> Optional[List[str]]:
+    """Parameter types of a signature like "f(uint256,string)", in canonical form
+    
+    With outputs, the types of the output tuple that follows the inputs, as in
+    "f(uint256)(string)"; that is what `cast abi-decode` decodes. A signature
+    without an output tuple gives its input types then.
+    
+    Returns None when a type isn't supported by encode_abi/decode_abi
+    (arrays, tuples) or the signature can't be parsed.
+    """
+    match = _SIGNATURE_RE.fullmatch(signature)
+    if not match:
+        return None
+    params = match.group(2) if outputs and match.group(2) is not None else match.group(1)
+    types = [t.strip() for t in params.split(',')] if params.strip() else []
+    if not all(_SIMPLE_TYPE_RE.fullmatch(t) for t in types):
+        return None
+    # uint/int are aliases of uint256/int256
+    return [t + '256' if t in ('uint', 'int') else t for t in types]
+
+def _decode_word(abi_type: str, word: bytes) -> Any:
+    if abi_type == "address":
+        return "0x" + word[12:].hex()
+    if abi_type == "bool":
+        return word[-1] != 0
+    if abi_type.startswith("uint"):
+        return int.from_bytes(word, "big")
+    if abi_type.startswith("int"):
+        return int.from_bytes(word, "big", signed=True)
+    if abi_type.startswith("bytes"):
+        return word[:int(abi_type[5:])]
+    raise ValueError(f"Unsupported ABI type: {abi_type}")
+
+def decode_abi(types: List[str], data: bytes) -> tuple:
+    """Decode ABI-encoded return data for static types, bytes and string"""
+    values = []
+    for i, abi_type in enumerate(types):
+        word = data[32 * i:32 * (i + 1)]
+        if abi_type in ("bytes", "string"):
+            offset = int.from_bytes(word, "big")
+            length = int.from_bytes(data[offset:offset + 32], "big")
+            raw = data[offset + 32:offset + 32 + length]
+            values.append(raw.decode() if abi_type == "string" else raw)
+        else:
+            values.append(_decode_word(abi_type, word))
+    return tuple(values)
+
+def _encode_word(abi_type: str, value: Any) -> bytes:
+    """Encode one static value, raising ValueError if it doesn't fit abi_type"""
+    if abi_type == "address":
+        raw = bytes.fromhex(value[2:] if value.startswith("0x") else value)
+        if len(raw) != 20:
+            raise ValueError(f"Invalid address {value!r}: expected 20 bytes, got {len(raw)}")
+        return bytes(12) + raw
+    if abi_type == "bool":
+        return int(bool(value)).to_bytes(32, "big")
+    if abi_type.startswith(("uint", "int")):
+        signed = abi_type.startswith("int")
+        bits = int(abi_type[3 if signed else 4:])
+        if bits % 8 or not 8 <= bits <= 256:
+            raise ValueError(f"Unsupported ABI type: {abi_type}")
+        low, high = (-(1 << (bits - 1)), 1 << (bits - 1)) if signed else (0, 1 << bits)
+        if not low <= value < high:
+            raise ValueError(f"Value {value} out of range for {abi_type}")
+        return value.to_bytes(32, "big", signed=signed)
+    if abi_type.startswith("bytes"):
+        size = int(abi_type[5:])
+        if not 1 <= size <= 32:
+            raise ValueError(f"Unsupported ABI type: {abi_type}")
+        if len(value) > size:
+            raise ValueError(f"Value of {len(value)} bytes doesn't fit {abi_type}")
+        return value.ljust(32, b"\0")
+    raise ValueError(f"Unsupported ABI type: {abi_type}")
+
+def encode_abi(types: List[str], values: List[Any]) -> str:
+    """ABI-encode static types, bytes and string the way `cast abi-encode` does
+    
+    Returns 0x-prefixed hex without a function selector. Raises ValueError for
+    a value that doesn't fit its type, such as an address that isn't 20 bytes.
+    """
+    head, tail = [], []
+    tail_offset = 32 * len(types)
+    for abi_type, value in zip(types, values):
+        if abi_type in ("bytes", "string"):
+            raw = value.encode() if abi_type == "string" else value
+            head.append(tail_offset.to_bytes(32, "big"))
+            padded = raw.ljust(-(-len(raw) // 32) * 32, b"\0")
+            tail.append(len(raw).to_bytes(32, "big") + padded)
+            tail_offset += 32 + len(padded)
+        else:
+            head.append(_encode_word(abi_type, value))
+    return "0x" + b"".join(head + tail).hex()
+
+__all__ = ['SELECTORS', 'RPCError', 'RPCClient', 'decode_abi', 'encode_abi', 'signature_types']
@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for the bridge library: parsing and encoding helpers,
+query caching, claim and bridge indexes, command streaming and RPC batching
+
+These need neither a running sandbox nor cast; the CLI and the node are
+replaced by patched calls, stub scripts and a local stub server. Run with:
+    python3 test/lib/test_offline.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+# Add the lib directory to Python path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import aggsandbox_api
+import bridge_lib
+from aggsandbox_api import (AggsandboxAPI, BridgeClaimArgs, _drop_cached, _marked_tx_re, _state_changed,
+                            _ttl_cached, index_bridges_by_tx_hash)
+from bridge_lib import CLAIMED_STATUSES, BridgeEnvironment, BridgeUtils
+from claim_asset import ClaimAsset
+from claim_message import ClaimMessage
+from rpc_client import RPCClient, RPCError, decode_abi, encode_abi, signature_types
+
+ADDRESS = "0x" + "ab" * 20
+TX_HASH = "0x" + "11" * 32
+OTHER_TX_HASH = "0x" + "22" * 32
+
+def words(*hex_words: str) -> str:
+    """Concatenate 32-byte words given as hex without 0x, left-padded like uints"""
+    return "0x" + "".join(word.rjust(64, "0") for word in hex_words)
+
+class TestAbiEncoding(unittest.TestCase):
+    """encode_abi against `cast abi-encode` output for the same arguments"""
+    
+    def test_static_types(self):
+        # cast abi-encode "f(uint256,address,bool)" 1 0xabab...ab true
+        self.assertEqual(encode_abi(["uint256", "address", "bool"], [1, ADDRESS, True]),
+                         words("1", "ab" * 20, "1"))
+    
+    def test_negative_int(self):
+        # cast abi-encode "f(int256)" -- -1
+        self.assertEqual(encode_abi(["int256"], [-1]), "0x" + "f" * 64)
+    
+    def test_string(self):
+        # cast abi-encode "f(string)" "hello world"
+        self.assertEqual(encode_abi(["string"], ["hello world"]),
+                         words("20", "b") + "68656c6c6f20776f726c64".ljust(64, "0"))
+    
+    def test_dynamic_after_static(self):
+        # cast abi-encode "f(uint256,string,bool)" 42 hi true
+        self.assertEqual(encode_abi(["uint256", "string", "bool"], [42, "hi", True]),
+                         words("2a", "60", "1", "2") + "6869".ljust(64, "0"))
+    
+    def test_fixed_bytes(self):
+        # cast abi-encode "f(bytes4)" 0x12345678
+        self.assertEqual(encode_abi(["bytes4"], [bytes.fromhex("12345678")]),
+                         "0x" + "12345678".ljust(64, "0"))
+    
+    def test_rejects_values_that_dont_fit(self):
+        with self.assertRaises(ValueError):
+            encode_abi(["address"], ["0x1234"])
+        with self.assertRaises(ValueError):
+            encode_abi(["uint8"], [256])
+        with self.assertRaises(ValueError):
+            encode_abi(["uint256"], [-1])
+        with self.assertRaises(ValueError):
+            encode_abi(["bytes2"], [b"abc"])
+    
+    def test_decode_round_trip(self):
+        types = ["uint256", "int8", "address", "bool", "bytes4", "string", "bytes"]
+        values = (2**200, -5, ADDRESS, True, b"\x01\x02\x03\x04", "hello world", b"\xde\xad")
+        encoded = bytes.fromhex(encode_abi(types, list(values))[2:])
+        self.assertEqual(decode_abi(types, encoded), values)
+    
+    def test_signature_types(self):
+        self.assertEqual(signature_types("f(uint,int, address,bytes32)"),
+                         ["uint256", "int256", "address", "bytes32"])
+        self.assertEqual(signature_types("f()"), [])
+        self.assertIsNone(signature_types("f(uint256[])"))
+        self.assertIsNone(signature_types("f((uint256,address))"))
+    
+    def test_signature_output_types(self):
+        self.assertEqual(signature_types("f()(string)"), [])
+        self.assertEqual(signature_types("f()(string)", outputs=True), ["string"])
+        self.assertEqual(signature_types("f(uint256)(string)", outputs=True), ["string"])
+        self.assertEqual(signature_types("f(uint)", outputs=True), ["uint256"])
+    
+    def test_decode_message_data_uses_output_tuple(self):
+        data = encode_abi(["string"], ["hello world"])
+        self.assertEqual(ClaimMessage.decode_message_data(data, "f()(string)"), "hello world")
+        self.assertEqual(ClaimMessage.decode_message_data(data, "f(uint256)(string)"), "hello world")
+
+# `aggsandbox info` output as printed by cli/src/logs.rs, with its ANSI colors
+SANDBOX_INFO = """
+\x1b[1;36mAvailable Accounts\x1b[0m
+\x1b[36m-----------------------\x1b[0m
+(0): \x1b[33m0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266\x1b[0m
+(1): \x1b[33m0x70997970C51812dc3A010C7d01b50e0d17dc79C8\x1b[0m
+
+\x1b[1;36mPrivate Keys\x1b[0m
+\x1b[36m-----------------------\x1b[0m
+(0): \x1b[33m0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80\x1b[0m
+(1): \x1b[33m0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d\x1b[0m
+
+\x1b[1;36mPolygon Sandbox Config:\x1b[0m
+\x1b[32mL1 (Ethereum Mainnet Simulation):\x1b[0m
+  Name: \x1b[37mEthereum-L1\x1b[0m    Chain ID: \x1b[37m1\x1b[0m    RPC: \x1b[37mhttp://localhost:8545\x1b[0m
+\x1b[32mL2 (Polygon zkEVM Simulation):\x1b[0m
+  Name: \x1b[37mPolygon-zkEVM-L2\x1b[0m    Chain ID: \x1b[37m1101\x1b[0m    RPC: \x1b[37mhttp://localhost:8546\x1b[0m
+
+\x1b[1;36mBase Protocol Contracts:\x1b[0m
+\x1b[32mL1 Contracts:\x1b[0m
+  AggERC20: \x1b[37m0x5FbDB2315678afecb367f032d93F642f64180aa3\x1b[0m
+\x1b[32mL2 Contracts:\x1b[0m
+  AggERC20: \x1b[37m0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512\x1b[0m
+"""
+
+class TestSandboxInfoParsing(unittest.TestCase):
+
+    def test_single_l2(self):
+        info = BridgeEnvironment._parse_sandbox_info(SANDBOX_INFO)
+        self.assertEqual(info['accounts'], ["0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
+                                            "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"])
+        self.assertEqual(len(info['private_keys']), 2)
+        self.assertTrue(info['private_keys'][0].startswith("0xac0974be"))
+        self.assertEqual(info['l1_rpc'], "http://localhost:8545")
+        self.assertEqual(info['l2_rpc'], "http://localhost:8546")
+        self.assertEqual(info['l2_chain_id'], 1101)
+        self.assertEqual(info['agg_erc20_l1'], "0x5FbDB2315678afecb367f032d93F642f64180aa3")
+        self.assertEqual(info['agg_erc20_l2'], "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512")
+        self.assertIsNone(info['l3_rpc'])
+        self.assertIsNone(info['network_id_agglayer_2'])
+    
+    def test_multi_l2(self):
+        output = SANDBOX_INFO.replace(
+            "\n\n\x1b[1;36mBase Protocol",
+            "\n\x1b[32mL2-2 (Second Agglayer Chain):\x1b[0m\n"
+            "  Name: \x1b[37mAgglayer-2\x1b[0m    Chain ID: \x1b[37m137\x1b[0m    "
+            "RPC: \x1b[37mhttp://localhost:8547\x1b[0m\n\n\x1b[1;36mBase Protocol"
+        )
+        info = BridgeEnvironment._parse_sandbox_info(output)
+        self.assertEqual(info['l3_rpc'], "http://localhost:8547")
+        self.assertEqual(info['l3_chain_id'], 137)
+        self.assertEqual(info['network_id_agglayer_2'], 2)
+        # Without a third AggERC20 line, L2-2 uses the L2 address
+        self.assertEqual(info['agg_erc20_l3'], info['agg_erc20_l2'])
+    
+    def test_missing_section_raises(self):
+        without_keys = SANDBOX_INFO.replace("Private Keys", "Keys")
+        with self.assertRaises(ValueError):
+            BridgeEnvironment._parse_sandbox_info(without_keys)
+
+class TestConfigCache(unittest.TestCase):
+    """The sandbox info cache shared between processes, keyed by the .env stamp"""
+    
+    CONFIG = {'accounts': [ADDRESS], 'l1_rpc': "http://localhost:8545"}
+    
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.env_file = os.path.join(tmp.name, '.env')
+        self.write_env("L1_RPC_URL=http://localhost:8545\n")
+        for name, value in (('ENV_FILE', self.env_file),
+                            ('CONFIG_CACHE_PATH', os.path.join(tmp.name, 'cache', 'config.json'))):
+            patcher = mock.patch.object(bridge_lib, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop('BRIDGE_CACHE', None)
+    
+    def write_env(self, text: str):
+        with open(self.env_file, 'w') as f:
+            f.write(text)
+    
+    def test_round_trip_under_same_stamp(self):
+        stamp = BridgeEnvironment._env_file_stamp()
+        BridgeEnvironment._write_config_cache(self.CONFIG, stamp)
+        self.assertEqual(BridgeEnvironment._read_config_cache(stamp), self.CONFIG)
+    
+    def test_env_rewrite_invalidates(self):
+        BridgeEnvironment._write_config_cache(self.CONFIG, BridgeEnvironment._env_file_stamp())
+        self.write_env("L1_RPC_URL=http://localhost:18545\n")
+        self.assertIsNone(BridgeEnvironment._read_config_cache(BridgeEnvironment._env_file_stamp()))
+    
+    def test_not_saved_if_env_changed_during_info(self):
+        stamp = BridgeEnvironment._env_file_stamp()
+        self.write_env("L1_RPC_URL=http://localhost:18545\n")
+        BridgeEnvironment._write_config_cache(self.CONFIG, stamp)
+        self.assertFalse(os.path.exists(bridge_lib.CONFIG_CACHE_PATH))
+    
+    def test_load_takes_stamp_before_info(self):
+        def info():
+            # The deployer rewrites .env while info runs
+            self.write_env("L1_RPC_URL=http://localhost:18545\n")
+            return True, SANDBOX_INFO
+        self.addCleanup(BridgeEnvironment._load_environment.cache_clear)
+        with mock.patch.object(bridge_lib.AggsandboxAPI, 'info', staticmethod(info)):
+            BridgeEnvironment._load_environment(-1)
+        self.assertFalse(os.path.exists(bridge_lib.CONFIG_CACHE_PATH))
+    
+    def test_disabled_with_bridge_cache_0(self):
+        os.environ['BRIDGE_CACHE'] = '0'
+        stamp = BridgeEnvironment._env_file_stamp()
+        BridgeEnvironment._write_config_cache(self.CONFIG, stamp)
+        self.assertIsNone(BridgeEnvironment._read_config_cache(stamp))
+
+class TestTTLCache(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = 0
+        self.succeed = True
+        
+        @_ttl_cached
+        def query(network_id: int):
+            self.calls += 1
+            return self.succeed, f"result {self.calls}"
+        
+        self.query = query
+        self.store = {}
+    
+    def test_reuses_result_within_ttl(self):
+        first = self.query(1, ttl_ms=60_000, cache=self.store)
+        self.assertEqual(self.query(1, ttl_ms=60_000, cache=self.store), first)
+        self.assertEqual(self.calls, 1)
+        # Other arguments are cached separately
+        self.query(2, ttl_ms=60_000, cache=self.store)
+        self.assertEqual(self.calls, 2)
+    
+    def test_zero_ttl_always_requeries(self):
+        self.query(1, ttl_ms=60_000, cache=self.store)
+        self.query(1, cache=self.store)
+        self.assertEqual(self.calls, 2)
+        # ...and drops the stored result
+        self.query(1, ttl_ms=60_000, cache=self.store)
+        self.assertEqual(self.calls, 3)
+    
+    def test_failures_are_not_cached(self):
+        self.succeed = False
+        self.query(1, ttl_ms=60_000, cache=self.store)
+        self.query(1, ttl_ms=60_000, cache=self.store)
+        self.assertEqual(self.calls, 2)
+    
+    def test_state_change_invalidates(self):
+        self.query(1, ttl_ms=60_000, cache=self.store)
+        _state_changed((False, "failed bridge"))
+        self.query(1, ttl_ms=60_000, cache=self.store)
+        self.assertEqual(self.calls, 1)
+        epoch = aggsandbox_api._cache_epoch
+        _state_changed((True, "bridged"))
+        self.assertEqual(aggsandbox_api._cache_epoch, epoch + 1)
+        self.query(1, ttl_ms=60_000, cache=self.store)
+        self.assertEqual(self.calls, 2)
+    
+    def test_drop_cached(self):
+        self.query(1, ttl_ms=60_000, cache=self.store)
+        self.query(2, ttl_ms=60_000, cache=self.store)
+        _drop_cached(self.store, "query", (("network_id", 1),))
+        self.query(1, ttl_ms=60_000, cache=self.store)
+        self.query(2, ttl_ms=60_000, cache=self.store)
+        self.assertEqual(self.calls, 3)
+    
+    def test_expires_after_ttl(self):
+        now = [1000.0]
+        with mock.patch.object(aggsandbox_api.time, 'monotonic', lambda: now[0]):
+            self.query(1, ttl_ms=500, cache=self.store)
+            now[0] += 0.4
+            self.query(1, ttl_ms=500, cache=self.store)
+            self.assertEqual(self.calls, 1)
+            # A shorter-TTL caller doesn't get the older result
+            self.query(1, ttl_ms=300, cache=self.store)
+            self.assertEqual(self.calls, 2)
+            now[0] += 0.5
+            self.query(1, ttl_ms=500, cache=self.store)
+            self.assertEqual(self.calls, 3)
+
+class TestShowQueryCaching(unittest.TestCase):
+    """show bridges/claims reuse and its invalidation by bridges and claims"""
+    
+    def setUp(self):
+        self.queries = 0
+        self.command_succeeds = True
+        
+        def run_command_bytes(cmd, timeout=30):
+            self.queries += 1
+            return True, b'{"claims": []}'
+        
+        def run_command(cmd, timeout=30):
+            return self.command_succeeds, "claim transaction submitted"
+        
+        for name, func in (('run_command_bytes', run_command_bytes), ('run_command', run_command)):
+            patcher = mock.patch.object(AggsandboxAPI, name, staticmethod(func))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop('AGGSANDBOX_HTTP_API', None)
+        self.store = {}
+        self.claim = BridgeClaimArgs(network=1, tx_hash=TX_HASH, source_network=0)
+    
+    def test_default_always_requeries(self):
+        AggsandboxAPI.get_claims(1, cache=self.store)
+        AggsandboxAPI.get_claims(1, cache=self.store)
+        self.assertEqual(self.queries, 2)
+    
+    def test_claim_invalidates_cached_results(self):
+        AggsandboxAPI.get_claims(1, ttl_ms=60_000, cache=self.store)
+        AggsandboxAPI.get_claims(1, ttl_ms=60_000, cache=self.store)
+        self.assertEqual(self.queries, 1)
+        AggsandboxAPI.bridge_claim(self.claim)
+        AggsandboxAPI.get_claims(1, ttl_ms=60_000, cache=self.store)
+        self.assertEqual(self.queries, 2)
+    
+    def test_failed_claim_keeps_cached_results(self):
+        AggsandboxAPI.get_claims(1, ttl_ms=60_000, cache=self.store)
+        self.command_succeeds = False
+        AggsandboxAPI.bridge_claim(self.claim)
+        AggsandboxAPI.get_claims(1, ttl_ms=60_000, cache=self.store)
+        self.assertEqual(self.queries, 1)
+
+def claim(bridge_tx: str, claim_tx: str, status: str = "completed", **fields) -> dict:
+    return {'bridge_tx_hash': bridge_tx, 'claim_tx_hash': claim_tx, 'status': status,
+            'destination_address': ADDRESS, 'origin_network': 0, 'destination_network': 1,
+            'amount': "10", **fields}
+
+class TestClaimIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.claims = [
+            claim("0xb1", "0xc1", amount="5"),
+            claim("0xb2", "0xc2"),
+            claim("0xb1", "0xc3", status="pending"),
+        ]
+    
+    def test_lookup_by_each_key_in_response_order(self):
+        index = BridgeUtils.index_claims(self.claims)
+        self.assertEqual(index.lookup("0xb1", None), [self.claims[0], self.claims[2]])
+        self.assertEqual(index.lookup(None, "0xc2"), [self.claims[1]])
+        details = (ADDRESS, 0, 1, "10")
+        self.assertEqual(index.lookup(None, None, details), [self.claims[1], self.claims[2]])
+        # A claim matching several keys is returned once
+        self.assertEqual(index.lookup("0xb2", "0xc2", details), self.claims[1:])
+        self.assertEqual(index.lookup("0xmissing", None), [])
+    
+    def test_index_reused_for_same_response(self):
+        index = BridgeUtils.index_claims(self.claims)
+        self.assertIs(BridgeUtils.index_claims(self.claims), index)
+        self.assertIsNot(BridgeUtils.index_claims(list(self.claims)), index)
+    
+    def test_iterables_match_like_the_index(self):
+        from_list = list(BridgeUtils.iter_matching_claims(self.claims, "0xb1", "0xc2"))
+        from_iter = list(BridgeUtils.iter_matching_claims(iter(self.claims), "0xb1", "0xc2"))
+        self.assertEqual(from_list, self.claims)
+        self.assertEqual(from_iter, from_list)
+
+class TestClaimForDeposit(unittest.TestCase):
+    """Claims matched on (source network, deposit count), as deposit counts are per bridge contract"""
+    
+    def setUp(self):
+        self.claims = [
+            claim("0xb1", "0xc1", status="failed", origin_network=1, deposit_count=3),
+            claim("0xb2", "0xc2", origin_network=0, deposit_count=3),
+            claim("0xb1", "0xc3", origin_network=1, deposit_count=3),
+        ]
+        self.index = BridgeUtils.index_claims(self.claims)
+    
+    def test_same_deposit_count_on_other_network_doesnt_match(self):
+        self.assertEqual(self.index.for_deposit(0, 3), [self.claims[1]])
+        self.assertEqual(self.index.for_deposit(2, 3), [])
+    
+    def test_status_filter(self):
+        self.assertEqual(self.index.for_deposit(1, 3), [self.claims[0], self.claims[2]])
+        self.assertEqual(self.index.for_deposit(1, 3, CLAIMED_STATUSES), [self.claims[2]])
+    
+    def test_lookup_claim(self):
+        self.assertIs(ClaimAsset._lookup_claim(self.claims, "0xb1", 3, 1, CLAIMED_STATUSES),
+                      self.claims[2])
+        # Without a source network the bridge tx hash is used
+        self.assertIs(ClaimAsset._lookup_claim(self.claims, "0xb2", 3), self.claims[1])
+        self.assertIsNone(ClaimAsset._lookup_claim(self.claims, "0xb3", 3, 2))
+
+class TestBridgeTxIndex(unittest.TestCase):
+
+    def test_first_bridge_wins_and_highest_count_is_returned(self):
+        bridges = [{'bridge_tx_hash': "0xb2", 'deposit_count': 5},
+                   {'bridge_tx_hash': "0xb1", 'deposit_count': 4},
+                   {'bridge_tx_hash': "0xb2", 'deposit_count': 3}]
+        index = {}
+        self.assertEqual(index_bridges_by_tx_hash(bridges, index), 5)
+        self.assertIs(index["0xb2"], bridges[0])
+        self.assertIs(index["0xb1"], bridges[1])
+    
+    def test_index_kept_across_polls(self):
+        index = {}
+        seen = index_bridges_by_tx_hash([{'bridge_tx_hash': "0xb1", 'deposit_count': 1}], index)
+        seen = index_bridges_by_tx_hash([], index, seen)
+        self.assertEqual(seen, 1)
+        seen = index_bridges_by_tx_hash([{'bridge_tx_hash': "0xb2", 'deposit_count': 2}], index, seen)
+        self.assertEqual(seen, 2)
+        self.assertEqual(set(index), {"0xb1", "0xb2"})
+
+class TestBridgesSinceDepositCount(unittest.TestCase):
+
+    def setUp(self):
+        output = (b'{"bridges": [{"bridge_tx_hash": "0xb3", "deposit_count": 3},'
+                  b' {"bridge_tx_hash": "0xb2", "deposit_count": 2},'
+                  b' {"bridge_tx_hash": "0xb1", "deposit_count": 1}], "count": 3}')
+        patcher = mock.patch.object(AggsandboxAPI, 'run_command_bytes',
+                                    staticmethod(lambda cmd, timeout=30: (True, output)))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop('AGGSANDBOX_HTTP_API', None)
+    
+    def test_only_newer_bridges_are_returned(self):
+        data = AggsandboxAPI.get_bridges(0, since_deposit_count=1)
+        self.assertEqual([b['deposit_count'] for b in data['bridges']], [3, 2])
+        # Other fields of the response are kept
+        self.assertEqual(data['count'], 3)
+        self.assertEqual(AggsandboxAPI.get_bridges(0, since_deposit_count=3)['bridges'], [])
+    
+    def test_without_since_deposit_count_all_bridges_are_returned(self):
+        self.assertEqual(len(AggsandboxAPI.get_bridges(0)['bridges']), 3)
+
+def python_cmd(script: str) -> list:
+    """A command running a Python script in place of the aggsandbox CLI"""
+    return [sys.executable, "-c", script]
+
+class TestRunCommandStreaming(unittest.TestCase):
+
+    PATTERN = _marked_tx_re('transaction submitted')
+    
+    def test_stops_at_submitted_line(self):
+        # The command would run for another 30s after printing the hash
+        cmd = python_cmd(
+            "import sys, time\n"
+            "print('Approving token', flush=True)\n"
+            f"print('Bridge transaction submitted: {TX_HASH}', flush=True)\n"
+            "time.sleep(30)\n"
+        )
+        started = time.monotonic()
+        self.assertEqual(AggsandboxAPI.run_command_streaming(cmd, self.PATTERN), (True, TX_HASH))
+        self.assertLess(time.monotonic() - started, 10)
+    
+    def test_no_match_returns_output(self):
+        cmd = python_cmd("print('Approving token')\nprint('done')")
+        self.assertEqual(AggsandboxAPI.run_command_streaming(cmd, self.PATTERN),
+                         (False, "Approving token\ndone"))
+    
+    def test_timeout(self):
+        success, output = AggsandboxAPI.run_command_streaming(
+            python_cmd("import time\ntime.sleep(30)"), self.PATTERN, timeout=1
+        )
+        self.assertFalse(success)
+        self.assertIn("timed out", output)
+
+class FakeNodeHandler(BaseHTTPRequestHandler):
+    """JSON-RPC node that answers batches in reverse order
+    
+    Method "echo" returns its first param, "fail" returns an error, "drop"
+    gets no reply and a batch containing "reject" is refused with a single
+    error object.
+    """
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if isinstance(request, list):
+            if any(call["method"] == "reject" for call in request):
+                reply = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch rejected"}}
+            else:
+                reply = [self.answer(call) for call in reversed(request) if call["method"] != "drop"]
+        else:
+            reply = self.answer(request)
+        body = json.dumps(reply).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    @staticmethod
+    def answer(call: dict) -> dict:
+        if call["method"] == "fail":
+            return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": 3, "message": "execution reverted"}}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": call["params"][0]}
+    
+    def log_message(self, *args):
+        pass
+
+class TestRPCBatchCall(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeNodeHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.client = RPCClient(f"http://127.0.0.1:{cls.server.server_port}")
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+        cls.server.shutdown()
+        cls.server.server_close()
+    
+    def test_results_in_request_order(self):
+        calls = [("echo", [i]) for i in range(5)]
+        self.assertEqual(self.client.batch_call(calls), [0, 1, 2, 3, 4])
+        self.assertEqual(self.client.batch_call([]), [])
+    
+    def test_error_in_batch_raises(self):
+        with self.assertRaisesRegex(RPCError, "execution reverted"):
+            self.client.batch_call([("echo", [1]), ("fail", [2])])
+    
+    def test_missing_reply_raises(self):
+        with self.assertRaisesRegex(RPCError, "missing reply"):
+            self.client.batch_call([("echo", [1]), ("drop", [2])])
+    
+    def test_rejected_batch_raises(self):
+        with self.assertRaisesRegex(RPCError, "batch rejected"):
+            self.client.batch_call([("echo", [1]), ("reject", [2])])
+    
+    def test_single_call(self):
+        self.assertEqual(self.client.call("echo", ["0x1"]), "0x1")
+        with self.assertRaises(RPCError):
+            self.client.call("fail", [1])
+
+class TestExtractTxHash(unittest.TestCase):
+
+    def test_claim_line_wins_over_other_transactions(self):
+        output = (f"Approval transaction: {OTHER_TX_HASH}\n"
+                  f"✅ Claim transaction submitted: {TX_HASH}\n")
+        self.assertEqual(BridgeUtils.extract_tx_hash(output), TX_HASH)
+    
+    def test_bridge_line_wins_over_approval(self):
+        output = (f"Approval transaction: {OTHER_TX_HASH}\n"
+                  f"Bridge transaction submitted: {TX_HASH}\n")
+        self.assertEqual(BridgeUtils.extract_tx_hash(output), TX_HASH)
+    
+    def test_any_transaction_line(self):
+        self.assertEqual(BridgeUtils.extract_tx_hash(f"Transaction hash: {TX_HASH}"), TX_HASH)
+    
+    def test_bytes_output(self):
+        output = f"🔧 Bridge message transaction submitted: {TX_HASH}\n".encode()
+        self.assertEqual(BridgeUtils.extract_tx_hash(output), TX_HASH)
+    
+    def test_no_hash(self):
+        self.assertIsNone(BridgeUtils.extract_tx_hash("Bridge transaction submitted"))
+        # A longer hex string isn't a transaction hash
+        self.assertIsNone(BridgeUtils.extract_tx_hash(f"Transaction: {TX_HASH}ff"))
+        self.assertIsNone(BridgeUtils.extract_tx_hash(f"Hash: {TX_HASH}"))
+
+if __name__ == "__main__":
+    unittest.main()